@@ -0,0 +1,78 @@
+"""Benchmark: live chat rendering, per-chunk rebuilds vs the render scheduler.
+
+Streams a long answer in small chunks through a Rich Live display (on an
+off-screen terminal) and times rebuilding the agent box on every chunk,
+as chat used to, against AgentBox updated in place behind a
+RenderScheduler.
+
+Usage:
+    uv run python benchmarks/bench_chat_render.py [--chunks 1500] [--chunk-size 6]
+"""
+
+import argparse
+import io
+import time
+
+from rich.console import Console
+from rich.live import Live
+
+from lyzr_kit.commands._chat import AgentBox, RenderScheduler, StreamState, build_agent_box
+
+SENTENCE = "The quick brown fox jumps over a lazy dog while tokens stream to a terminal. "
+
+
+def _chunks(count: int, size: int) -> list[str]:
+    text = SENTENCE * (count * size // len(SENTENCE) + 1)
+    return [text[i : i + size] for i in range(0, count * size, size)]
+
+
+def _console() -> Console:
+    return Console(file=io.StringIO(), force_terminal=True, width=100, height=40)
+
+
+def _per_chunk(chunks: list[str]) -> float:
+    """Stream back to back; each chunk renders a frame regardless of token rate."""
+    state = StreamState(is_streaming=True)
+    start = time.perf_counter()
+    with Live(build_agent_box(state, "12:00:00"), console=_console(), auto_refresh=False) as live:
+        for chunk in chunks:
+            state.append_content(chunk)
+            live.update(build_agent_box(state, "12:00:00"), refresh=True)
+    return time.perf_counter() - start
+
+
+def _scheduled(chunks: list[str], interval: float) -> tuple[float, str]:
+    """Stream with a pause between chunks; the pauses are not counted."""
+    state = StreamState(is_streaming=True)
+    box = AgentBox(state, "12:00:00")
+    start = time.perf_counter()
+    with Live(box.render(), console=_console(), auto_refresh=False) as live:
+        scheduler = RenderScheduler(live, box.render)
+        for chunk in chunks:
+            state.append_content(chunk)
+            scheduler.update()
+            time.sleep(interval)
+        scheduler.flush()
+    return time.perf_counter() - start - interval * len(chunks), scheduler.metrics.summary()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chunks", type=int, default=1500, help="Chunks to stream")
+    parser.add_argument("--chunk-size", type=int, default=6, help="Characters per chunk")
+    parser.add_argument(
+        "--interval", type=float, default=0.001, help="Seconds between chunks (token rate)"
+    )
+    args = parser.parse_args()
+
+    chunks = _chunks(args.chunks, args.chunk_size)
+    per_chunk = _per_chunk(chunks)
+    scheduled, summary = _scheduled(chunks, args.interval)
+
+    print(f"{args.chunks} chunks of {args.chunk_size} chars, one every {args.interval * 1000:g}ms")
+    print(f"  {'render every chunk':<20} {per_chunk:8.2f} s")
+    print(f"  {'render scheduler':<20} {scheduled:8.2f} s  ({summary})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Benchmark: agent creation against a local fake Lyzr API.
+
+Starts lyzr_kit.testing.FakeLyzrServer with a fixed per-request latency
+(and optional injected 429s) and times creating a batch of agents through
+PlatformClient one at a time versus concurrently with AsyncPlatformClient.
+
+Usage:
+    uv run python benchmarks/bench_platform_calls.py [--agents 50] [--latency 0.05]
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+from lyzr_kit.schemas.agent import Agent, ModelConfig
+from lyzr_kit.testing import FakeLyzrServer, FakeServerConfig
+from lyzr_kit.utils.platform import PlatformClient
+from lyzr_kit.utils.transport import ENV_RATE_LIMIT
+
+
+def _agents(count: int) -> list[Agent]:
+    model = ModelConfig(provider="openai", name="gpt-4o", credential_id="cred")
+    return [
+        Agent(id=f"bench-{i:04d}", name=f"Bench {i}", category="chat", model=model)
+        for i in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--agents", type=int, default=50, help="Agents to create")
+    parser.add_argument("--latency", type=float, default=0.05, help="Server latency (s)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of 429s")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent requests")
+    args = parser.parse_args()
+
+    # Measure the client, not the client-side rate limit
+    os.environ.setdefault(ENV_RATE_LIMIT, "0")
+    config = FakeServerConfig(
+        latency=args.latency, error_rate=args.error_rate, error_status=429, retry_after=0, seed=1
+    )
+    agents = _agents(args.agents)
+
+    with FakeLyzrServer(config) as server:
+        auth = server.auth_config()
+        with PlatformClient(auth, max_concurrency=args.concurrency) as client:
+            start = time.perf_counter()
+            for agent in agents:
+                client.create_agent(agent)
+            serial = time.perf_counter() - start
+
+            async def create_all() -> None:
+                await asyncio.gather(*(client.async_client.create_agent(a) for a in agents))
+
+            start = time.perf_counter()
+            client.session.run(create_all())
+            concurrent = time.perf_counter() - start
+            requests = len(server.requests)
+
+    print(f"{args.agents} agents, {args.latency * 1000:.0f}ms latency, {requests} HTTP requests")
+    print(f"  {'sequential':<24} {serial:8.2f} s")
+    print(f"  {f'concurrent (x{args.concurrency})':<24} {concurrent:8.2f} s")
+
+
+if __name__ == "__main__":
+    main()
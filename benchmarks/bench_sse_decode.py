@@ -0,0 +1,98 @@
+"""Micro-benchmark: SSE data decoding, chained str.replace vs decode-once.
+
+Times the original twelve-pass decode_sse_data (kept here as a reference,
+including its double decoding of escaped backslashes) against the current
+decoder, on token-sized chunks
+like those streamed by the inference API and on multi-KB chunks of code.
+Fails if the current decoder is slower than the original on either size.
+
+Usage:
+    uv run python benchmarks/bench_sse_decode.py [--chunks 20000]
+"""
+
+import argparse
+import random
+import time
+from collections.abc import Callable
+
+from lyzr_kit.commands._chat.streaming import decode_sse_data
+from lyzr_kit.testing.fake_server import _encode_sse
+
+# Mix of plain words, punctuation and snippets that need escaping
+TOKENS = [
+    "The", " answer", " is", " 42", ".", " Here", "'s", " how", ":", "\n", "\n\n",
+    " `", "print", '("', "hello", '")', "`", " &", " <", "div", ">", " R&D", "\t",
+    " C:\\Users", " \"quoted\"", " -", " item", " 1", ",", " and",
+]  # fmt: skip
+
+CODE = '''def fetch(url: str) -> dict:
+    """Fetch JSON from "url" & return it."""
+    if not url.startswith("https://"):
+        raise ValueError(f"bad url: {url!r}\\n")
+    return {"path": "C:\\\\data\\\\out.json", "ok": a < b and c > d}
+'''
+
+
+def _chained_decode(data: str) -> str:
+    """The original decode_sse_data."""
+    return (
+        data.replace("\\n", "\n")
+        .replace('\\"', '"')
+        .replace("\\'", "'")
+        .replace("\\&", "&")
+        .replace("\\r", "\r")
+        .replace("\\\\", "\\")
+        .replace("\\t", "\t")
+        .replace("&quot;", '"')
+        .replace("&apos;", "'")
+        .replace("&lt;", "<")
+        .replace("&gt;", ">")
+        .replace("&amp;", "&")
+    )
+
+
+def _encode(text: str) -> str:
+    """Escape text like the inference API, including HTML entities."""
+    text = text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    return _encode_sse(text).replace("\t", "\\t")
+
+
+def _time_per_chunk(func: Callable[[str], str], chunks: list[str], repeat: int) -> float:
+    """Run func over every chunk and return the best mean time per chunk in microseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for chunk in chunks:
+            func(chunk)
+        best = min(best, time.perf_counter() - start)
+    return best / len(chunks) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chunks", type=int, default=20000, help="Token-sized chunks")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per decoder (best is kept)")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    corpora = {
+        "token-sized": [_encode(rng.choice(TOKENS)) for _ in range(args.chunks)],
+        "4 KB code": [_encode(CODE * 16)] * max(1, args.chunks // 100),
+    }
+
+    slower = []
+    for label, chunks in corpora.items():
+        size = sum(map(len, chunks)) / len(chunks)
+        chained = _time_per_chunk(_chained_decode, chunks, args.repeat)
+        single = _time_per_chunk(decode_sse_data, chunks, args.repeat)
+        print(f"{label} chunks ({len(chunks)} x {size:.0f} chars)")
+        print(f"  {'chained replace':<20} {chained:8.2f} us/chunk")
+        print(f"  {'decode once':<20} {single:8.2f} us/chunk")
+        if single > chained:
+            slower.append(label)
+
+    assert not slower, f"decode_sse_data is slower than chained replace on: {', '.join(slower)}"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Micro-benchmark: per-file agent YAML load/dump, pure-Python vs libyaml.
+
+Builds a corpus of agent YAML files from the built-in collection and times
+PyYAML's SafeLoader/SafeDumper against the codec used by lyzr-kit
+(CSafeLoader/CSafeDumper when libyaml is available).
+
+Usage:
+    uv run python benchmarks/bench_yaml_codec.py [--agents 1000]
+"""
+
+import argparse
+import io
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from lyzr_kit.storage import StorageManager
+from lyzr_kit.storage.yaml_codec import HAS_LIBYAML, dump_yaml, load_yaml
+
+
+def _build_corpus(directory: Path, count: int) -> list[Path]:
+    """Write `count` agent YAML files cloned from the built-in agents."""
+    storage = StorageManager(local_path=directory, use_cache=False)
+    builtins = [agent for agent, _ in storage.list_agents(source="built-in")]
+    for i in range(count):
+        agent = builtins[i % len(builtins)].model_copy()
+        agent.id = f"bench-agent-{i:05d}"
+        agent.serial = i + 1
+        storage.save_agent(agent)
+    return sorted((directory / "agents").glob("*.yaml"))
+
+
+def _time_per_file(func: Any, items: list[Any]) -> float:
+    """Run func over every item and return the mean time per item in microseconds."""
+    start = time.perf_counter()
+    for item in items:
+        func(item)
+    return (time.perf_counter() - start) / len(items) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--agents", type=int, default=1000, help="Corpus size")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        files = _build_corpus(Path(tmp), args.agents)
+        texts = [path.read_text() for path in files]
+        docs = [yaml.safe_load(text) for text in texts]
+
+        results = {
+            "load (SafeLoader)": _time_per_file(yaml.safe_load, texts),
+            "load (codec)": _time_per_file(load_yaml, texts),
+            "dump (SafeDumper)": _time_per_file(
+                lambda d: yaml.dump(d, io.StringIO(), Dumper=yaml.SafeDumper, sort_keys=False),
+                docs,
+            ),
+            "dump (codec)": _time_per_file(lambda d: dump_yaml(d, io.StringIO()), docs),
+        }
+
+    print(f"{len(files)} agent files, libyaml available: {HAS_LIBYAML}")
+    for label, micros in results.items():
+        print(f"  {label:<20} {micros:8.1f} us/file")
+
+
+if __name__ == "__main__":
+    main()
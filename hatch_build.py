@@ -0,0 +1,35 @@
+"""Hatch build hook that ships a pre-validated snapshot of the built-in agents."""
+
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+
+class CustomBuildHook(BuildHookInterface):  # type: ignore[type-arg]
+    """Generate lyzr_kit/collection/agents.snapshot.json for wheel builds."""
+
+    _tmp_dir: str | None = None
+
+    def initialize(self, version: str, build_data: dict[str, Any]) -> None:
+        # Editable installs read the YAML files directly
+        if self.target_name != "wheel" or version == "editable":
+            return
+
+        sys.path.insert(0, str(Path(self.root) / "src"))
+        from lyzr_kit.storage.snapshot import SNAPSHOT_FILE, write_snapshot
+
+        collection_dir = Path(self.root) / "src" / "lyzr_kit" / "collection"
+        self._tmp_dir = tempfile.mkdtemp(prefix="lyzr-kit-snapshot-")
+        snapshot_path = Path(self._tmp_dir) / SNAPSHOT_FILE
+        write_snapshot(collection_dir / "agents", snapshot_path)
+
+        build_data["force_include"][str(snapshot_path)] = f"lyzr_kit/collection/{SNAPSHOT_FILE}"
+
+    def finalize(self, version: str, build_data: dict[str, Any], artifact_path: str) -> None:
+        if self._tmp_dir:
+            shutil.rmtree(self._tmp_dir, ignore_errors=True)
+            self._tmp_dir = None
@@ -2,8 +2,21 @@
 
 __version__ = "0.1.0"
 
-from lyzr_kit.schemas.agent import Agent, AgentConfig, ModelConfig
-from lyzr_kit.storage.manager import StorageManager
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from lyzr_kit.schemas.agent import Agent, AgentConfig, ModelConfig
+    from lyzr_kit.storage.manager import StorageManager
+
+# Public names resolved on first access, so importing lyzr_kit (and the CLI)
+# doesn't load Pydantic models and the storage layer up front
+_LAZY_ATTRIBUTES = {
+    "Agent": "lyzr_kit.schemas.agent",
+    "AgentConfig": "lyzr_kit.schemas.agent",
+    "ModelConfig": "lyzr_kit.schemas.agent",
+    "StorageManager": "lyzr_kit.storage.manager",
+}
 
 __all__ = [
     "__version__",
@@ -12,3 +25,10 @@ __all__ = [
     "ModelConfig",
     "StorageManager",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module), name)
@@ -3,12 +3,24 @@
 import typer
 
 from lyzr_kit.commands._console import console
-from lyzr_kit.utils.auth import AuthConfig, AuthError, load_auth, validate_auth
+from lyzr_kit.utils.auth import (
+    AuthConfig,
+    AuthError,
+    HealthCheckClient,
+    load_auth,
+    validate_auth,
+)
 
 
-def require_auth() -> AuthConfig:
+def require_auth(client: HealthCheckClient | None = None) -> AuthConfig:
     """Check authentication before running commands.
 
+    The health check is skipped while a previous success is cached
+    (see lyzr_kit.utils.auth.get_auth_cache_ttl).
+
+    Args:
+        client: Pooled client (e.g. a PlatformSession) the command reuses for its API calls.
+
     Returns:
         AuthConfig if authentication is valid.
 
@@ -17,7 +29,7 @@ def require_auth() -> AuthConfig:
     """
     try:
         auth = load_auth()
-        validate_auth(auth)
+        validate_auth(auth, use_cache=True, client=client)
         return auth
     except AuthError as e:
         console.print(f"[red]Authentication Error:[/red]\n{e}")
@@ -1,14 +1,19 @@
 """Chat module - UI, streaming, and input handling for agent chat."""
 
 from lyzr_kit.commands._chat.keybindings import create_key_bindings, create_prompt_session
+from lyzr_kit.commands._chat.render import RenderMetrics, RenderScheduler
 from lyzr_kit.commands._chat.state import StreamState
 from lyzr_kit.commands._chat.streaming import (
     STREAM_API_ENDPOINT,
+    ChatEngine,
     ChatStreamer,
+    DecodedChunk,
+    ThinkingDecoder,
     decode_sse_data,
     separate_thinking_content,
 )
 from lyzr_kit.commands._chat.ui import (
+    AgentBox,
     build_agent_box,
     build_session_box,
     build_user_box,
@@ -19,13 +24,20 @@ __all__ = [
     # State
     "StreamState",
     # UI
+    "AgentBox",
     "build_agent_box",
     "build_session_box",
     "build_user_box",
     "format_timestamp",
+    # Rendering
+    "RenderMetrics",
+    "RenderScheduler",
     # Streaming
     "STREAM_API_ENDPOINT",
+    "ChatEngine",
     "ChatStreamer",
+    "DecodedChunk",
+    "ThinkingDecoder",
     "decode_sse_data",
     "separate_thinking_content",
     # Keybindings
@@ -0,0 +1,109 @@
+"""Frame-rate-limited rendering of the live chat display."""
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from rich.console import RenderableType
+from rich.live import Live
+
+# Target frames per second for the live agent box
+DEFAULT_FPS = 20.0
+
+# Set to 1 to print per-message render metrics (frames, render time) to stderr
+ENV_CHAT_METRICS = "LK_CHAT_METRICS"
+
+
+@dataclass
+class RenderMetrics:
+    """Render counts and per-frame render times collected by a RenderScheduler."""
+
+    updates: int = 0  # State changes reported to the scheduler
+    frame_times: list[float] = field(default_factory=list)  # Seconds per drawn frame
+
+    def summary(self) -> str:
+        """Summarize frames, coalesced updates and render time percentiles."""
+        if not self.frame_times:
+            return "no frames"
+        times = sorted(self.frame_times)
+        frames = len(times)
+
+        def percentile(p: float) -> float:
+            return times[min(frames - 1, int(p * frames))] * 1000
+
+        return (
+            f"{self.updates} updates, {frames} frames "
+            f"({max(0, self.updates - frames)} coalesced), "
+            f"render p50 {percentile(0.5):.1f}ms p95 {percentile(0.95):.1f}ms "
+            f"max {times[-1] * 1000:.1f}ms, total {sum(times) * 1000:.0f}ms"
+        )
+
+
+class RenderScheduler:
+    """Coalesces updates of a Live display to a target frame rate.
+
+    Every state change is reported with update(). A frame is drawn right
+    away if the last one is at least 1/fps seconds old; otherwise the
+    change is only marked dirty and picked up by the next frame, so bursts
+    of tokens cost one render instead of one per token. Call flush() to
+    draw whatever is still pending, e.g. at the end of a response; an
+    event loop can wait up to next_frame_in() seconds for more changes
+    before flushing.
+
+    The Live should be created with auto_refresh=False, so that frames are
+    only drawn here and never while the state is being changed.
+    """
+
+    def __init__(
+        self,
+        live: Live,
+        render: Callable[[], RenderableType],
+        fps: float = DEFAULT_FPS,
+        clock: Callable[[], float] = time.perf_counter,
+        metrics: RenderMetrics | None = None,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            live: Live display to draw frames on.
+            render: Builds the renderable for the current state.
+            fps: Maximum frames per second (0 draws every update).
+            clock: Monotonic clock, in seconds.
+            metrics: Collector for render metrics.
+        """
+        self.live = live
+        self.render = render
+        self.interval = 1 / fps if fps > 0 else 0.0
+        self.metrics = metrics if metrics is not None else RenderMetrics()
+        self._clock = clock
+        self._dirty = False
+        self._last_frame: float | None = None
+
+    @property
+    def dirty(self) -> bool:
+        """Whether there are changes not drawn yet."""
+        return self._dirty
+
+    def next_frame_in(self) -> float:
+        """Seconds until another frame may be drawn (0 if one may be drawn now)."""
+        if self._last_frame is None:
+            return 0.0
+        return max(0.0, self._last_frame + self.interval - self._clock())
+
+    def update(self) -> None:
+        """Report a state change, drawing a frame if one is due."""
+        self.metrics.updates += 1
+        self._dirty = True
+        if self._last_frame is None or self._clock() - self._last_frame >= self.interval:
+            self.flush()
+
+    def flush(self) -> None:
+        """Draw a frame if there are pending changes."""
+        if not self._dirty:
+            return
+        self._dirty = False
+        start = self._clock()
+        self.live.update(self.render(), refresh=True)
+        end = self._clock()
+        self.metrics.frame_times.append(end - start)
+        self._last_frame = end
@@ -7,9 +7,12 @@ from lyzr_kit.commands._websocket import ChatEvent
 
 @dataclass
 class StreamState:
-    """State for streaming chat session."""
+    """State for streaming chat session.
+
+    Streamed content is appended as chunks and joined on first read, so a
+    long answer isn't copied on every chunk.
+    """
 
-    content: str = ""
     events: list[ChatEvent] = field(default_factory=list)
     is_streaming: bool = False
     start_time: float = 0.0
@@ -18,6 +21,24 @@ class StreamState:
     tokens_in: int = 0
     tokens_out: int = 0
     error: str | None = None
+    _content_parts: list[str] = field(default_factory=list, repr=False)
+    _event_types: set[str] = field(default_factory=set, repr=False)
+
+    @property
+    def content(self) -> str:
+        """Response text received so far."""
+        if len(self._content_parts) > 1:
+            self._content_parts[:] = ["".join(self._content_parts)]
+        return self._content_parts[0] if self._content_parts else ""
+
+    @content.setter
+    def content(self, value: str) -> None:
+        self._content_parts[:] = [value] if value else []
+
+    def append_content(self, delta: str) -> None:
+        """Append streamed response text."""
+        if delta:
+            self._content_parts.append(delta)
 
     @property
     def latency_ms(self) -> float:
@@ -36,11 +57,17 @@ class StreamState:
     def add_event(self, event: ChatEvent) -> None:
         """Add an event to the list."""
         self.events.append(event)
+        self._event_types.add(event.event_type)
+
+    def has_event(self, event_type: str) -> bool:
+        """Check whether an event of the given type was added."""
+        return event_type in self._event_types
 
     def clear(self) -> None:
         """Clear state for next message."""
-        self.content = ""
+        self._content_parts.clear()
         self.events.clear()
+        self._event_types.clear()
         self.is_streaming = False
         self.start_time = 0.0
         self.first_chunk_time = 0.0
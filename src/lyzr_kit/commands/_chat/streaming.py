@@ -1,42 +1,110 @@
 """SSE streaming and WebSocket integration for chat."""
 
 import asyncio
-import json
+import contextlib
+import os
 import re
-import threading
+import sys
 import time
+from dataclasses import dataclass, field
 from datetime import datetime
 
 import httpx
 from rich.live import Live
 
+from lyzr_kit.commands._chat.render import ENV_CHAT_METRICS, RenderMetrics, RenderScheduler
 from lyzr_kit.commands._chat.state import StreamState
-from lyzr_kit.commands._chat.ui import build_agent_box, format_timestamp
+from lyzr_kit.commands._chat.ui import AgentBox, format_timestamp
 from lyzr_kit.commands._console import console
-from lyzr_kit.commands._websocket import WEBSOCKET_BASE_URL, ChatEvent, parse_event
+from lyzr_kit.commands._websocket import CONNECT_TIMEOUT, ChatEvent, WebSocketClient
 from lyzr_kit.schemas.agent import Agent
-from lyzr_kit.utils.auth import AuthConfig
-
-# Chat API endpoints
-STREAM_API_ENDPOINT = "https://agent-prod.studio.lyzr.ai/v3/inference/stream/"
+from lyzr_kit.utils.auth import API_BASE_URL, STREAM_PATH, AuthConfig, invalidate_auth_cache
+from lyzr_kit.utils.platform import PlatformSession
+
+# Default chat API endpoint (AuthConfig.stream_url overrides it)
+STREAM_API_ENDPOINT = f"{API_BASE_URL}{STREAM_PATH}"
+
+# Backslash escapes and HTML entities used in SSE data, and their decoded text
+SSE_ESCAPES = {
+    "\\n": "\n",
+    '\\"': '"',
+    "\\'": "'",
+    "\\&": "&",
+    "\\r": "\r",
+    "\\\\": "\\",
+    "\\t": "\t",
+    "&quot;": '"',
+    "&apos;": "'",
+    "&lt;": "<",
+    "&gt;": ">",
+    "&amp;": "&",
+}
+# Matches any key of SSE_ESCAPES; the group makes re.split keep the escapes
+_SSE_RE = re.compile("(" + "|".join(map(re.escape, SSE_ESCAPES)) + ")")
+
+# Stand-ins for an escaped backslash and "\\&" while the other escapes are
+# replaced, so no escape can start inside the text they decode to
+_BACKSLASH_SENTINEL = "\x00"
+_AMPERSAND_SENTINEL = "\x01"
+# Backslash escapes other than the escaped backslash, in SSE_ESCAPES order
+_BACKSLASH_ESCAPES = [
+    (escape, _AMPERSAND_SENTINEL if escape == "\\&" else text)
+    for escape, text in SSE_ESCAPES.items()
+    if escape.startswith("\\") and escape != "\\\\"
+]
+# HTML entities, "&amp;" last so the "&" it produces is never decoded again
+_ENTITIES = [item for item in SSE_ESCAPES.items() if item[0].startswith("&")]
+
+
+def _decode_entities(data: str) -> str:
+    """Decode the HTML entities in data."""
+    for entity, text in _ENTITIES:
+        if entity in data:
+            data = data.replace(entity, text)
+    return data
+
+
+def _scan_sse_data(data: str) -> str:
+    """Decode SSE data with one regex scan (for data containing a sentinel)."""
+    parts = _SSE_RE.split(data)
+    parts[1::2] = map(SSE_ESCAPES.__getitem__, parts[1::2])
+    return "".join(parts)
 
 
 def decode_sse_data(data: str) -> str:
-    """Decode escape sequences from SSE data."""
-    return (
-        data.replace("\\n", "\n")
-        .replace('\\"', '"')
-        .replace("\\'", "'")
-        .replace("\\&", "&")
-        .replace("\\r", "\r")
-        .replace("\\\\", "\\")
-        .replace("\\t", "\t")
-        .replace("&quot;", '"')
-        .replace("&apos;", "'")
-        .replace("&lt;", "<")
-        .replace("&gt;", ">")
-        .replace("&amp;", "&")
-    )
+    """Decode escape sequences from SSE data.
+
+    Every escape is decoded once, left to right, so text produced by one
+    escape is never decoded again: an escaped backslash followed by n stays
+    a backslash and an n, and "\\&amp;" becomes "&amp;".
+
+    Escaped backslashes and "\\&" are first swapped for control characters,
+    after which every remaining backslash starts exactly one escape, so the
+    other escapes can be replaced with str.replace in any order. The loop
+    stops as soon as no backslash is left, skipping searches for escapes
+    that aren't there. Data that already contains a sentinel character is
+    decoded by _scan_sse_data instead.
+    """
+    # Most streamed tokens have no backslash escapes, and many no entities either
+    if "\\" not in data:
+        return _decode_entities(data) if "&" in data else data
+    if _BACKSLASH_SENTINEL in data or _AMPERSAND_SENTINEL in data:
+        return _scan_sse_data(data)
+
+    escaped_backslash = "\\\\" in data
+    if escaped_backslash:
+        data = data.replace("\\\\", _BACKSLASH_SENTINEL)
+    for escape, text in _BACKSLASH_ESCAPES:
+        if "\\" not in data:
+            break
+        data = data.replace(escape, text)
+    if "&" in data:
+        data = _decode_entities(data)
+    if _AMPERSAND_SENTINEL in data:
+        data = data.replace(_AMPERSAND_SENTINEL, "&")
+    if escaped_backslash:
+        data = data.replace(_BACKSLASH_SENTINEL, "\\")
+    return data
 
 
 def separate_thinking_content(content: str) -> tuple[str | None, str]:
@@ -49,29 +117,202 @@ def separate_thinking_content(content: str) -> tuple[str | None, str]:
     return None, content
 
 
-class ChatStreamer:
-    """Handles SSE streaming with WebSocket event integration."""
-
-    def __init__(self, auth: AuthConfig, agent: Agent, session_id: str):
-        """Initialize the chat streamer.
+THINK_OPEN = "<think>"
+THINK_CLOSE = "</think>"
+
+
+@dataclass
+class DecodedChunk:
+    """Text decoded from one chunk by ThinkingDecoder."""
+
+    content: str = ""  # Response text to append
+    thinking: str = ""  # Text inside <think> tags to append
+    blocks: list[str] = field(default_factory=list)  # <think> blocks that closed, stripped
+
+
+class ThinkingDecoder:
+    """Streaming splitter of response text and <think> blocks.
+
+    The incremental counterpart of separate_thinking_content: it keeps
+    whether it is inside a <think> block and holds back any chunk tail that
+    could be the start of a tag split across chunks, so each chunk is
+    scanned once and the cost per chunk doesn't grow with the answer.
+
+    Whitespace right after a closing tag is dropped, like the strip() in
+    separate_thinking_content. A block still open when the stream ends is
+    returned as content by finish().
+    """
+
+    def __init__(self) -> None:
+        """Initialize a decoder at the start of a response."""
+        self.in_think = False
+        self._pending = ""  # Possible partial tag held back from the last chunk
+        self._block: list[str] = []  # Text of the open <think> block
+        self._strip_content = False
+
+    def feed(self, chunk: str) -> DecodedChunk:
+        """Decode the next chunk of response text."""
+        result = DecodedChunk()
+        text = self._pending + chunk
+        self._pending = ""
+        while text:
+            tag = THINK_CLOSE if self.in_think else THINK_OPEN
+            index = text.find(tag)
+            if index >= 0:
+                self._emit(text[:index], result)
+                text = text[index + len(tag) :]
+                if self.in_think:
+                    result.blocks.append("".join(self._block).strip())
+                    self._block.clear()
+                    self._strip_content = True
+                self.in_think = not self.in_think
+                continue
+
+            # Hold back a tail that may be the start of the tag
+            keep = _partial_tag_length(text, tag)
+            self._emit(text[: len(text) - keep], result)
+            self._pending = text[len(text) - keep :]
+            break
+        return result
+
+    def finish(self) -> DecodedChunk:
+        """Flush held-back text at the end of the stream."""
+        result = DecodedChunk()
+        if self.in_think:
+            # Never closed - show it as the model sent it
+            self._strip_content = False
+            self._emit(THINK_OPEN + "".join(self._block) + self._pending, result, as_content=True)
+            self._block.clear()
+            self.in_think = False
+        else:
+            self._emit(self._pending, result)
+        self._pending = ""
+        return result
+
+    def _emit(self, text: str, result: DecodedChunk, as_content: bool = False) -> None:
+        if not text:
+            return
+        if self.in_think and not as_content:
+            self._block.append(text)
+            result.thinking += text
+            return
+        if self._strip_content:
+            text = text.lstrip()
+            if not text:
+                return
+            self._strip_content = False
+        result.content += text
+
+
+def _partial_tag_length(text: str, tag: str) -> int:
+    """Length of the longest suffix of text that is a proper prefix of tag."""
+    for length in range(min(len(tag) - 1, len(text)), 0, -1):
+        if text.endswith(tag[:length]):
+            return length
+    return 0
+
+
+# Seconds to wait for the complete inference response
+STREAM_TIMEOUT = 120.0
+
+
+@dataclass
+class _StreamEnd:
+    """Queued by the SSE reader when the response is over."""
+
+    error: str | None = None
+
+
+# What the SSE reader and the WebSocket feed into a message's queue
+_StreamItem = DecodedChunk | ChatEvent | _StreamEnd
+
+
+class ChatEngine:
+    """Streams chat messages on an asyncio event loop.
+
+    Each message is POSTed with httpx.AsyncClient.stream. One task reads
+    the SSE response while the session's WebSocketClient passes events in
+    as they arrive; both feed a single asyncio.Queue, and one loop takes
+    from it, updates the StreamState and draws frames through a
+    RenderScheduler. The queue is only waited on until the next frame is
+    due, so tool events and coalesced text appear on time even while the
+    SSE stream is silent.
+    """
+
+    def __init__(
+        self,
+        auth: AuthConfig,
+        agent: Agent,
+        session_id: str,
+        client: httpx.AsyncClient,
+        events: WebSocketClient | None = None,
+        state: StreamState | None = None,
+    ):
+        """Initialize the engine.
 
         Args:
             auth: Authentication config.
             agent: Agent to chat with.
             session_id: Chat session ID.
+            client: Async HTTP client for the inference API.
+            events: Started WebSocket client for the session's events, if any.
+            state: Stream state to update (a new one by default).
         """
         self.auth = auth
         self.agent = agent
         self.session_id = session_id
-        self.state = StreamState()
+        self.client = client
+        self.events = events
+        self.state = state if state is not None else StreamState()
+        self.render_metrics = RenderMetrics()
+        self.turns = 0  # Messages streamed in this session
 
-    def stream_message(self, message: str, user_timestamp: str | None = None) -> None:
+    async def stream_message(self, message: str, user_timestamp: str | None = None) -> None:
         """Stream message from inference API with live display and WebSocket events.
 
         Args:
             message: User message to send.
             user_timestamp: Timestamp when user submitted the message.
         """
+        # Clear state for new message
+        self.state.clear()
+        self.render_metrics = RenderMetrics()
+        self.state.is_streaming = True
+        self.state.start_time = time.time()
+
+        # Use provided timestamp or generate new one
+        timestamp = user_timestamp or format_timestamp()
+
+        queue: asyncio.Queue[_StreamItem] = asyncio.Queue()
+        if self.events is not None:
+            if self.turns == 0:
+                # Let the first message's events reach a socket that is still connecting
+                await asyncio.to_thread(self.events.wait_connected, CONNECT_TIMEOUT)
+            # Events arriving from now on belong to this message
+            loop = asyncio.get_running_loop()
+
+            def deliver(event: ChatEvent) -> None:
+                loop.call_soon_threadsafe(queue.put_nowait, event)
+
+            self.events.begin_turn(deliver)
+        self.turns += 1
+
+        reader = asyncio.create_task(self._read_sse(message, queue))
+        try:
+            await self._render(queue, timestamp)
+        finally:
+            if self.events is not None:
+                self.events.end_turn()
+            reader.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await reader
+
+        if os.getenv(ENV_CHAT_METRICS):
+            print(f"[lk chat] {self.render_metrics.summary()}", file=sys.stderr)
+        console.print()
+
+    async def _read_sse(self, message: str, queue: asyncio.Queue[_StreamItem]) -> None:
+        """POST the message and queue decoded SSE chunks, then the end of stream."""
         headers = {
             "Content-Type": "application/json",
             "accept": "application/json",
@@ -85,138 +326,181 @@ class ChatStreamer:
             "message": message,
         }
 
-        # Clear state for new message
-        self.state.clear()
-        self.state.is_streaming = True
-        self.state.start_time = time.time()
-
-        # Use provided timestamp or generate new one
-        timestamp = user_timestamp or format_timestamp()
-        buffer = ""
-
-        # WebSocket event handling
-        ws_events: list[ChatEvent] = []
-        ws_stop_event = threading.Event()
-
-        def receive_ws_events() -> None:
-            """Receive events from WebSocket in a daemon thread."""
-            try:
-                import websockets
-
-                async def _ws_loop() -> None:
-                    try:
-                        url = f"{WEBSOCKET_BASE_URL}/ws/{self.session_id}?x-api-key={self.auth.api_key}"
-                        async with websockets.connect(url, close_timeout=2) as ws:
-                            while not ws_stop_event.is_set():
-                                try:
-                                    msg = await asyncio.wait_for(ws.recv(), timeout=0.5)
-                                    data = json.loads(msg)
-                                    event = parse_event(data)
-                                    if event:
-                                        ws_events.append(event)
-                                except asyncio.TimeoutError:
-                                    continue
-                                except Exception:
-                                    break
-                    except Exception:
-                        pass
-
-                asyncio.run(_ws_loop())
-            except Exception:
-                # WebSocket is optional - continue without it
-                pass
-
-        # Start WebSocket in daemon thread
-        ws_thread = threading.Thread(target=receive_ws_events, daemon=True)
-        ws_thread.start()
-
+        decoder = ThinkingDecoder()
+        error = None
         try:
-            with httpx.stream(
+            async with self.client.stream(
                 "POST",
-                STREAM_API_ENDPOINT,
+                self.auth.stream_url,
                 json=payload,
                 headers=headers,
-                timeout=120.0,
+                timeout=STREAM_TIMEOUT,
             ) as response:
                 if response.status_code != 200:
-                    self.state.error = f"API returned status {response.status_code}"
-                    self.state.is_streaming = False
-                    self.state.end_time = time.time()
-                    console.print(build_agent_box(self.state, timestamp))
+                    if response.status_code in (401, 403):
+                        invalidate_auth_cache(self.auth)
+                    error = f"API returned status {response.status_code}"
                     return
 
-                with Live(
-                    build_agent_box(self.state, timestamp), console=console, refresh_per_second=10
-                ) as live:
-                    for line in response.iter_lines():
-                        # Merge WebSocket events
-                        while ws_events:
-                            event = ws_events.pop(0)
-                            self.state.add_event(event)
-                            live.update(build_agent_box(self.state, timestamp))
-
-                        if not line:
-                            continue
-
-                        if line.startswith("data: "):
-                            data = line[6:]
-
-                            if data == "[DONE]":
-                                break
-
-                            if data.startswith("[ERROR]"):
-                                self.state.error = data[7:].strip()
-                                break
-
-                            decoded_data = decode_sse_data(data)
-                            if not decoded_data:
-                                continue
-
-                            # Mark first chunk time
-                            if self.state.first_chunk_time == 0:
-                                self.state.first_chunk_time = time.time()
-
-                            buffer += decoded_data
-                            thinking, content = separate_thinking_content(buffer)
-
-                            # If we have thinking content, add it as an event
-                            if thinking and not any(
-                                e.event_type == "thinking" for e in self.state.events
-                            ):
-                                self.state.add_event(
-                                    ChatEvent(
-                                        event_type="thinking",
-                                        timestamp=datetime.now(),
-                                        message=thinking[:100] + "..."
-                                        if len(thinking) > 100
-                                        else thinking,
-                                    )
-                                )
-
-                            self.state.content = content
-                            live.update(build_agent_box(self.state, timestamp))
-
-                    # Drain remaining WebSocket events
-                    while ws_events:
-                        event = ws_events.pop(0)
-                        self.state.add_event(event)
-
-                    self.state.is_streaming = False
-                    self.state.end_time = time.time()
-                    live.update(build_agent_box(self.state, timestamp))
+                async for line in response.aiter_lines():
+                    if not line.startswith("data: "):
+                        continue
+                    data = line[6:]
+
+                    if data == "[DONE]":
+                        break
+
+                    if data.startswith("[ERROR]"):
+                        error = data[7:].strip()
+                        break
+
+                    decoded_data = decode_sse_data(data)
+                    if not decoded_data:
+                        continue
+
+                    # Mark first chunk time
+                    if self.state.first_chunk_time == 0:
+                        self.state.first_chunk_time = time.time()
+
+                    chunk = decoder.feed(decoded_data)
+                    if chunk.content or chunk.blocks:
+                        queue.put_nowait(chunk)
+
+                queue.put_nowait(decoder.finish())
 
         except httpx.TimeoutException:
-            self.state.error = "Request timed out. The agent may be processing a complex query."
-            self.state.is_streaming = False
-            self.state.end_time = time.time()
+            error = "Request timed out. The agent may be processing a complex query."
         except Exception as e:
-            self.state.error = str(e)
+            error = str(e)
+        finally:
+            queue.put_nowait(_StreamEnd(error))
+
+    async def _render(self, queue: asyncio.Queue[_StreamItem], timestamp: str) -> None:
+        """Apply queued chunks and events to the state and draw them until the stream ends."""
+        box = AgentBox(self.state, timestamp)
+        # Frames are only drawn by the scheduler, between state changes
+        with Live(box.render(), console=console, auto_refresh=False) as live:
+            scheduler = RenderScheduler(live, box.render, metrics=self.render_metrics)
+            while True:
+                # Wait for more input, but no longer than the next frame is due
+                timeout = None
+                if scheduler.dirty:
+                    timeout = scheduler.next_frame_in()
+                    if timeout <= 0:
+                        scheduler.flush()
+                        timeout = None
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    scheduler.flush()
+                    continue
+
+                if isinstance(item, _StreamEnd):
+                    self.state.error = item.error
+                    break
+                if isinstance(item, ChatEvent):
+                    self.state.add_event(item)
+                else:
+                    self._apply(item)
+                scheduler.update()
+
+            # Events that arrived with the end of the stream
+            while not queue.empty():
+                item = queue.get_nowait()
+                if isinstance(item, ChatEvent):
+                    self.state.add_event(item)
+
             self.state.is_streaming = False
             self.state.end_time = time.time()
+            scheduler.update()
+            scheduler.flush()
+
+    def _apply(self, decoded: DecodedChunk) -> None:
+        """Add a decoded chunk to the stream state."""
+        # The first finished <think> block becomes a thinking event
+        thinking = next((block for block in decoded.blocks if block), None)
+        if thinking and not self.state.has_event("thinking"):
+            self.state.add_event(
+                ChatEvent(
+                    event_type="thinking",
+                    timestamp=datetime.now(),
+                    message=thinking[:100] + "..." if len(thinking) > 100 else thinking,
+                )
+            )
+        self.state.append_content(decoded.content)
+
+
+class ChatStreamer:
+    """Blocking chat session over ChatEngine.
+
+    The engine runs on a PlatformSession event-loop thread, so every
+    message of the session reuses its pooled keep-alive HTTP connection,
+    and the session's WebSocketClient keeps one events connection open on
+    the same loop. Both are started by open() or the first message; call
+    close() when the session ends, or use the streamer as a context
+    manager.
+    """
+
+    def __init__(self, auth: AuthConfig, agent: Agent, session_id: str):
+        """Initialize the chat streamer.
+
+        Args:
+            auth: Authentication config.
+            agent: Agent to chat with.
+            session_id: Chat session ID.
+        """
+        self.auth = auth
+        self.agent = agent
+        self.session_id = session_id
+        self.state = StreamState()
+        self.events = WebSocketClient(session_id, auth.api_key, base_url=auth.websocket_url)
+        self.engine: ChatEngine | None = None
+        self._session: PlatformSession | None = None
+
+    def __enter__(self) -> "ChatStreamer":
+        self.open()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    @property
+    def render_metrics(self) -> RenderMetrics:
+        """Render metrics of the last message."""
+        return self.engine.render_metrics if self.engine else RenderMetrics()
+
+    def open(self) -> None:
+        """Start the event loop and the events WebSocket (no-op if already open)."""
+        if self._session is not None:
+            return
+        self._session = PlatformSession()
+        self.engine = ChatEngine(
+            self.auth,
+            self.agent,
+            self.session_id,
+            self._session.client,
+            events=self.events,
+            state=self.state,
+        )
+        self._session.run(self.events.start())
+
+    def close(self) -> None:
+        """Close the events WebSocket, the HTTP client and the event loop."""
+        session, self._session = self._session, None
+        if session is None:
+            return
+        try:
+            session.run(self.events.stop())
         finally:
-            # Signal WebSocket thread to stop
-            ws_stop_event.set()
-            # Give the thread a moment to clean up
-            ws_thread.join(timeout=0.5)
+            session.close()
 
-        console.print()
+    def stream_message(self, message: str, user_timestamp: str | None = None) -> None:
+        """Stream message from inference API with live display and WebSocket events.
+
+        Args:
+            message: User message to send.
+            user_timestamp: Timestamp when user submitted the message.
+        """
+        self.open()
+        assert self._session is not None and self.engine is not None
+        self._session.run(self.engine.stream_message(message, user_timestamp))
@@ -67,74 +67,139 @@ def build_agent_box(state: StreamState, timestamp: str) -> Panel:
     - Bottom-left: Latency
     - Bottom-right: Token usage
     """
-    content_parts = []
-
-    # Events section (if any)
-    if state.events:
-        events_text = Text()
-        for i, event in enumerate(state.events):
-            prefix = "└─" if i == len(state.events) - 1 and not state.content else "├─"
-            events_text.append(f"{prefix} ", style="dim")
-            events_text.append(event.format_display(), style="dim cyan")
-            if i < len(state.events) - 1 or state.content:
-                events_text.append("\n")
-        content_parts.append(events_text)
-
-    # Response content
-    if state.content:
-        response_text = Text()
-        if state.events:
-            response_text.append("\n\n")
-        response_text.append(state.content)
-        content_parts.append(response_text)
-    elif state.is_streaming and not state.events:
-        content_parts.append(Text("Waiting for response...", style="dim italic"))
-
-    # Error display (inside content area)
-    if state.error:
-        error_text = Text()
-        if content_parts:
-            error_text.append("\n\n")
-        error_text.append(f"Error: {state.error}", style="bold red")
-        content_parts.append(error_text)
-
-    # Combine all parts
-    combined: Group | Text = Group(*content_parts) if content_parts else Text("...", style="dim")
-
-    # Determine border style based on error state
-    is_error_only = state.error and not state.content
-    border_style = "red" if is_error_only else "green"
-    title_label = "Error" if is_error_only else "Agent"
-    title_style = "red" if is_error_only else "green"
-
-    # Build title: "Agent" on left, timestamp on right
-    title = f"[{title_style}]{title_label}[/{title_style}] [dim]{timestamp}[/dim]"
-
-    # Build subtitle with metrics (bottom edge) - only after streaming completes
-    if not state.is_streaming and (state.content or state.error):
-        # Format latency
-        if state.total_time_ms > 0:
-            latency_sec = state.total_time_ms / 1000
-            latency_str = f"[bold]{latency_sec:.2f}s[/bold]"
-        else:
-            latency_str = "[dim]-[/dim]"
+    return AgentBox(state, timestamp).render()
 
-        # Format token usage
-        if state.tokens_in > 0 or state.tokens_out > 0:
-            tokens_str = f"[dim]{state.tokens_in} → {state.tokens_out} tokens[/dim]"
-            subtitle = f"{latency_str}                                        {tokens_str}"
-        else:
-            subtitle = latency_str
-    else:
-        subtitle = None
 
-    return Panel(
-        combined,
-        title=title,
-        title_align="left",
-        subtitle=subtitle,
-        subtitle_align="left",
-        border_style=border_style,
-        box=ROUNDED,
-        padding=(0, 1),
-    )
+class AgentBox:
+    """Agent response box that is updated in place while streaming.
+
+    The response Text is kept between renders and only newly streamed text
+    is appended to it. The Panel around it is rebuilt only when something
+    else in the box changes (events, error, streaming status, metrics), so
+    a render while tokens stream in costs the size of the new text rather
+    than of the whole answer.
+    """
+
+    def __init__(self, state: StreamState, timestamp: str) -> None:
+        """Initialize the box.
+
+        Args:
+            state: Stream state to display (read on every render).
+            timestamp: Timestamp shown in the title.
+        """
+        self.state = state
+        self.timestamp = timestamp
+        self._panel: Panel | None = None
+        self._layout: tuple[object, ...] | None = None
+        self._response: Text | None = None
+        self._content = ""  # Content already in _response
+        self._separated = False  # Whether _response starts with the events separator
+
+    def render(self) -> Panel:
+        """Get the box for the current state."""
+        state = self.state
+        content = state.content
+        layout = (
+            len(state.events),
+            bool(content),
+            state.is_streaming,
+            state.error,
+            state.tokens_in,
+            state.tokens_out,
+            state.total_time_ms,
+        )
+        self._update_response(content)
+        if self._panel is None or layout != self._layout:
+            self._panel = self._build_panel(content)
+            self._layout = layout
+        return self._panel
+
+    def _update_response(self, content: str) -> None:
+        """Bring the cached response Text up to date with the content."""
+        separated = bool(self.state.events)
+        if (
+            self._response is None
+            or separated != self._separated
+            or not content.startswith(self._content)
+        ):
+            # First render, or the text before the content changed: start over
+            self._response = Text("\n\n" if separated else "")
+            self._separated = separated
+            self._content = ""
+            # Any panel holding the old Text is stale
+            self._panel = None
+        if len(content) > len(self._content):
+            self._response.append(content[len(self._content) :])
+            self._content = content
+
+    def _build_panel(self, content: str) -> Panel:
+        state = self.state
+        content_parts: list[Text] = []
+
+        # Events section (if any)
+        if state.events:
+            events_text = Text()
+            for i, event in enumerate(state.events):
+                prefix = "└─" if i == len(state.events) - 1 and not content else "├─"
+                events_text.append(f"{prefix} ", style="dim")
+                events_text.append(event.format_display(), style="dim cyan")
+                if i < len(state.events) - 1 or content:
+                    events_text.append("\n")
+            content_parts.append(events_text)
+
+        # Response content
+        if content and self._response is not None:
+            content_parts.append(self._response)
+        elif state.is_streaming and not state.events:
+            content_parts.append(Text("Waiting for response...", style="dim italic"))
+
+        # Error display (inside content area)
+        if state.error:
+            error_text = Text()
+            if content_parts:
+                error_text.append("\n\n")
+            error_text.append(f"Error: {state.error}", style="bold red")
+            content_parts.append(error_text)
+
+        # Combine all parts
+        combined: Group | Text = (
+            Group(*content_parts) if content_parts else Text("...", style="dim")
+        )
+
+        # Determine border style based on error state
+        is_error_only = state.error and not content
+        border_style = "red" if is_error_only else "green"
+        title_label = "Error" if is_error_only else "Agent"
+        title_style = "red" if is_error_only else "green"
+
+        # Build title: "Agent" on left, timestamp on right
+        title = f"[{title_style}]{title_label}[/{title_style}] [dim]{self.timestamp}[/dim]"
+
+        # Build subtitle with metrics (bottom edge) - only after streaming completes
+        if not state.is_streaming and (content or state.error):
+            # Format latency
+            if state.total_time_ms > 0:
+                latency_sec = state.total_time_ms / 1000
+                latency_str = f"[bold]{latency_sec:.2f}s[/bold]"
+            else:
+                latency_str = "[dim]-[/dim]"
+
+            # Format token usage
+            if state.tokens_in > 0 or state.tokens_out > 0:
+                tokens_str = f"[dim]{state.tokens_in} → {state.tokens_out} tokens[/dim]"
+                subtitle = f"{latency_str}                                        {tokens_str}"
+            else:
+                subtitle = latency_str
+        else:
+            subtitle = None
+
+        return Panel(
+            combined,
+            title=title,
+            title_align="left",
+            subtitle=subtitle,
+            subtitle_align="left",
+            border_style=border_style,
+            box=ROUNDED,
+            padding=(0, 1),
+        )
@@ -24,7 +24,7 @@ def resolve_builtin_agent_id(identifier: str, storage: StorageManager) -> str |
     # Try as serial number first
     try:
         serial = int(identifier)
-        agent = get_builtin_agent_by_serial(serial)
+        agent = get_builtin_agent_by_serial(serial, storage)
         if agent:
             return agent.id
         console.print(f"[red]Error: Built-in agent #{serial} not found.[/red]")
@@ -52,7 +52,7 @@ def resolve_local_agent_id(identifier: str, storage: StorageManager) -> str | No
     # Try as serial number first
     try:
         serial = int(identifier)
-        agent = get_local_agent_by_serial(serial)
+        agent = get_local_agent_by_serial(serial, storage)
         if agent:
             return agent.id
         console.print(f"[red]Error: Local agent #{serial} not found.[/red]")
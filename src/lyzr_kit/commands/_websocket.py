@@ -3,20 +3,32 @@
 import asyncio
 import contextlib
 import json
+import threading
 from collections.abc import Callable
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 import websockets
 from websockets.exceptions import ConnectionClosed, WebSocketException
 
-# WebSocket endpoint for metrics/events
-WEBSOCKET_BASE_URL = "wss://metrics.studio.lyzr.ai"
+# Default WebSocket endpoint for metrics/events (AuthConfig.websocket_url overrides it)
+from lyzr_kit.utils.auth import WEBSOCKET_BASE_URL
+from lyzr_kit.utils.transport import backoff_delay
 
 # Event types to ignore (noise)
 IGNORED_EVENTS = {"keepalive", "ping", "pong"}
 
+# Reconnect backoff after the connection drops or fails (seconds, full jitter)
+RECONNECT_BASE = 0.25
+RECONNECT_MAX = 5.0
+
+# How long the first chat turn waits for the connection
+CONNECT_TIMEOUT = 2.0
+
+# Events stamped this long before a turn began belong to an earlier turn
+TURN_CLOCK_SKEW = timedelta(seconds=2)
+
 
 @dataclass
 class ChatEvent:
@@ -168,10 +180,14 @@ class EventState:
         self.events.append(event)
         return True
 
-    def clear(self) -> None:
-        """Clear all events."""
+    def clear_events(self) -> None:
+        """Forget received events and their hashes, keeping the connection status."""
         self.events.clear()
         self._seen_hashes.clear()
+
+    def clear(self) -> None:
+        """Clear all events."""
+        self.clear_events()
         self.error = None
 
 
@@ -241,26 +257,37 @@ def parse_event(data: dict[str, Any], debug: bool = False) -> ChatEvent | None:
     )
 
 
+def build_websocket_url(base_url: str, session_id: str, api_key: str) -> str:
+    """Build the events WebSocket URL for a chat session."""
+    return f"{base_url.rstrip('/')}/ws/{session_id}?x-api-key={api_key}"
+
+
 async def connect_websocket(
     session_id: str,
     api_key: str,
     state: EventState,
     on_event: Callable[[ChatEvent], None] | None = None,
+    base_url: str = WEBSOCKET_BASE_URL,
+    on_connect: Callable[[], None] | None = None,
 ) -> None:
-    """Connect to WebSocket and stream events.
+    """Connect to WebSocket and stream events until the connection closes.
 
     Args:
         session_id: Chat session ID
         api_key: API key for authentication
         state: EventState to update with events
         on_event: Optional callback for each new event
+        base_url: WebSocket server URL (ws:// or wss://)
+        on_connect: Optional callback once the connection is open
     """
-    url = f"{WEBSOCKET_BASE_URL}/ws/{session_id}?x-api-key={api_key}"
+    url = build_websocket_url(base_url, session_id, api_key)
 
     try:
         async with websockets.connect(url, close_timeout=5) as ws:
             state.is_connected = True
             state.error = None
+            if on_connect:
+                on_connect()
 
             async for message in ws:
                 try:
@@ -279,17 +306,41 @@ async def connect_websocket(
     except Exception as e:
         state.is_connected = False
         state.error = str(e)
+    finally:
+        state.is_connected = False
 
 
 class WebSocketClient:
-    """Manages WebSocket connection for chat events."""
+    """Manages the WebSocket connection for a chat session's events.
+
+    One connection is kept for the whole session and re-established with
+    exponential backoff whenever it drops, until stopped. start()/stop()
+    run it as a task on the caller's event loop.
 
-    def __init__(self, session_id: str, api_key: str):
+    Events are routed to turns by arrival order: between begin_turn() and
+    end_turn() each event is passed to the turn's sink as it arrives.
+    Events stamped well before the turn began (late ones from an earlier
+    turn) are dropped.
+    """
+
+    def __init__(
+        self,
+        session_id: str,
+        api_key: str,
+        base_url: str = WEBSOCKET_BASE_URL,
+        reconnect: bool = True,
+    ):
         self.session_id = session_id
         self.api_key = api_key
+        self.base_url = base_url
+        self.reconnect = reconnect
         self.state = EventState()
+        self.connections = 0  # Successful connects, including reconnects
         self._task: asyncio.Task[None] | None = None
         self._on_event: Callable[[ChatEvent], None] | None = None
+        self._sink: Callable[[ChatEvent], None] | None = None
+        self._turn_started: datetime | None = None
+        self._connected = threading.Event()
 
     def set_event_callback(self, callback: Callable[[ChatEvent], None]) -> None:
         """Set callback to be called for each new event."""
@@ -297,9 +348,7 @@ class WebSocketClient:
 
     async def start(self) -> None:
         """Start WebSocket connection in background."""
-        self._task = asyncio.create_task(
-            connect_websocket(self.session_id, self.api_key, self.state, self._on_event)
-        )
+        self._task = asyncio.create_task(self._run())
 
     async def stop(self) -> None:
         """Stop WebSocket connection."""
@@ -309,9 +358,31 @@ class WebSocketClient:
                 await self._task
             self._task = None
         self.state.is_connected = False
+        self._connected.clear()
+
+    def wait_connected(self, timeout: float) -> bool:
+        """Wait until the connection is open. Returns False on timeout."""
+        return self._connected.wait(timeout)
+
+    def begin_turn(self, sink: Callable[[ChatEvent], None] | None = None) -> None:
+        """Start routing events to a new turn (call before sending the message).
+
+        Args:
+            sink: Called with each of the turn's events as it arrives, on
+                the event loop the connection runs on.
+        """
+        self._sink = sink
+        self._turn_started = datetime.now(timezone.utc)
+        # Only this turn's events are kept, so a session-long connection
+        # doesn't grow the event list and dedup set without bound
+        self.state.clear_events()
+
+    def end_turn(self) -> None:
+        """Stop passing events to the current turn's sink."""
+        self._sink = None
 
     def get_events(self) -> list[ChatEvent]:
-        """Get all received events."""
+        """Get the events received since the current turn began."""
         return self.state.events.copy()
 
     def clear_events(self) -> None:
@@ -327,3 +398,38 @@ class WebSocketClient:
     def error(self) -> str | None:
         """Get last error message."""
         return self.state.error
+
+    async def _run(self) -> None:
+        """Keep a connection open, reconnecting with backoff until cancelled."""
+        attempt = 0
+        while True:
+            connections = self.connections
+            await connect_websocket(
+                self.session_id,
+                self.api_key,
+                self.state,
+                self._receive,
+                self.base_url,
+                on_connect=self._on_connect,
+            )
+            self._connected.clear()
+            if not self.reconnect:
+                return
+            # Back off harder only while connecting keeps failing
+            attempt = 0 if self.connections > connections else attempt + 1
+            await asyncio.sleep(backoff_delay(attempt, base=RECONNECT_BASE, cap=RECONNECT_MAX))
+
+    def _on_connect(self) -> None:
+        self.connections += 1
+        self._connected.set()
+
+    def _receive(self, event: ChatEvent) -> None:
+        """Route an event to the current turn."""
+        started = self._turn_started
+        stamp = event.timestamp
+        if started and stamp.tzinfo is not None and stamp < started - TURN_CLOCK_SKEW:
+            return
+        if self._sink:
+            self._sink(event)
+        if self._on_event:
+            self._on_event(event)
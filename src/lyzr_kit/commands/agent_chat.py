@@ -96,34 +96,40 @@ def chat_with_agent(identifier: str) -> None:
     console.print(build_session_box(agent, session_id, session_time))
     console.print("[dim]Type your message and press Enter. Use /exit to end.[/dim]\n")
 
+    # One event WebSocket for the whole session, connected while the user types
+    streamer.open()
+
     # Create prompt session with custom key bindings
     prompt_session = create_prompt_session()
 
     # Chat loop
-    while True:
-        try:
-            # Get user input with full readline support
-            user_input = prompt_session.prompt([("class:prompt", "> ")])
+    try:
+        while True:
+            try:
+                # Get user input with full readline support
+                user_input = prompt_session.prompt([("class:prompt", "> ")])
+
+                # Record timestamp immediately on submit
+                timestamp = format_timestamp()
+
+                if user_input.strip().lower() == "/exit":
+                    console.print("\n[dim]Chat session ended.[/dim]")
+                    break
 
-            # Record timestamp immediately on submit
-            timestamp = format_timestamp()
+                if not user_input.strip():
+                    continue
 
-            if user_input.strip().lower() == "/exit":
+                # Stream agent response
+                streamer.stream_message(user_input, timestamp)
+
+            except KeyboardInterrupt:
+                console.print("\n\n[dim]Chat session ended.[/dim]")
+                break
+            except EOFError:
+                # Ctrl+D pressed
                 console.print("\n[dim]Chat session ended.[/dim]")
                 break
-
-            if not user_input.strip():
-                continue
-
-            # Stream agent response
-            streamer.stream_message(user_input, timestamp)
-
-        except KeyboardInterrupt:
-            console.print("\n\n[dim]Chat session ended.[/dim]")
-            break
-        except EOFError:
-            # Ctrl+D pressed
-            console.print("\n[dim]Chat session ended.[/dim]")
-            break
-        except Exception as e:
-            console.print(f"[red]Error:[/red] {e}\n")
+            except Exception as e:
+                console.print(f"[red]Error:[/red] {e}\n")
+    finally:
+        streamer.close()
@@ -7,8 +7,8 @@ from rich.table import Table
 
 from lyzr_kit.commands._console import console
 from lyzr_kit.storage import (
+    CycleAnalyzer,
     StorageManager,
-    detect_cycle,
     validate_agents_folder,
     validate_sub_agents,
 )
@@ -50,7 +50,7 @@ def _run_doctor(storage: StorageManager) -> DoctorReport:
     report = DoctorReport()
 
     # 1. Validate folder structure
-    folder_result = validate_agents_folder(storage.local_path)
+    folder_result = validate_agents_folder(storage.local_path, storage)
     if not folder_result.is_valid:
         for issue in folder_result.issues:
             report.folder_issues.append(f"{issue.message}")
@@ -59,6 +59,10 @@ def _run_doctor(storage: StorageManager) -> DoctorReport:
     local_agents = storage.list_local_agents()
     report.total_count = len(local_agents)
 
+    # Analyze the whole sub-agent graph in one pass: every agent on a cycle
+    # or leading into one is reported with the cycle it reaches
+    cycle_by_agent = CycleAnalyzer.from_storage(storage).cycle_by_agent()
+
     for agent in local_agents:
         agent_healthy = True
 
@@ -78,15 +82,19 @@ def _run_doctor(storage: StorageManager) -> DoctorReport:
                     )
 
             # Check for cycles
-            cycle = detect_cycle(agent.id, agent.sub_agents, storage)
+            cycle = cycle_by_agent.get(agent.id)
             if cycle:
                 agent_healthy = False
                 cycle_path = " → ".join(cycle)
+                if agent.id in cycle:
+                    message = f"Circular dependency: {cycle_path}"
+                else:
+                    message = f"Sub-agents lead into circular dependency: {cycle_path}"
                 report.agent_issues.append(
                     AgentIssue(
                         agent_id=agent.id,
                         issue_type="circular_dependency",
-                        message=f"Circular dependency: {cycle_path}",
+                        message=message,
                         fix_hint="Remove one of the references in sub_agents",
                     )
                 )
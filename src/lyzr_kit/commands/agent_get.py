@@ -1,5 +1,10 @@
 """Agent get command implementation."""
 
+import hashlib
+import json
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 
 import typer
@@ -10,9 +15,19 @@ from lyzr_kit.commands._auth_helper import require_auth
 from lyzr_kit.commands._console import console
 from lyzr_kit.commands._resolver import resolve_builtin_agent_id
 from lyzr_kit.schemas.agent import Agent
-from lyzr_kit.storage import StorageManager, get_next_local_serial
+from lyzr_kit.storage import CloneJournal, JournalEntry, StorageManager
 from lyzr_kit.utils.auth import AuthConfig
-from lyzr_kit.utils.platform import PlatformClient, PlatformError
+from lyzr_kit.utils.platform import (
+    AgentResponse,
+    PlatformClient,
+    PlatformError,
+    PlatformSession,
+    payload_hash,
+)
+
+# Environment variable overriding how many agents are created concurrently
+CLONE_WORKERS_ENV = "LK_CLONE_WORKERS"
+DEFAULT_CLONE_WORKERS = 8
 
 
 @dataclass
@@ -21,7 +36,7 @@ class ClonePlanItem:
 
     source_id: str  # Built-in agent ID
     target_id: str  # New local agent ID
-    action: str  # "create" or "use existing"
+    action: str  # "create", "use existing" or "done" (created by an earlier run)
     is_main: bool = False  # True for the main agent
 
 
@@ -46,10 +61,26 @@ def _generate_copy_id(source_id: str, storage: StorageManager) -> str:
     return new_id
 
 
+def get_clone_workers() -> int:
+    """Get how many agents to create on the platform at once.
+
+    LK_CLONE_WORKERS wins when set to a positive integer (1 creates agents
+    one at a time); otherwise DEFAULT_CLONE_WORKERS is used.
+    """
+    override = os.getenv(CLONE_WORKERS_ENV, "").strip()
+    if override:
+        try:
+            return max(1, int(override))
+        except ValueError:
+            pass
+    return DEFAULT_CLONE_WORKERS
+
+
 def _build_clone_plan(
     source_id: str,
     storage: StorageManager,
     visiting: set[str] | None = None,
+    planned: set[str] | None = None,
 ) -> list[ClonePlanItem]:
     """Build a plan of all agents to clone (main + sub-agents recursively).
 
@@ -57,12 +88,15 @@ def _build_clone_plan(
         source_id: The source agent ID to clone.
         storage: StorageManager instance.
         visiting: Set of source IDs currently being visited (for cycle detection).
+        planned: Source IDs already in the plan, so shared sub-agents are cloned once.
 
     Returns:
         List of ClonePlanItem in order of creation (sub-agents first, main last).
     """
     if visiting is None:
         visiting = set()
+    if planned is None:
+        planned = set()
 
     # Detect cycle
     if source_id in visiting:
@@ -81,6 +115,9 @@ def _build_clone_plan(
 
     # First, recursively plan sub-agents
     for sub_id in agent.sub_agents:
+        if sub_id in planned:
+            # Shared with an agent planned earlier
+            continue
         if storage.agent_exists_local(sub_id):
             # Sub-agent already exists locally - use it
             plan.append(
@@ -90,10 +127,12 @@ def _build_clone_plan(
                     action="use existing",
                 )
             )
+            planned.add(sub_id)
         else:
             # Need to clone this sub-agent and its dependencies
-            sub_plan = _build_clone_plan(sub_id, storage, visiting.copy())
+            sub_plan = _build_clone_plan(sub_id, storage, visiting.copy(), planned)
             plan.extend(sub_plan)
+            planned.add(sub_id)
 
     # Finally, add the main agent
     target_id = _generate_copy_id(source_id, storage)
@@ -109,6 +148,33 @@ def _build_clone_plan(
     return plan
 
 
+def _plan_id(plan: list[ClonePlanItem]) -> str:
+    """Identify a clone plan by its main agent and the shape of its tree.
+
+    Target IDs are left out, since a rerun picks new copy-of-* names for
+    agents an earlier run already saved.
+    """
+    shape = [[item.source_id, item.action] for item in plan]
+    digest = hashlib.sha256(json.dumps(shape).encode()).hexdigest()[:12]
+    return f"{plan[-1].source_id}-{digest}"
+
+
+def _apply_journal(plan: list[ClonePlanItem], finished: dict[str, JournalEntry]) -> int:
+    """Mark plan items created by an earlier run as done, keeping their IDs.
+
+    Returns:
+        Number of items marked done.
+    """
+    done = 0
+    for item in plan:
+        entry = finished.get(item.source_id)
+        if item.action == "create" and entry is not None:
+            item.action = "done"
+            item.target_id = entry.target_id
+            done += 1
+    return done
+
+
 def _display_clone_plan(plan: list[ClonePlanItem], source_id: str) -> None:
     """Display the clone plan as a table.
 
@@ -142,6 +208,8 @@ def _display_clone_plan(plan: list[ClonePlanItem], source_id: str) -> None:
         for item in plan:
             if item.action == "create":
                 action_text = "[green]create[/green]"
+            elif item.action == "done":
+                action_text = "[dim]done[/dim]"
             else:
                 action_text = "[dim]use existing[/dim]"
 
@@ -157,106 +225,234 @@ def _execute_clone_plan(
     storage: StorageManager,
     auth: AuthConfig,
     platform: PlatformClient,
+    workers: int | None = None,
+    journal: CloneJournal | None = None,
 ) -> Agent:
     """Execute the clone plan, creating agents on platform and locally.
 
+    The plan is run as a dependency DAG: every agent whose sub-agents already
+    have their new IDs is created right away, up to workers at a time, and a
+    parent is created as soon as its last sub-agent finishes. Platform calls
+    run on worker threads; ID remapping, serial allocation and saving stay on
+    the calling thread.
+
+    Every create is recorded in the journal before the agent is saved.
+    Items marked "done" reuse their journaled platform agent instead of
+    creating another one, and their local YAML is only written if missing.
+    The journal is removed once the main agent exists.
+
     Args:
         plan: List of ClonePlanItem to execute.
         storage: StorageManager instance.
         auth: Authentication configuration.
         platform: Platform client for API calls.
+        workers: Maximum concurrent platform calls. Defaults to get_clone_workers().
+        journal: Journal of completed creates, for resuming after a failure.
 
     Returns:
         The main agent that was created.
     """
+    if workers is None:
+        workers = get_clone_workers()
+
     # Track mapping from source_id to actual target_id for sub-agent references
-    id_mapping: dict[str, str] = {}
+    id_mapping: dict[str, str] = {
+        item.source_id: item.target_id for item in plan if item.action == "use existing"
+    }
 
-    main_agent: Agent | None = None
+    finished = journal.load() if journal is not None else {}
+    reused: set[str] = set()
 
+    # Load every source agent up front, keyed by source ID
+    to_create: dict[str, tuple[ClonePlanItem, Agent]] = {}
     for item in plan:
         if item.action == "use existing":
-            # Just record the mapping
-            id_mapping[item.source_id] = item.target_id
             continue
-
-        # Load source agent
         agent = storage.get_agent(item.source_id)
         if not agent:
             console.print(f"[red]Error: Agent '{item.source_id}' not found[/red]")
             raise typer.Exit(1)
-
-        # Update agent ID and serial
         agent.id = item.target_id
-        agent.serial = get_next_local_serial()
+        to_create[item.source_id] = (item, agent)
+
+    # Sub-agents each planned agent still waits for, and the reverse edges
+    waiting_on = {
+        source_id: {sub_id for sub_id in agent.sub_agents if sub_id in to_create}
+        for source_id, (_, agent) in to_create.items()
+    }
+    parents: dict[str, list[str]] = {}
+    for source_id, sub_ids in waiting_on.items():
+        for sub_id in sub_ids:
+            parents.setdefault(sub_id, []).append(source_id)
+    ready = deque(source_id for source_id, sub_ids in waiting_on.items() if not sub_ids)
 
-        # Remap sub-agent references to their new IDs
-        agent.sub_agents = [id_mapping.get(sub_id, sub_id) for sub_id in agent.sub_agents]
+    main_agent: Agent | None = None
+    pushed: dict[str, str] = {}
+    failure: tuple[str, PlatformError] | None = None
+    created = 0
+    running: dict[Future[AgentResponse], str] = {}
+
+    status = Status(_clone_status(created, len(to_create)), console=console)
+    with status, ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        while ready or running:
+            # Start everything whose sub-agents are done (stop after a failure)
+            while ready and failure is None:
+                source_id = ready.popleft()
+                item, agent = to_create[source_id]
+                # Remap sub-agent references to their new IDs
+                agent.sub_agents = [id_mapping.get(sub_id, sub_id) for sub_id in agent.sub_agents]
+                if item.action == "done" and source_id in finished:
+                    reused.add(source_id)
+                    running[_journaled_result(finished[source_id])] = source_id
+                else:
+                    running[executor.submit(platform.create_agent, agent)] = source_id
+            if not running:
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                source_id = running.pop(future)
+                item, agent = to_create[source_id]
+                try:
+                    response = future.result()
+                except PlatformError as e:
+                    if failure is None:
+                        failure = (item.target_id, e)
+                    continue
+
+                if journal is not None and source_id not in reused:
+                    journal.record(
+                        JournalEntry(
+                            source_id=source_id,
+                            target_id=item.target_id,
+                            agent_id=response.agent_id,
+                            env_id=response.env_id,
+                            endpoint=response.endpoint,
+                            app_id=response.app_id,
+                        )
+                    )
 
-        # Create on platform
-        try:
-            status_msg = f"[bold cyan]Creating '{item.target_id}'...[/bold cyan]"
-            with Status(status_msg, console=console):
-                response = platform.create_agent(agent)
                 agent.is_active = True
                 agent.endpoint = response.endpoint
                 agent.platform_agent_id = response.agent_id
                 agent.platform_env_id = response.env_id
                 agent.marketplace_app_id = response.app_id
-        except PlatformError as e:
-            console.print(f"[red]Platform Error creating '{item.target_id}':[/red] {e}")
-            raise typer.Exit(1) from None
-
-        # Save locally
-        storage.save_agent(agent)
 
-        # Record mapping
-        id_mapping[item.source_id] = item.target_id
-
-        if item.is_main:
-            main_agent = agent
-        else:
-            console.print(f"  [green]\u2713[/green] {item.target_id}")
+                saved = storage.get_agent(item.target_id) if source_id in reused else None
+                if saved is not None and saved.platform_agent_id == response.agent_id:
+                    # Saved by the earlier run - keep it (and any edits) as is
+                    agent = saved
+                else:
+                    # Save locally (agents created before a failure are kept too)
+                    agent.serial = storage.allocate_local_serial()
+                    storage.save_agent(agent)
+                if source_id not in reused:
+                    # The earlier run recorded what it pushed; local edits since are unpushed
+                    pushed[response.agent_id] = payload_hash(agent)
+                id_mapping[source_id] = item.target_id
+                created += 1
+                status.update(_clone_status(created, len(to_create)))
+
+                if item.is_main:
+                    main_agent = agent
+                else:
+                    console.print(f"  [green]\u2713[/green] {item.target_id}")
+
+                for parent_id in parents.get(source_id, []):
+                    waiting_on[parent_id].discard(source_id)
+                    if not waiting_on[parent_id]:
+                        ready.append(parent_id)
+
+    # Lets 'lk agent set --all' skip agents unchanged since their creation
+    storage.record_pushed_hashes(pushed)
+
+    if failure is not None:
+        target_id, error = failure
+        console.print(f"[red]Platform Error creating '{target_id}':[/red] {error}")
+        if journal is not None and journal.exists():
+            console.print(
+                f"[dim]To continue without recreating finished agents, run:[/dim] "
+                f"lk agent get {plan[-1].source_id} --resume"
+            )
+        raise typer.Exit(1)
 
     if main_agent is None:
         console.print("[red]Error: No main agent created[/red]")
         raise typer.Exit(1)
 
+    if journal is not None:
+        journal.remove()
     return main_agent
 
 
-def get_agent(source_id: str) -> None:
+def _journaled_result(entry: JournalEntry) -> Future[AgentResponse]:
+    """Wrap a journaled create as an already finished future."""
+    future: Future[AgentResponse] = Future()
+    future.set_result(
+        AgentResponse(
+            agent_id=entry.agent_id,
+            env_id=entry.env_id,
+            endpoint=entry.endpoint,
+            app_id=entry.app_id,
+        )
+    )
+    return future
+
+
+def _clone_status(created: int, total: int) -> str:
+    """Format the spinner message for clone progress."""
+    if total == 1:
+        return "[bold cyan]Creating agent...[/bold cyan]"
+    return f"[bold cyan]Creating agents ({created}/{total})...[/bold cyan]"
+
+
+def get_agent(source_id: str, resume: bool = False) -> None:
     """Clone agent to agents/copy-of-<name>.yaml and create on platform.
 
     Args:
         source_id: Built-in agent ID or serial number.
+        resume: Skip agents a failed earlier run of the same plan already created.
     """
-    auth = require_auth()
-    storage = StorageManager()
-
-    # Resolve source_id (could be serial number or agent ID)
-    resolved_source_id = resolve_builtin_agent_id(source_id, storage)
-    if resolved_source_id is None:
-        raise typer.Exit(1)
-
-    # Build the clone plan (includes all sub-agents recursively)
-    plan = _build_clone_plan(resolved_source_id, storage)
-
-    # Display the plan
-    _display_clone_plan(plan, resolved_source_id)
+    # One pooled session serves the auth check and every create call
+    with PlatformSession() as session:
+        auth = require_auth(client=session)
+        storage = StorageManager()
+
+        # Resolve source_id (could be serial number or agent ID)
+        resolved_source_id = resolve_builtin_agent_id(source_id, storage)
+        if resolved_source_id is None:
+            raise typer.Exit(1)
 
-    # Ask for confirmation
-    confirm = console.input("Proceed? [Y/n]: ").strip().lower()
-    if confirm and confirm not in ("y", "yes"):
-        console.print("[dim]Cancelled.[/dim]")
-        raise typer.Exit(0)
+        # Build the clone plan (includes all sub-agents recursively)
+        plan = _build_clone_plan(resolved_source_id, storage)
 
-    # Create platform client
-    platform = PlatformClient(auth)
+        # Journal of completed creates, so a failed clone can be resumed
+        journal = CloneJournal.for_plan(storage.local_path, _plan_id(plan))
+        if resume:
+            done = _apply_journal(plan, journal.load())
+            if not done:
+                console.print("[dim]Nothing to resume - starting a new clone.[/dim]")
+        elif journal.exists():
+            console.print(
+                "[yellow]A previous clone of this agent did not finish.[/yellow] "
+                f"[dim]Run 'lk agent get {resolved_source_id} --resume' to reuse its agents.[/dim]"
+            )
 
-    # Execute the plan
-    console.print()
-    agent = _execute_clone_plan(plan, storage, auth, platform)
+        # Display the plan
+        _display_clone_plan(plan, resolved_source_id)
+
+        # Ask for confirmation
+        confirm = console.input("Proceed? [Y/n]: ").strip().lower()
+        if confirm and confirm not in ("y", "yes"):
+            console.print("[dim]Cancelled.[/dim]")
+            raise typer.Exit(0)
+
+        # Execute the plan (a fresh run starts a new journal)
+        if not resume:
+            journal.remove()
+        platform = PlatformClient(auth, session=session)
+        console.print()
+        agent = _execute_clone_plan(plan, storage, auth, platform, journal=journal)
 
     # Show success message
     console.print(f"\n[green]Agent '{agent.id}' created successfully![/green]")
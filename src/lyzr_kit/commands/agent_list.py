@@ -8,39 +8,35 @@ from rich.table import Table
 from lyzr_kit.commands._console import console
 from lyzr_kit.schemas import Agent
 from lyzr_kit.storage import StorageManager, format_validation_errors, validate_agents_folder
+from lyzr_kit.storage.graph import count_descendants
 
 
-def _count_sub_agents_recursive(
-    agent: Agent, agent_map: dict[str, Agent], visited: set[str] | None = None
-) -> int:
-    """Count total sub-agents in the dependency tree (recursive).
+def _count_sub_agents(agent_map: dict[str, Agent]) -> dict[str, int]:
+    """Count total sub-agents in the dependency tree of every agent.
+
+    Computed in a single memoized pass over the whole graph, so shared
+    sub-trees are counted once rather than re-walked for every table row.
 
     Args:
-        agent: The agent to count sub-agents for.
-        agent_map: Map of agent ID to Agent object for lookups.
-        visited: Set of already visited agent IDs (for cycle detection).
+        agent_map: Map of agent ID to Agent object.
 
     Returns:
-        Total count of unique sub-agents in the tree.
+        Map of agent ID to the count of unique sub-agents in its tree.
     """
-    if visited is None:
-        visited = set()
+    return count_descendants({agent_id: a.sub_agents for agent_id, a in agent_map.items()})
 
-    if agent.id in visited:
-        return 0  # Cycle detected, don't count again
 
-    visited.add(agent.id)
-    count = 0
+def _count_sub_agents_recursive(agent: Agent, agent_map: dict[str, Agent]) -> int:
+    """Count total sub-agents in the dependency tree of a single agent.
 
-    for sub_id in agent.sub_agents:
-        if sub_id in visited:
-            continue  # Skip already-counted agents (handles cycles)
-        count += 1  # Count this sub-agent
-        if sub_id in agent_map:
-            # Recursively count nested sub-agents
-            count += _count_sub_agents_recursive(agent_map[sub_id], agent_map, visited)
+    Args:
+        agent: The agent to count sub-agents for.
+        agent_map: Map of agent ID to Agent object for lookups.
 
-    return count
+    Returns:
+        Total count of unique sub-agents in the tree.
+    """
+    return _count_sub_agents({**agent_map, agent.id: agent})[agent.id]
 
 
 def list_agents() -> None:
@@ -48,15 +44,22 @@ def list_agents() -> None:
     storage = StorageManager()
 
     # Validate agents folder structure first
-    validation_result = validate_agents_folder(Path(storage.local_path))
+    validation_result = validate_agents_folder(Path(storage.local_path), storage)
     if not validation_result.is_valid:
         console.print(format_validation_errors(validation_result))
         raise typer.Exit(1)
 
     agents = storage.list_agents()
 
-    # Build agent map for recursive sub-agent counting
+    # Count sub-agents for every row in one pass over the agent graph
     agent_map: dict[str, Agent] = {a.id: a for a, _ in agents}
+    sub_counts = _count_sub_agents(agent_map)
+
+    def total_sub_agents(agent: Agent) -> int:
+        if agent_map[agent.id] is agent:
+            return sub_counts[agent.id]
+        # Built-in agent shadowed by a local agent with the same ID
+        return _count_sub_agents_recursive(agent, agent_map)
 
     # Separate built-in and local agents
     builtin_agents = [(a, s) for a, s in agents if s == "built-in"]
@@ -78,7 +81,7 @@ def list_agents() -> None:
     if builtin_agents:
         for agent, _ in builtin_agents:
             serial_str = str(agent.serial) if agent.serial is not None else "?"
-            total_subs = _count_sub_agents_recursive(agent, agent_map)
+            total_subs = total_sub_agents(agent)
             subs_count = str(total_subs) if total_subs > 0 else "-"
             builtin_table.add_row(
                 serial_str,
@@ -106,7 +109,7 @@ def list_agents() -> None:
     if local_agents:
         for agent, _ in local_agents:
             serial_str = str(agent.serial) if agent.serial is not None else "?"
-            total_subs = _count_sub_agents_recursive(agent, agent_map)
+            total_subs = total_sub_agents(agent)
             subs_count = str(total_subs) if total_subs > 0 else "-"
             # Build Studio URL from platform_agent_id
             if agent.platform_agent_id:
@@ -4,19 +4,18 @@ import typer
 
 from lyzr_kit.commands._console import console
 from lyzr_kit.commands._resolver import resolve_local_agent_id
-from lyzr_kit.schemas.agent import Agent
 from lyzr_kit.storage import StorageManager
 
 
 def _collect_sub_agents_recursive(
-    agent: Agent,
+    agent_id: str,
     storage: StorageManager,
     collected: set[str] | None = None,
 ) -> list[str]:
     """Recursively collect all sub-agent IDs that exist locally.
 
     Args:
-        agent: The agent whose sub-agents to collect.
+        agent_id: The agent whose sub-agents to collect.
         storage: StorageManager instance.
         collected: Set of already collected IDs to avoid duplicates.
 
@@ -28,16 +27,14 @@ def _collect_sub_agents_recursive(
 
     result: list[str] = []
 
-    for sub_id in agent.sub_agents:
+    for sub_id in storage.get_local_sub_agents(agent_id):
         if sub_id in collected:
             continue
 
-        sub_agent = storage.get_agent(sub_id)
-        if sub_agent and storage.agent_exists_local(sub_id):
-            collected.add(sub_id)
-            # Recursively collect this sub-agent's sub-agents first
-            result.extend(_collect_sub_agents_recursive(sub_agent, storage, collected))
-            result.append(sub_id)
+        collected.add(sub_id)
+        # Recursively collect this sub-agent's sub-agents first
+        result.extend(_collect_sub_agents_recursive(sub_id, storage, collected))
+        result.append(sub_id)
 
     return result
 
@@ -100,7 +97,7 @@ def rm_agent(identifier: str, force: bool = False, tree: bool = False) -> None:
 
     if tree and agent.sub_agents:
         # Collect all sub-agents recursively (deepest first)
-        agents_to_delete = _collect_sub_agents_recursive(agent, storage)
+        agents_to_delete = _collect_sub_agents_recursive(agent_id, storage)
 
     # Add the main agent last
     agents_to_delete.append(agent_id)
@@ -1,16 +1,20 @@
 """Agent set command implementation."""
 
+import asyncio
+from dataclasses import dataclass
 from pathlib import Path
 
 import typer
 from rich.status import Status
+from rich.table import Table
 
 from lyzr_kit.commands._auth_helper import require_auth
 from lyzr_kit.commands._console import console
 from lyzr_kit.commands._resolver import resolve_local_agent_id
+from lyzr_kit.schemas.agent import Agent
 from lyzr_kit.storage import (
+    CycleAnalyzer,
     StorageManager,
-    detect_cycle,
     format_cycle_error,
     format_schema_errors,
     format_subagent_errors,
@@ -18,7 +22,31 @@ from lyzr_kit.storage import (
     validate_sub_agents,
 )
 from lyzr_kit.utils.auth import STUDIO_BASE_URL
-from lyzr_kit.utils.platform import PlatformClient, PlatformError
+from lyzr_kit.utils.platform import (
+    AgentResponse,
+    AsyncPlatformClient,
+    PlatformClient,
+    PlatformError,
+    PlatformSession,
+    payload_hash,
+)
+
+# Bulk sync statuses, in summary order, with their display colors
+SYNC_STATUS_STYLES = {
+    "updated": "green",
+    "unchanged": "dim",
+    "skipped": "yellow",
+    "failed": "red",
+}
+
+
+@dataclass
+class SyncResult:
+    """Outcome of syncing one agent in 'lk agent set --all'."""
+
+    agent_id: str
+    status: str  # A key of SYNC_STATUS_STYLES
+    detail: str = ""
 
 
 def set_agent(identifier: str) -> None:
@@ -27,7 +55,19 @@ def set_agent(identifier: str) -> None:
     Args:
         identifier: Agent ID or serial number.
     """
-    auth = require_auth()
+    # One pooled session serves the auth check and the update call
+    with PlatformSession() as session:
+        auth = require_auth(client=session)
+        _update_agent(identifier, PlatformClient(auth, session=session))
+
+
+def _update_agent(identifier: str, platform: PlatformClient) -> None:
+    """Validate agents/<id>.yaml, push it to the platform and save it.
+
+    Args:
+        identifier: Agent ID or serial number.
+        platform: Platform client for the update call.
+    """
     storage = StorageManager()
 
     # Resolve identifier (could be serial number or agent ID)
@@ -67,7 +107,8 @@ def set_agent(identifier: str) -> None:
             raise typer.Exit(1)
 
         # Detect circular dependencies
-        cycle = detect_cycle(agent.id, agent.sub_agents, storage)
+        cycles = CycleAnalyzer.from_storage(storage, overrides={agent.id: agent.sub_agents})
+        cycle = cycles.find_cycle(agent.id)
         if cycle:
             console.print(format_cycle_error(cycle))
             raise typer.Exit(1)
@@ -92,7 +133,6 @@ def set_agent(identifier: str) -> None:
     # Update agent on platform
     try:
         with Status("[bold cyan]Updating agent on platform...[/bold cyan]", console=console):
-            platform = PlatformClient(auth)
             response = platform.update_agent(
                 agent=agent,
                 agent_id=agent.platform_agent_id,
@@ -104,8 +144,9 @@ def set_agent(identifier: str) -> None:
         console.print(f"[red]Platform Error:[/red] {e}")
         raise typer.Exit(1) from None
 
-    # Save updated agent
+    # Save updated agent and remember what the platform now has
     path = storage.save_agent(agent)
+    storage.record_pushed_hashes({agent.platform_agent_id: payload_hash(agent)})
 
     # If ID changed, update sub-agent references in other agents and delete old file
     if id_changed:
@@ -118,9 +159,7 @@ def set_agent(identifier: str) -> None:
                 console.print(f"  - {updated_id}")
 
         # Delete the old YAML file
-        old_path = Path(storage.local_path) / "agents" / f"{agent_id}.yaml"
-        if old_path.exists():
-            old_path.unlink()
+        storage.delete_agent(agent_id)
 
     console.print(f"\n[green]Agent '{agent.id}' updated successfully![/green]")
     console.print(f"[dim]Agent ID:[/dim] {response.agent_id}")
@@ -130,3 +169,134 @@ def set_agent(identifier: str) -> None:
         console.print(f"[dim]Chat URL:[/dim] {chat_url}")
     console.print(f"[dim]API Endpoint:[/dim] {agent.endpoint}")
     console.print(f"[dim]Local config:[/dim] {path}")
+
+
+def set_all_agents() -> None:
+    """Push every local agent whose platform payload changed since its last push."""
+    # One pooled session serves the auth check and every update call
+    with PlatformSession() as session:
+        auth = require_auth(client=session)
+        platform = PlatformClient(auth, session=session)
+        results = _sync_all_agents(StorageManager(), platform)
+
+    _display_sync_results(results)
+    if any(result.status == "failed" for result in results):
+        raise typer.Exit(1)
+
+
+def _sync_all_agents(storage: StorageManager, platform: PlatformClient) -> list[SyncResult]:
+    """Find the local agents whose payload changed and update them concurrently.
+
+    An agent counts as changed when the hash of its platform payload differs
+    from the one recorded at its last push (or none was recorded). Changed
+    agents are validated like 'lk agent set', then all updates are sent at
+    once through the async client, bounded by its concurrency limit.
+
+    Args:
+        storage: StorageManager instance.
+        platform: Platform client for the update calls.
+
+    Returns:
+        One SyncResult per local agent, in list_local_agents() order.
+    """
+    agents_dir = Path(storage.local_path) / "agents"
+    pushed = storage.get_pushed_hashes()
+    cycles: CycleAnalyzer | None = None
+
+    results: list[SyncResult] = []
+    changed: list[tuple[Agent, str, SyncResult]] = []
+    for agent in storage.list_local_agents():
+        result = SyncResult(agent.id, "unchanged")
+        results.append(result)
+
+        if not agent.platform_agent_id or not agent.platform_env_id:
+            result.status, result.detail = "skipped", "no platform IDs"
+            continue
+
+        digest = payload_hash(agent)
+        if pushed.get(agent.platform_agent_id) == digest:
+            continue
+
+        # Renames need the old file name, which only 'lk agent set <id>' has
+        if not (agents_dir / f"{agent.id}.yaml").exists():
+            result.status = "skipped"
+            result.detail = "ID differs from file name, run 'lk agent set <file-id>'"
+            continue
+
+        missing = validate_sub_agents(agent.sub_agents, storage)
+        if missing:
+            result.status, result.detail = "failed", f"unknown sub-agents: {', '.join(missing)}"
+            continue
+
+        if agent.sub_agents:
+            if cycles is None:
+                cycles = CycleAnalyzer.from_storage(storage)
+            cycle = cycles.find_cycle(agent.id)
+            if cycle:
+                result.status, result.detail = "failed", f"circular: {' -> '.join(cycle)}"
+                continue
+
+        changed.append((agent, digest, result))
+
+    if not changed:
+        return results
+
+    message = f"[bold cyan]Updating {len(changed)} agent(s) on platform...[/bold cyan]"
+    with Status(message, console=console):
+        responses = platform.session.run(
+            _update_agents(platform.async_client, [agent for agent, _, _ in changed])
+        )
+
+    new_hashes: dict[str, str] = {}
+    for (agent, digest, result), response in zip(changed, responses, strict=True):
+        if isinstance(response, PlatformError):
+            result.status, result.detail = "failed", str(response)
+            continue
+        agent.endpoint = response.endpoint
+        storage.save_agent(agent)
+        new_hashes[response.agent_id] = digest
+        result.status = "updated"
+    storage.record_pushed_hashes(new_hashes)
+
+    return results
+
+
+async def _update_agents(
+    platform: AsyncPlatformClient, agents: list[Agent]
+) -> list[AgentResponse | PlatformError]:
+    """Update agents concurrently, returning each response or PlatformError in order."""
+
+    async def update(agent: Agent) -> AgentResponse | PlatformError:
+        try:
+            return await platform.update_agent(
+                agent, agent.platform_agent_id or "", agent.platform_env_id or ""
+            )
+        except PlatformError as e:
+            return e
+
+    return await asyncio.gather(*(update(agent) for agent in agents))
+
+
+def _display_sync_results(results: list[SyncResult]) -> None:
+    """Print a summary table of a bulk sync, collapsing unchanged agents into a count."""
+    if not results:
+        console.print("[dim]No local agents found in agents/[/dim]")
+        return
+
+    shown = [result for result in results if result.status != "unchanged"]
+    if shown:
+        table = Table(show_header=True, header_style="bold", box=None, padding=(0, 2))
+        table.add_column("AGENT", style="cyan")
+        table.add_column("STATUS")
+        table.add_column("DETAIL", style="dim")
+        for result in shown:
+            style = SYNC_STATUS_STYLES[result.status]
+            table.add_row(result.agent_id, f"[{style}]{result.status}[/{style}]", result.detail)
+        console.print()
+        console.print(table)
+
+    counts = {status: 0 for status in SYNC_STATUS_STYLES}
+    for result in results:
+        counts[result.status] += 1
+    summary = ", ".join(f"{count} {status}" for status, count in counts.items() if count)
+    console.print(f"\n[bold]Synced {len(results)} agent(s):[/bold] {summary}")
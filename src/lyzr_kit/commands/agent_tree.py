@@ -6,26 +6,41 @@ from rich.tree import Tree
 from lyzr_kit.commands._console import console
 from lyzr_kit.commands._resolver import resolve_local_agent_id
 from lyzr_kit.schemas.agent import Agent
-from lyzr_kit.storage import StorageManager
+from lyzr_kit.storage import CycleAnalyzer, StorageManager
 
 
 def _build_agent_tree(
     agent: Agent,
     storage: StorageManager,
     visited: set[str] | None = None,
+    memo: dict[str, Tree] | None = None,
+    cyclic: set[str] | None = None,
 ) -> Tree:
     """Build a Rich Tree for an agent and its sub-agents.
 
+    The tree of an agent that isn't part of a cycle doesn't depend on how it
+    was reached, so it is built once and reused wherever the agent appears
+    again. Agents on a cycle are rebuilt per path to mark the repeat.
+
     Args:
         agent: The agent to build tree for.
         storage: StorageManager instance.
-        visited: Set of visited agent IDs to detect cycles.
+        visited: IDs of the agents on the current path, to detect cycles.
+        memo: Trees already built for agents outside any cycle.
+        cyclic: IDs of agents on a cycle. Computed from storage if omitted.
 
     Returns:
         Rich Tree object.
     """
     if visited is None:
         visited = set()
+    if memo is None:
+        memo = {}
+    if cyclic is None:
+        cyclic = {aid for c in CycleAnalyzer.from_storage(storage).cyclic_components() for aid in c}
+
+    if agent.id in memo:
+        return memo[agent.id]
 
     # Create tree node
     tree = Tree(f"[bold cyan]{agent.id}[/bold cyan]")
@@ -40,11 +55,15 @@ def _build_agent_tree(
     for sub_id in agent.sub_agents:
         sub_agent = storage.get_agent(sub_id)
         if sub_agent:
-            subtree = _build_agent_tree(sub_agent, storage, visited.copy())
+            subtree = _build_agent_tree(sub_agent, storage, visited, memo, cyclic)
             tree.add(subtree)
         else:
             tree.add(f"[red]{sub_id}[/red] [dim](missing)[/dim]")
 
+    # Backtrack so siblings only see their own ancestors
+    visited.discard(agent.id)
+    if agent.id not in cyclic:
+        memo[agent.id] = tree
     return tree
 
 
@@ -92,8 +111,12 @@ def tree_agent(identifier: str | None = None) -> None:
         if not root_agents:
             root_agents = local_agents
 
+        # Share built sub-trees across roots
+        memo: dict[str, Tree] = {}
+        cyclic = {aid for c in CycleAnalyzer.from_storage(storage).cyclic_components() for aid in c}
+
         console.print()
         for agent in root_agents:
-            tree = _build_agent_tree(agent, storage)
+            tree = _build_agent_tree(agent, storage, memo=memo, cyclic=cyclic)
             console.print(tree)
             console.print()
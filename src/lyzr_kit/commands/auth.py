@@ -5,8 +5,6 @@ from pathlib import Path
 import typer
 from rich.console import Console
 
-from lyzr_kit.storage import init_project_structure
-
 console = Console()
 
 # Environment variable names
@@ -86,6 +84,8 @@ def auth() -> None:
         console.print("[dim]Skipped Memberstack token[/dim]")
 
     # Initialize project structure
+    from lyzr_kit.storage import init_project_structure
+
     init_project_structure()
 
     console.print("\n[green]✓ Authentication configured successfully![/green]")
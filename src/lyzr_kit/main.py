@@ -1,15 +1,12 @@
-"""Main CLI entry point for lyzr-kit."""
+"""Main CLI entry point for lyzr-kit.
+
+Command implementations are imported lazily inside each command (see
+commands/agent.py) to keep CLI startup fast.
+"""
 
 import typer
 
 from lyzr_kit.commands.agent import app as agent_app
-from lyzr_kit.commands.agent_chat import chat_with_agent
-from lyzr_kit.commands.agent_doctor import doctor_agents
-from lyzr_kit.commands.agent_get import get_agent
-from lyzr_kit.commands.agent_list import list_agents
-from lyzr_kit.commands.agent_rm import rm_agent
-from lyzr_kit.commands.agent_set import set_agent
-from lyzr_kit.commands.agent_tree import tree_agent
 from lyzr_kit.commands.auth import auth as auth_command
 from lyzr_kit.commands.feature import app as feature_app
 from lyzr_kit.commands.tool import app as tool_app
@@ -39,23 +36,41 @@ app.command(name="auth")(auth_command)
 @app.command("list", hidden=True)
 def ls() -> None:
     """List built-in and local agents."""
+    from lyzr_kit.commands.agent_list import list_agents
+
     list_agents()
 
 
 @app.command("get")
 def get(
     source_id: str = typer.Argument(..., help="Built-in agent ID or serial (#)"),
+    resume: bool = typer.Option(
+        False, "--resume", help="Reuse agents created by a failed earlier clone"
+    ),
 ) -> None:
     """Clone a built-in agent (with sub-agents)."""
-    get_agent(source_id)
+    from lyzr_kit.commands.agent_get import get_agent
+
+    get_agent(source_id, resume=resume)
 
 
 @app.command("set")
 def set_cmd(
-    identifier: str = typer.Argument(..., help="Your agent ID or serial (#)"),
+    identifier: str | None = typer.Argument(None, help="Your agent ID or serial (#)"),
+    all_agents: bool = typer.Option(
+        False, "--all", "-a", help="Sync every agent changed since its last push"
+    ),
 ) -> None:
     """Sync local YAML changes to platform."""
-    set_agent(identifier)
+    if all_agents == (identifier is not None):
+        raise typer.BadParameter("Pass an agent ID or serial, or --all", param_hint="IDENTIFIER")
+
+    from lyzr_kit.commands.agent_set import set_agent, set_all_agents
+
+    if identifier is None:
+        set_all_agents()
+    else:
+        set_agent(identifier)
 
 
 @app.command("chat")
@@ -63,6 +78,8 @@ def chat(
     identifier: str = typer.Argument(..., help="Your agent ID or serial (#)"),
 ) -> None:
     """Start interactive chat with an agent."""
+    from lyzr_kit.commands.agent_chat import chat_with_agent
+
     chat_with_agent(identifier)
 
 
@@ -74,6 +91,8 @@ def rm(
     tree: bool = typer.Option(False, "--tree", "-t", help="Also delete all sub-agents recursively"),
 ) -> None:
     """Delete a local agent (--tree for sub-agents)."""
+    from lyzr_kit.commands.agent_rm import rm_agent
+
     rm_agent(identifier, force=force, tree=tree)
 
 
@@ -82,12 +101,16 @@ def tree_cmd(
     identifier: str = typer.Argument(None, help="Agent ID or serial (#). Shows all if omitted."),
 ) -> None:
     """Visualize agent sub-agent hierarchy."""
+    from lyzr_kit.commands.agent_tree import tree_agent
+
     tree_agent(identifier)
 
 
 @app.command("doctor")
 def doctor() -> None:
     """Check for missing sub-agents and cycles."""
+    from lyzr_kit.commands.agent_doctor import doctor_agents
+
     doctor_agents()
 
 
@@ -1,5 +1,6 @@
 """Storage management for lyzr-kit resources."""
 
+from lyzr_kit.storage.journal import CloneJournal, JournalEntry
 from lyzr_kit.storage.manager import AgentLoadError, StorageManager
 from lyzr_kit.storage.project import init_project_structure
 from lyzr_kit.storage.serialization import (
@@ -8,6 +9,7 @@ from lyzr_kit.storage.serialization import (
     get_next_local_serial,
 )
 from lyzr_kit.storage.validator import (
+    CycleAnalyzer,
     ValidationResult,
     detect_cycle,
     format_cycle_error,
@@ -21,9 +23,12 @@ from lyzr_kit.storage.validator import (
 
 __all__ = [
     "AgentLoadError",
+    "CloneJournal",
+    "CycleAnalyzer",
     "StorageManager",
     "detect_cycle",
     "format_cycle_error",
+    "JournalEntry",
     "get_builtin_agent_by_serial",
     "get_local_agent_by_serial",
     "get_next_local_serial",
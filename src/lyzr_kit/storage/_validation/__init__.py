@@ -1,6 +1,7 @@
 """Validation module - folder structure, YAML, schema, and cycle validation."""
 
 from lyzr_kit.storage._validation.cycle import (
+    CycleAnalyzer,
     CycleDetector,
     detect_cycle,
     validate_sub_agents,
@@ -15,6 +16,7 @@ from lyzr_kit.storage._validation.formatters import (
 )
 from lyzr_kit.storage._validation.models import ValidationIssue, ValidationResult
 from lyzr_kit.storage._validation.yaml_validator import (
+    load_agent_yaml,
     validate_agent_yaml,
     validate_agent_yaml_file,
 )
@@ -27,9 +29,11 @@ __all__ = [
     "FolderValidator",
     "validate_agents_folder",
     # YAML validation
+    "load_agent_yaml",
     "validate_agent_yaml",
     "validate_agent_yaml_file",
     # Cycle detection
+    "CycleAnalyzer",
     "CycleDetector",
     "detect_cycle",
     "validate_sub_agents",
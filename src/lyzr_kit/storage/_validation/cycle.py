@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from lyzr_kit.storage.graph import strongly_connected_components
+
 if TYPE_CHECKING:
     from lyzr_kit.storage.manager import StorageManager
 
@@ -93,6 +95,199 @@ def detect_cycle(
     return detector.detect(agent_id, sub_agents, visiting, path)
 
 
+class CycleAnalyzer:
+    """Whole-graph cycle analysis of sub-agent relationships.
+
+    Builds the sub-agent adjacency once and runs Tarjan's strongly connected
+    components algorithm over it, so every agent's cycle (if any) is known
+    after a single O(V+E) pass instead of one DFS per agent.
+
+    Cycle paths have the same shape as CycleDetector.detect(): they start at
+    the queried agent, follow sub-agent references and end with the first
+    agent that repeats (e.g. ["A", "B", "C", "B"]).
+    """
+
+    def __init__(self, graph: dict[str, list[str]]):
+        """Initialize the analyzer and analyze the graph.
+
+        Args:
+            graph: Agent ID -> sub-agent IDs. References to IDs that are not
+                keys of the graph are ignored, like missing agents in detect().
+        """
+        self.graph = graph
+        self._adjacency = {
+            agent_id: [sub_id for sub_id in sub_agents if sub_id in graph]
+            for agent_id, sub_agents in graph.items()
+        }
+        # Next agent to visit on the way to (or around) a cycle, for every
+        # agent that can reach one
+        self._next_hop: dict[str, str] = {}
+        self._cyclic_components: list[list[str]] = []
+        self._cycles: list[list[str]] = []
+        self._analyze()
+
+    @classmethod
+    def from_storage(
+        cls,
+        storage: StorageManager,
+        overrides: dict[str, list[str]] | None = None,
+    ) -> CycleAnalyzer:
+        """Build an analyzer over every agent known to storage.
+
+        Local agents take precedence over built-in agents with the same ID,
+        matching StorageManager.get_agent().
+
+        Args:
+            storage: StorageManager instance to load agents.
+            overrides: Agent ID -> sub-agent IDs to use instead of what is
+                stored (e.g. an edited agent that hasn't been saved yet).
+
+        Returns:
+            CycleAnalyzer for the combined graph.
+        """
+        graph: dict[str, list[str]] = {}
+        for source in ("built-in", "local"):
+            for agent, _ in storage.list_agents(source):
+                graph[agent.id] = agent.sub_agents
+        graph.update(overrides or {})
+        return cls(graph)
+
+    def _successors(self, agent_id: str) -> list[str]:
+        return self._adjacency[agent_id]
+
+    def _analyze(self) -> None:
+        """Find the strongly connected components and record next hops.
+
+        Components come in reverse topological order, so by the time a
+        component is linked every component it points to is final.
+        """
+        for component in strongly_connected_components(self._adjacency):
+            self._link_component(component)
+
+    def _link_component(self, component: list[str]) -> None:
+        """Record next hops for the members of one finished component."""
+        root = component[0]
+        if len(component) == 1 and root not in self._successors(root):
+            # Acyclic: step towards the first sub-agent that reaches a cycle
+            for succ in self._successors(root):
+                if succ in self._next_hop:
+                    self._next_hop[root] = succ
+                    break
+            return
+
+        self._cyclic_components.append(component)
+        members = set(component)
+
+        # Breadth-first search for the shortest cycle back to the root
+        parent: dict[str, str] = {}
+        queue = [root]
+        last = root
+        for node in queue:
+            succs = [s for s in self._successors(node) if s in members]
+            if root in succs:
+                last = node
+                break
+            for succ in succs:
+                if succ not in parent and succ != root:
+                    parent[succ] = node
+                    queue.append(succ)
+
+        cycle = [root]
+        self._next_hop[last] = root
+        while last != root:
+            cycle.append(last)
+            self._next_hop[parent[last]] = last
+            last = parent[last]
+        cycle[1:] = reversed(cycle[1:])
+        cycle.append(root)
+        self._cycles.append(cycle)
+
+        # Remaining members step towards the cycle through reversed edges
+        predecessors: dict[str, list[str]] = {member: [] for member in component}
+        for member in component:
+            for succ in self._successors(member):
+                if succ in members:
+                    predecessors[succ].append(member)
+        queue = [member for member in component if member in self._next_hop]
+        for node in queue:
+            for pred in predecessors[node]:
+                if pred not in self._next_hop:
+                    self._next_hop[pred] = node
+                    queue.append(pred)
+
+    def cyclic_components(self) -> list[list[str]]:
+        """Get every group of agents that reference each other in a cycle.
+
+        Returns:
+            Strongly connected components with a cycle (including agents that
+            reference themselves), in reverse topological order.
+        """
+        return [list(component) for component in self._cyclic_components]
+
+    def cycles(self) -> list[list[str]]:
+        """Get one cycle path for every cyclic component.
+
+        Returns:
+            Closed cycle paths (e.g., ["A", "B", "A"]), one per entry of
+            cyclic_components() and in the same order.
+        """
+        return [list(cycle) for cycle in self._cycles]
+
+    def cycle_by_agent(self) -> dict[str, list[str]]:
+        """Map every agent that can reach a cycle to that cycle.
+
+        Members of a cyclic component map to their component's cycle, and
+        every other agent to the cycle of the first component found that it
+        leads into. One breadth-first search over reversed sub-agent edges,
+        starting from all cyclic components at once, so this is O(V+E) and
+        agents of the same cycle share one path list.
+
+        Returns:
+            Agent ID -> closed cycle path (e.g., ["A", "B", "A"]).
+        """
+        predecessors: dict[str, list[str]] = {agent_id: [] for agent_id in self._adjacency}
+        for agent_id, successors in self._adjacency.items():
+            for succ in successors:
+                predecessors[succ].append(agent_id)
+
+        result: dict[str, list[str]] = {}
+        queue: list[str] = []
+        for component, cycle in zip(self._cyclic_components, self._cycles, strict=True):
+            path = list(cycle)
+            for member in component:
+                result[member] = path
+                queue.append(member)
+        for node in queue:
+            for pred in predecessors[node]:
+                if pred not in result:
+                    result[pred] = result[node]
+                    queue.append(pred)
+        return result
+
+    def find_cycle(self, agent_id: str) -> list[str] | None:
+        """Get a cycle reachable from an agent.
+
+        Args:
+            agent_id: The agent to check.
+
+        Returns:
+            The cycle path if found (e.g., ["A", "B", "C", "A"]), None if no
+            cycle is reachable from the agent.
+        """
+        if agent_id not in self._next_hop:
+            return None
+
+        path = [agent_id]
+        seen = {agent_id}
+        node = self._next_hop[agent_id]
+        while node not in seen:
+            path.append(node)
+            seen.add(node)
+            node = self._next_hop[node]
+        path.append(node)
+        return path
+
+
 def validate_sub_agents(sub_agents: list[str], storage: StorageManager) -> list[str]:
     """Validate that all sub-agent IDs exist in local agents.
 
@@ -1,21 +1,31 @@
 """Folder structure validation for agents directory."""
 
+from __future__ import annotations
+
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from lyzr_kit.storage._validation.models import ValidationIssue, ValidationResult
 from lyzr_kit.storage._validation.yaml_validator import validate_agent_yaml
 
+if TYPE_CHECKING:
+    from lyzr_kit.storage.manager import StorageManager
+
 
 class FolderValidator:
     """Validates agents folder structure (flat, no nested dirs)."""
 
-    def __init__(self, agents_dir: Path):
+    def __init__(self, agents_dir: Path, storage: StorageManager | None = None):
         """Initialize the folder validator.
 
         Args:
             agents_dir: Path to the agents directory.
+            storage: Optional StorageManager whose local agents live in agents_dir.
+                When given, schema issues come from its load pass instead of
+                parsing every YAML file a second time.
         """
         self.agents_dir = agents_dir
+        self.storage = storage
 
     def validate(self) -> ValidationResult:
         """Validate the agents folder structure and files.
@@ -79,24 +89,34 @@ class FolderValidator:
 
     def _check_yaml_schemas(self, result: ValidationResult) -> None:
         """Validate YAML files against Agent schema."""
-        for yaml_file in self.agents_dir.glob("*.yaml"):
-            validation_issue = validate_agent_yaml(yaml_file)
-            if validation_issue:
-                result.issues.append(validation_issue)
-                if validation_issue.issue_type == "invalid_yaml":
-                    result.invalid_yaml_files.append(yaml_file)
-                elif validation_issue.issue_type == "invalid_schema":
-                    result.invalid_schema_files.append(yaml_file)
-
-
-def validate_agents_folder(local_path: Path) -> ValidationResult:
+        if self.storage is not None:
+            issues = self.storage.list_local_issues()
+        else:
+            issues = [
+                issue
+                for yaml_file in self.agents_dir.glob("*.yaml")
+                if (issue := validate_agent_yaml(yaml_file))
+            ]
+
+        for validation_issue in issues:
+            result.issues.append(validation_issue)
+            if validation_issue.issue_type == "invalid_yaml":
+                result.invalid_yaml_files.append(validation_issue.path)
+            elif validation_issue.issue_type == "invalid_schema":
+                result.invalid_schema_files.append(validation_issue.path)
+
+
+def validate_agents_folder(
+    local_path: Path, storage: StorageManager | None = None
+) -> ValidationResult:
     """Validate the agents folder structure and files.
 
     Args:
         local_path: Path to the project directory.
+        storage: Optional StorageManager for local_path, to reuse its load pass.
 
     Returns:
         ValidationResult with all issues found.
     """
-    validator = FolderValidator(local_path / "agents")
+    validator = FolderValidator(local_path / "agents", storage)
     return validator.validate()
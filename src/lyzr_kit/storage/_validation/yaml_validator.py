@@ -7,34 +7,47 @@ from pydantic import ValidationError
 
 from lyzr_kit.schemas.agent import Agent
 from lyzr_kit.storage._validation.models import ValidationIssue
+from lyzr_kit.storage.yaml_codec import load_yaml
 
 
-def validate_agent_yaml(yaml_file: Path) -> ValidationIssue | None:
-    """Validate a single YAML file against the Agent schema.
+def load_agent_yaml(yaml_file: Path) -> tuple[Agent | None, ValidationIssue | None]:
+    """Load a single YAML file and validate it against the Agent schema.
+
+    This is the single parse/validate pass shared by folder validation and
+    StorageManager, so a file is never parsed twice in one command.
 
     Args:
         yaml_file: Path to the YAML file.
 
     Returns:
-        ValidationIssue if invalid, None if valid.
+        Tuple of (agent, issue).
+        - If valid: (Agent, None)
+        - If invalid: (None, ValidationIssue)
     """
     try:
         with open(yaml_file) as f:
-            data = yaml.safe_load(f)
+            data = load_yaml(f)
 
         if data is None:
-            return ValidationIssue(
+            return None, ValidationIssue(
                 issue_type="invalid_yaml",
                 path=yaml_file,
                 message=f"Empty YAML file: {yaml_file.name}",
                 hint=f"Delete '{yaml_file.name}' or add valid agent configuration",
             )
 
-        Agent.model_validate(data)
-        return None
+        return Agent.model_validate(data), None
+
+    except (OSError, UnicodeDecodeError) as e:
+        return None, ValidationIssue(
+            issue_type="invalid_yaml",
+            path=yaml_file,
+            message=f"Cannot read {yaml_file.name}: {e}",
+            hint=f"Check that '{yaml_file.name}' is readable UTF-8 text or delete it",
+        )
 
     except yaml.YAMLError as e:
-        return ValidationIssue(
+        return None, ValidationIssue(
             issue_type="invalid_yaml",
             path=yaml_file,
             message=f"Invalid YAML syntax in {yaml_file.name}: {e}",
@@ -47,7 +60,7 @@ def validate_agent_yaml(yaml_file: Path) -> ValidationIssue | None:
         if len(error_fields) > 3:
             error_summary += f" (+{len(error_fields) - 3} more)"
 
-        return ValidationIssue(
+        return None, ValidationIssue(
             issue_type="invalid_schema",
             path=yaml_file,
             message=f"Schema validation failed for {yaml_file.name}: {error_summary}",
@@ -55,6 +68,19 @@ def validate_agent_yaml(yaml_file: Path) -> ValidationIssue | None:
         )
 
 
+def validate_agent_yaml(yaml_file: Path) -> ValidationIssue | None:
+    """Validate a single YAML file against the Agent schema.
+
+    Args:
+        yaml_file: Path to the YAML file.
+
+    Returns:
+        ValidationIssue if invalid, None if valid.
+    """
+    _, issue = load_agent_yaml(yaml_file)
+    return issue
+
+
 def validate_agent_yaml_file(
     yaml_path: Path,
 ) -> tuple[Agent | None, ValidationError | None, str | None]:
@@ -68,7 +94,7 @@ def validate_agent_yaml_file(
     """
     try:
         with open(yaml_path) as f:
-            data = yaml.safe_load(f)
+            data = load_yaml(f)
 
         if data is None:
             return None, None, f"Empty YAML file: {yaml_path.name}"
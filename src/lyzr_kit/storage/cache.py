@@ -0,0 +1,276 @@
+"""Persistent on-disk cache of parsed agent YAML files."""
+
+import os
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from lyzr_kit.schemas.agent import Agent
+
+# Cache location, relative to the project directory
+CACHE_DIR = Path(".lk") / "cache"
+AGENT_CACHE_FILE = "agents.sqlite"
+
+# Bump when the Agent schema changes in a way that makes old entries invalid
+CACHE_SCHEMA_VERSION = 1
+
+# Counter holding the next local serial number
+SERIAL_COUNTER = "next_local_serial"
+
+
+class AgentCache:
+    """SQLite-backed cache of validated agents.
+
+    Each entry is keyed by the file's absolute path and stores its mtime_ns,
+    size and the schema version it was validated against. An entry is only
+    used when all three still match, so edited files are always re-parsed.
+
+    The same database holds the next local serial number, so allocating
+    serials is atomic across concurrent lk processes, and the payload hash
+    last pushed for each platform agent, so bulk syncs can skip unchanged
+    agents.
+
+    Entries for files that were deleted, and pushed hashes for platform
+    agents no longer referenced by any local agent, are pruned whenever a
+    directory is rescanned (see prune()).
+
+    The cache is best-effort: any database or filesystem error disables it
+    for the rest of the process and callers fall back to parsing YAML.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the cache.
+
+        Args:
+            path: Path to the SQLite database file (created on first write).
+        """
+        self.path = path
+        self._entries: dict[str, tuple[int, int, int, str]] | None = None
+        self._pending: dict[str, tuple[int, int, int, str]] = {}
+        self._disabled = False
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS agents ("
+            "path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, "
+            "schema_version INTEGER, data TEXT)"
+        )
+        conn.execute("CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER)")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS pushed (platform_agent_id TEXT PRIMARY KEY, payload_hash TEXT)"
+        )
+        return conn
+
+    def _load_entries(self) -> dict[str, tuple[int, int, int, str]]:
+        """Read every cache entry with a single query."""
+        if self._entries is None:
+            self._entries = {}
+            if self.path.exists():
+                try:
+                    with closing(self._connect()) as conn:
+                        rows = conn.execute(
+                            "SELECT path, mtime_ns, size, schema_version, data FROM agents"
+                        ).fetchall()
+                    self._entries = {row[0]: row[1:] for row in rows}
+                except sqlite3.Error:
+                    self._disabled = True
+        return self._entries
+
+    def get(self, file: Path, stat: os.stat_result) -> Agent | None:
+        """Get the cached agent for a file, if the entry is still fresh.
+
+        Args:
+            file: Path to the agent YAML file.
+            stat: Current stat result for the file.
+
+        Returns:
+            Agent if a fresh entry exists, None otherwise.
+        """
+        if self._disabled:
+            return None
+
+        entry = self._load_entries().get(str(file.resolve()))
+        if entry is None:
+            return None
+
+        mtime_ns, size, schema_version, data = entry
+        if (mtime_ns, size, schema_version) != (
+            stat.st_mtime_ns,
+            stat.st_size,
+            CACHE_SCHEMA_VERSION,
+        ):
+            return None
+
+        try:
+            return Agent.model_validate_json(data)
+        except ValidationError:
+            return None
+
+    def put(self, file: Path, stat: os.stat_result, agent: Agent) -> None:
+        """Record a freshly parsed agent. Written to disk on flush().
+
+        Args:
+            file: Path to the agent YAML file.
+            stat: Stat result taken before the file was read.
+            agent: The validated agent.
+        """
+        if self._disabled:
+            return
+
+        entry = (stat.st_mtime_ns, stat.st_size, CACHE_SCHEMA_VERSION, agent.model_dump_json())
+        key = str(file.resolve())
+        self._load_entries()[key] = entry
+        self._pending[key] = entry
+
+    def flush(self) -> None:
+        """Write pending entries to disk in a single transaction."""
+        if self._disabled or not self._pending:
+            return
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with closing(self._connect()) as conn, conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO agents VALUES (?, ?, ?, ?, ?)",
+                    [(key, *entry) for key, entry in self._pending.items()],
+                )
+            self._pending.clear()
+        except (sqlite3.Error, OSError):
+            self._disabled = True
+
+    def prune(
+        self, directory: Path, files: list[Path], platform_agent_ids: set[str] | None = None
+    ) -> None:
+        """Delete entries for agents that are gone, in a single transaction.
+
+        Args:
+            directory: Directory that was just scanned.
+            files: YAML files currently in it; entries for other files in
+                the directory are deleted.
+            platform_agent_ids: Platform agent IDs still referenced locally. If
+                given, pushed hashes for every other platform agent are deleted.
+        """
+        if self._disabled:
+            return
+
+        entries = self._load_entries()
+        prefix = str(directory.resolve()) + os.sep
+        present = {str(file.resolve()) for file in files}
+        stale = [
+            key
+            for key in entries
+            if key.startswith(prefix) and os.sep not in key[len(prefix) :] and key not in present
+        ]
+        if not stale and platform_agent_ids is None:
+            return
+        if not self.path.exists():
+            return
+
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.executemany("DELETE FROM agents WHERE path = ?", [(key,) for key in stale])
+                if platform_agent_ids is not None:
+                    rows = conn.execute("SELECT platform_agent_id FROM pushed").fetchall()
+                    conn.executemany(
+                        "DELETE FROM pushed WHERE platform_agent_id = ?",
+                        [row for row in rows if row[0] not in platform_agent_ids],
+                    )
+        except sqlite3.Error:
+            self._disabled = True
+            return
+        for key in stale:
+            del entries[key]
+            self._pending.pop(key, None)
+
+    def peek_serial(self) -> int | None:
+        """Get the stored next local serial number without taking it.
+
+        Returns:
+            The stored counter, or None if it isn't set or the cache is disabled.
+        """
+        if self._disabled or not self.path.exists():
+            return None
+
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    "SELECT value FROM counters WHERE name = ?", (SERIAL_COUNTER,)
+                ).fetchone()
+            return int(row[0]) if row else None
+        except sqlite3.Error:
+            self._disabled = True
+            return None
+
+    def allocate_serial(self, floor: int) -> int | None:
+        """Atomically take the next local serial number.
+
+        Args:
+            floor: Lowest serial that may be returned (one past the highest
+                serial currently on disk).
+
+        Returns:
+            The allocated serial, or None if the cache is disabled.
+        """
+        if self._disabled:
+            return None
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with closing(self._connect()) as conn:
+                conn.isolation_level = None
+                # Take the write lock before reading so concurrent lk
+                # processes can't allocate the same serial
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    row = conn.execute(
+                        "SELECT value FROM counters WHERE name = ?", (SERIAL_COUNTER,)
+                    ).fetchone()
+                    serial = max(floor, int(row[0]) if row else 1)
+                    conn.execute(
+                        "INSERT OR REPLACE INTO counters VALUES (?, ?)",
+                        (SERIAL_COUNTER, serial + 1),
+                    )
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+            return serial
+        except (sqlite3.Error, OSError):
+            self._disabled = True
+            return None
+
+    def get_pushed_hashes(self) -> dict[str, str]:
+        """Get the payload hash last pushed for every platform agent.
+
+        Returns:
+            Platform agent ID -> payload hash (empty if the cache is disabled).
+        """
+        if self._disabled or not self.path.exists():
+            return {}
+
+        try:
+            with closing(self._connect()) as conn:
+                rows = conn.execute("SELECT platform_agent_id, payload_hash FROM pushed").fetchall()
+            return {row[0]: row[1] for row in rows}
+        except sqlite3.Error:
+            self._disabled = True
+            return {}
+
+    def record_pushed_hashes(self, hashes: dict[str, str]) -> None:
+        """Record the payload hashes just pushed, in a single transaction.
+
+        Args:
+            hashes: Platform agent ID -> payload hash.
+        """
+        if self._disabled or not hashes:
+            return
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with closing(self._connect()) as conn, conn:
+                conn.executemany("INSERT OR REPLACE INTO pushed VALUES (?, ?)", hashes.items())
+        except (sqlite3.Error, OSError):
+            self._disabled = True
@@ -0,0 +1,140 @@
+"""Materialized sub-agent graph with forward and reverse adjacency."""
+
+
+class SubAgentGraph:
+    """Sub-agent references between agents, indexed in both directions.
+
+    Each node maps to the sub-agent IDs it references (forward edges), and
+    each referenced ID maps back to the nodes that reference it (reverse
+    edges), so both "what does X use" and "who uses X" are O(degree).
+
+    Node keys are chosen by the owner. AgentIndex keys nodes by filename, so
+    several files declaring the same agent ID are each tracked.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty graph."""
+        self._children: dict[str, list[str]] = {}
+        # Insertion-ordered sets of referencing nodes
+        self._parents: dict[str, dict[str, None]] = {}
+
+    def __contains__(self, node: object) -> bool:
+        return node in self._children
+
+    def set_children(self, node: str, children: list[str]) -> None:
+        """Add a node or replace its outgoing references."""
+        self.remove(node)
+        self._children[node] = list(children)
+        for child in children:
+            self._parents.setdefault(child, {})[node] = None
+
+    def remove(self, node: str) -> None:
+        """Remove a node and its outgoing references, if present."""
+        for child in self._children.pop(node, []):
+            parents = self._parents.get(child)
+            if parents is None:
+                continue
+            parents.pop(node, None)
+            if not parents:
+                del self._parents[child]
+
+    def children(self, node: str) -> list[str]:
+        """Get the sub-agent IDs a node references, in declaration order."""
+        return list(self._children.get(node, []))
+
+    def parents(self, child: str) -> list[str]:
+        """Get the nodes that reference a sub-agent ID."""
+        return list(self._parents.get(child, {}))
+
+
+def strongly_connected_components(adjacency: dict[str, list[str]]) -> list[list[str]]:
+    """Find the strongly connected components of a graph (Tarjan's algorithm).
+
+    Iterative, so deep sub-agent chains can't hit the recursion limit.
+
+    Args:
+        adjacency: Node -> successor nodes. Every successor must be a key.
+
+    Returns:
+        Components in reverse topological order (a component comes after
+        every component it points to). Each lists its first-visited node first.
+    """
+    index: dict[str, int] = {}
+    lowlink: dict[str, int] = {}
+    on_stack: set[str] = set()
+    stack: list[str] = []
+    components: list[list[str]] = []
+
+    for start in adjacency:
+        if start in index:
+            continue
+        index[start] = lowlink[start] = len(index)
+        stack.append(start)
+        on_stack.add(start)
+        work = [(start, iter(adjacency[start]))]
+
+        while work:
+            node, successors = work[-1]
+            for succ in successors:
+                if succ not in index:
+                    index[succ] = lowlink[succ] = len(index)
+                    stack.append(succ)
+                    on_stack.add(succ)
+                    work.append((succ, iter(adjacency[succ])))
+                    break
+                if succ in on_stack:
+                    lowlink[node] = min(lowlink[node], index[succ])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component: list[str] = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    component.reverse()
+                    components.append(component)
+
+    return components
+
+
+def count_descendants(adjacency: dict[str, list[str]]) -> dict[str, int]:
+    """Count the unique sub-agents reachable from every node in one pass.
+
+    Reachable sets are computed once per strongly connected component, in
+    post-order, and memoized as bitsets, so shared sub-trees are only walked
+    once and cycles terminate. References to unknown IDs count as leaves.
+
+    Args:
+        adjacency: Agent ID -> sub-agent IDs.
+
+    Returns:
+        Agent ID -> number of distinct agents reachable from it, not counting
+        the agent itself, for every key of adjacency.
+    """
+    graph = {node: list(children) for node, children in adjacency.items()}
+    for children in adjacency.values():
+        for child in children:
+            graph.setdefault(child, [])
+    bit = {node: 1 << i for i, node in enumerate(graph)}
+
+    reach: dict[str, int] = {}
+    for component in strongly_connected_components(graph):
+        members = set(component)
+        mask = 0
+        for node in component:
+            for child in graph[node]:
+                if child not in members:
+                    mask |= bit[child] | reach[child]
+        if len(component) > 1 or component[0] in graph[component[0]]:
+            for node in component:
+                mask |= bit[node]
+        for node in component:
+            reach[node] = mask
+
+    return {node: (reach[node] & ~bit[node]).bit_count() for node in adjacency}
@@ -0,0 +1,195 @@
+"""In-memory agent index for fast lookups by ID."""
+
+from typing import TypeVar
+
+from lyzr_kit.schemas.agent import Agent
+from lyzr_kit.storage._validation.models import ValidationIssue
+from lyzr_kit.storage.graph import SubAgentGraph
+
+_K = TypeVar("_K", str, int)
+
+
+# (mtime_ns, size) of an indexed file - the same key the persistent cache uses
+FileKey = tuple[int, int]
+
+
+class AgentIndex:
+    """Index of the agents loaded from a single directory.
+
+    Holds every successfully loaded agent keyed by filename (in scan order)
+    plus ID -> filenames and serial -> filenames maps, so lookups by ID are
+    O(1) once built. When several files declare the same ID, the first one
+    scanned wins, matching the order a linear search over the directory would
+    use; removing it promotes the next file without another scan.
+
+    The directory mtime recorded at scan time lets the owner detect files
+    added or removed by another process (or another StorageManager), and the
+    (mtime_ns, size) key of every file lets it detect files edited in place.
+
+    A SubAgentGraph over the indexed files is kept in step with the index,
+    so finding the agents that reference an ID doesn't need a full scan.
+    """
+
+    def __init__(
+        self,
+        entries: list[tuple[str, Agent]] | None = None,
+        mtime_ns: int | None = None,
+        issues: list[tuple[str, ValidationIssue]] | None = None,
+        file_keys: dict[str, FileKey] | None = None,
+    ) -> None:
+        """Initialize the index.
+
+        Args:
+            entries: (filename, agent) pairs in directory scan order.
+            mtime_ns: Modification time of the scanned directory, if it exists.
+            issues: (filename, issue) pairs for files that failed to load.
+            file_keys: Filename -> (mtime_ns, size) taken before each file was read.
+        """
+        self.mtime_ns = mtime_ns
+        self._by_file: dict[str, Agent] = {}
+        self._files_by_id: dict[str, list[str]] = {}
+        self._files_by_serial: dict[int, list[str]] = {}
+        # Highest serial in the index, or None when it needs recomputing
+        self._max_serial: int | None = 0
+        self._issues: dict[str, ValidationIssue] = dict(issues or [])
+        self._file_keys: dict[str, FileKey] = dict(file_keys or {})
+        self.graph = SubAgentGraph()
+        for filename, agent in entries or []:
+            self._by_file[filename] = agent
+            self._add_keys(filename, agent)
+
+    def __len__(self) -> int:
+        return len(self._by_file)
+
+    def __contains__(self, agent_id: object) -> bool:
+        return agent_id in self._files_by_id
+
+    def get(self, agent_id: str) -> Agent | None:
+        """Get the agent with the given ID, or None if not indexed."""
+        filename = self.file_of(agent_id)
+        return self._by_file[filename] if filename is not None else None
+
+    def file_of(self, agent_id: str) -> str | None:
+        """Get the file the agent with the given ID is served from, or None."""
+        files = self._files_by_id.get(agent_id)
+        return files[0] if files else None
+
+    def agent_in(self, filename: str) -> Agent | None:
+        """Get the agent stored in a file, or None if it isn't indexed."""
+        return self._by_file.get(filename)
+
+    def agents(self) -> list[Agent]:
+        """Get all indexed agents in scan order."""
+        return list(self._by_file.values())
+
+    def get_by_serial(self, serial: int) -> Agent | None:
+        """Get the agent with the given serial number, or None if not indexed."""
+        filename = self.file_of_serial(serial)
+        return self._by_file[filename] if filename is not None else None
+
+    def file_of_serial(self, serial: int) -> str | None:
+        """Get the file the agent with the given serial is served from, or None."""
+        files = self._files_by_serial.get(serial)
+        return files[0] if files else None
+
+    def max_serial(self) -> int:
+        """Get the highest serial number in the index (0 if there is none)."""
+        if self._max_serial is None:
+            self._max_serial = max(self._files_by_serial, default=0)
+        return self._max_serial
+
+    def referrers(self, agent_id: str) -> list[Agent]:
+        """Get the agents that list agent_id in their sub_agents."""
+        return [self._by_file[filename] for filename in self.graph.parents(agent_id)]
+
+    def sub_agents(self, agent_id: str) -> list[str]:
+        """Get the sub-agent IDs of the agent with the given ID that are also indexed."""
+        filename = self.file_of(agent_id)
+        if filename is None:
+            return []
+        return [sub_id for sub_id in self.graph.children(filename) if sub_id in self._files_by_id]
+
+    def issues(self) -> list[ValidationIssue]:
+        """Get the validation issues of files that failed to load, in scan order."""
+        return list(self._issues.values())
+
+    def file_keys(self) -> dict[str, FileKey]:
+        """Get the (mtime_ns, size) key recorded for every scanned file."""
+        return dict(self._file_keys)
+
+    def file_key(self, filename: str) -> FileKey | None:
+        """Get the (mtime_ns, size) key recorded for a file, or None if unknown."""
+        return self._file_keys.get(filename)
+
+    def put(self, filename: str, agent: Agent, file_key: FileKey | None = None) -> None:
+        """Add or replace the agent stored in a file.
+
+        Args:
+            filename: File the agent was loaded from or saved to.
+            agent: The agent stored in the file.
+            file_key: The file's (mtime_ns, size), if known.
+        """
+        self._issues.pop(filename, None)
+        previous = self._by_file.get(filename)
+        if previous is not None and (previous.id, previous.serial) != (agent.id, agent.serial):
+            self.discard(filename)
+            previous = None
+        self._by_file[filename] = agent
+        if previous is None:
+            self._add_keys(filename, agent)
+        else:
+            self.graph.set_children(filename, agent.sub_agents)
+        self._set_file_key(filename, file_key)
+
+    def put_issue(
+        self, filename: str, issue: ValidationIssue, file_key: FileKey | None = None
+    ) -> None:
+        """Record that a file no longer loads, dropping any agent it held.
+
+        Args:
+            filename: File that failed to load.
+            issue: Why it failed.
+            file_key: The file's (mtime_ns, size), if known.
+        """
+        self.discard(filename)
+        self._issues[filename] = issue
+        self._set_file_key(filename, file_key)
+
+    def discard(self, filename: str) -> None:
+        """Remove the agent stored in a file, if indexed."""
+        self._issues.pop(filename, None)
+        self._file_keys.pop(filename, None)
+        self.graph.remove(filename)
+        agent = self._by_file.pop(filename, None)
+        if agent is None:
+            return
+
+        # Another file may declare the same ID or serial - the next one in scan order takes over
+        _remove_file(self._files_by_id, agent.id, filename)
+        if agent.serial is not None:
+            _remove_file(self._files_by_serial, agent.serial, filename)
+            if agent.serial == self._max_serial and agent.serial not in self._files_by_serial:
+                self._max_serial = None
+
+    def _add_keys(self, filename: str, agent: Agent) -> None:
+        """Index a stored agent by ID, serial and sub-agent references."""
+        self._files_by_id.setdefault(agent.id, []).append(filename)
+        if agent.serial is not None:
+            self._files_by_serial.setdefault(agent.serial, []).append(filename)
+            if self._max_serial is not None and agent.serial > self._max_serial:
+                self._max_serial = agent.serial
+        self.graph.set_children(filename, agent.sub_agents)
+
+    def _set_file_key(self, filename: str, file_key: FileKey | None) -> None:
+        if file_key is None:
+            self._file_keys.pop(filename, None)
+        else:
+            self._file_keys[filename] = file_key
+
+
+def _remove_file(files_by_key: dict[_K, list[str]], key: _K, filename: str) -> None:
+    """Remove a filename from a multimap entry, dropping the entry once empty."""
+    files = files_by_key[key]
+    files.remove(filename)
+    if not files:
+        del files_by_key[key]
@@ -0,0 +1,90 @@
+"""Append-only journal of the platform agents a clone plan has created."""
+
+import json
+import os
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+
+# Journal location, relative to the project directory
+JOURNAL_DIR = Path(".lk") / "journal"
+
+
+@dataclass
+class JournalEntry:
+    """One agent created on the platform by a clone plan."""
+
+    source_id: str  # Built-in agent ID
+    target_id: str  # New local agent ID
+    agent_id: str  # Platform agent ID
+    env_id: str
+    endpoint: str
+    app_id: str | None = None
+
+
+class CloneJournal:
+    """JSON Lines journal of completed creates for one clone plan.
+
+    An entry is appended (and fsynced) as soon as the platform returns an
+    agent, before the local YAML is written, so a failed or interrupted
+    clone can be resumed without creating the same platform agent twice.
+    The journal is deleted once the whole plan has finished.
+
+    A line cut short by a crash is ignored when loading.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the journal.
+
+        Args:
+            path: Path to the .jsonl file (created on the first record).
+        """
+        self.path = path
+
+    @classmethod
+    def for_plan(cls, project_dir: Path, plan_id: str) -> "CloneJournal":
+        """Get the journal of a plan in a project directory."""
+        return cls(project_dir / JOURNAL_DIR / f"{plan_id}.jsonl")
+
+    def exists(self) -> bool:
+        """Check if an earlier run left this journal behind."""
+        return self.path.exists()
+
+    def load(self) -> dict[str, JournalEntry]:
+        """Read the completed creates.
+
+        Returns:
+            Source agent ID -> entry, for every intact line.
+        """
+        entries: dict[str, JournalEntry] = {}
+        try:
+            lines = self.path.read_text(encoding="utf-8").splitlines()
+        except OSError:
+            return entries
+
+        names = {f.name for f in fields(JournalEntry)}
+        for line in lines:
+            try:
+                data = json.loads(line)
+                entry = JournalEntry(**{k: v for k, v in data.items() if k in names})
+            except (ValueError, TypeError, AttributeError):
+                continue
+            entries[entry.source_id] = entry
+        return entries
+
+    def record(self, entry: JournalEntry) -> None:
+        """Append a completed create and flush it to disk."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        line = json.dumps(asdict(entry), separators=(",", ":")) + "\n"
+        with self.path.open("ab+") as f:
+            # Start on a fresh line if a crash left the last one unterminated
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    line = "\n" + line
+            f.write(line.encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+
+    def remove(self) -> None:
+        """Delete the journal, if present."""
+        self.path.unlink(missing_ok=True)
@@ -0,0 +1,98 @@
+"""Parallel loading of agent YAML files for large agents/ directories."""
+
+import os
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+from lyzr_kit.schemas.agent import Agent
+from lyzr_kit.storage._validation.models import ValidationIssue
+from lyzr_kit.storage._validation.yaml_validator import load_agent_yaml
+from lyzr_kit.storage.yaml_codec import HAS_LIBYAML
+
+# Environment variable overriding the worker count ("auto" or unset: pick it,
+# 1: load serially)
+LOAD_WORKERS_ENV = "LK_LOAD_WORKERS"
+
+# Below this many files to parse, pool startup costs more than it saves
+PARALLEL_THRESHOLD = 200
+
+# Cap on automatically chosen workers
+MAX_AUTO_WORKERS = 8
+
+LoadResult = tuple[Agent | None, ValidationIssue | None]
+
+
+def read_agent_file(path: Path) -> LoadResult:
+    """Load one agent file (see load_agent_yaml).
+
+    Top-level so it can be sent to process pool workers. Files that can't be
+    read, decoded, parsed or validated come back with their ValidationIssue.
+    """
+    return load_agent_yaml(path)
+
+
+def get_load_workers(file_count: int) -> int:
+    """Pick the number of workers for loading file_count files.
+
+    LK_LOAD_WORKERS set to a positive integer is used as is (1 loads
+    serially). Unset, "auto" or anything else picks the count: batches
+    below PARALLEL_THRESHOLD load serially, larger ones use one worker per
+    CPU, bounded by MAX_AUTO_WORKERS. Never more workers than files.
+
+    Returns:
+        Worker count; 1 means load serially in the calling thread.
+    """
+    override = os.getenv(LOAD_WORKERS_ENV, "").strip()
+    if override and override != "auto":
+        try:
+            return max(1, min(int(override), file_count))
+        except ValueError:
+            pass
+
+    if file_count < PARALLEL_THRESHOLD:
+        return 1
+    return max(1, min(os.cpu_count() or 1, MAX_AUTO_WORKERS, file_count))
+
+
+def _create_executor(workers: int) -> Executor:
+    """Create the pool type that suits the active YAML parser.
+
+    With libyaml, parsing is cheap enough that process startup and result
+    pickling would dominate, so threads are used to overlap file I/O. The
+    pure-Python parser holds the GIL for the whole parse and needs separate
+    processes to scale.
+    """
+    if HAS_LIBYAML:
+        return ThreadPoolExecutor(max_workers=workers)
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+def load_agent_files(
+    paths: list[Path],
+    workers: int | None = None,
+    create_executor: Callable[[int], Executor] = _create_executor,
+) -> list[LoadResult]:
+    """Load agent files, fanning out across a pool for large batches.
+
+    Args:
+        paths: Agent YAML files to load.
+        workers: Worker count. Defaults to get_load_workers(len(paths)).
+        create_executor: Factory for the pool (for tests and benchmarks).
+
+    Returns:
+        One (agent, issue) result per path, in the same order as paths.
+    """
+    if workers is None:
+        workers = get_load_workers(len(paths))
+    if workers <= 1 or len(paths) <= 1:
+        return [read_agent_file(path) for path in paths]
+
+    chunksize = max(1, len(paths) // (workers * 4))
+    try:
+        with create_executor(workers) as executor:
+            return list(executor.map(read_agent_file, paths, chunksize=chunksize))
+    except (BrokenProcessPool, OSError):
+        # Pools can be unavailable (e.g. sandboxed or frozen interpreters)
+        return [read_agent_file(path) for path in paths]
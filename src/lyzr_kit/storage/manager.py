@@ -1,5 +1,7 @@
 """Core storage manager for lyzr-kit resources."""
 
+import os
+from collections.abc import Callable
 from pathlib import Path
 from typing import Literal
 
@@ -7,6 +9,12 @@ import yaml
 from pydantic import ValidationError
 
 from lyzr_kit.schemas.agent import Agent
+from lyzr_kit.storage._validation.models import ValidationIssue
+from lyzr_kit.storage.cache import AGENT_CACHE_FILE, CACHE_DIR, AgentCache
+from lyzr_kit.storage.index import AgentIndex, FileKey
+from lyzr_kit.storage.loader import LoadResult, load_agent_files, read_agent_file
+from lyzr_kit.storage.snapshot import SNAPSHOT_FILE, load_snapshot
+from lyzr_kit.storage.yaml_codec import dump_yaml, load_yaml
 
 # Built-in resources bundled with the package
 COLLECTION_DIR = Path(__file__).parent.parent / "collection"
@@ -30,23 +38,38 @@ class StorageManager:
         self,
         builtin_path: str | Path | None = None,
         local_path: str | Path | None = None,
+        use_cache: bool = True,
     ) -> None:
         """Initialize storage manager.
 
         Args:
             builtin_path: Path to built-in resources. Defaults to package collection.
             local_path: Path to local resources. Defaults to current working directory.
+            use_cache: Reuse parsed agents from .lk/cache/ across runs. Only enabled
+                inside a project (when the local agents/ directory exists).
         """
         self.builtin_path = Path(builtin_path) if builtin_path else COLLECTION_DIR
         try:
             self.local_path = Path(local_path) if local_path else Path.cwd()
         except (FileNotFoundError, OSError):
             self.local_path = Path(".")
+        # Per-source agent indexes, built lazily on first lookup
+        self._indexes: dict[str, AgentIndex] = {}
+        # Persistent parse cache shared by every lk invocation in this project
+        self._cache: AgentCache | None = None
+        self._use_cache = use_cache
+        if use_cache and (self.local_path / "agents").is_dir():
+            self._cache = AgentCache(self.local_path / CACHE_DIR / AGENT_CACHE_FILE)
+        # Next local serial when there is no cache to hold the counter
+        self._next_serial = 1
 
     def _ensure_local_dir(self, resource_type: str) -> Path:
         """Ensure local directory exists for resource type."""
         path = self.local_path / resource_type
         path.mkdir(parents=True, exist_ok=True)
+        # Creating agents/ makes this a project, so start caching
+        if resource_type == "agents" and self._use_cache and self._cache is None:
+            self._cache = AgentCache(self.local_path / CACHE_DIR / AGENT_CACHE_FILE)
         return path
 
     def _list_yaml_files(self, directory: Path) -> list[Path]:
@@ -58,6 +81,204 @@ class StorageManager:
         except OSError:
             return []
 
+    def _agents_dir(self, source: Literal["built-in", "local"]) -> Path:
+        """Get the agents directory for a source."""
+        base = self.builtin_path if source == "built-in" else self.local_path
+        return base / "agents"
+
+    def _dir_mtime_ns(self, directory: Path) -> int | None:
+        """Get a directory's modification time, or None if it doesn't exist."""
+        try:
+            return directory.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _file_key(self, path: str | Path) -> FileKey | None:
+        """Get a file's (mtime_ns, size), or None if it can't be stat'ed."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _get_index(self, source: Literal["built-in", "local"]) -> AgentIndex:
+        """Get the agent index for a source, scanning its directory once.
+
+        The index is kept current by save_agent and delete_agent, so every
+        later lookup is served from memory instead of re-parsing YAML files.
+        It is rebuilt if files were added or removed behind our back; files
+        edited in place are re-read by _lookup and _get_fresh_index.
+        Built-in agents come from the packaged snapshot when it is up to date.
+        """
+        directory = self._agents_dir(source)
+        mtime_ns = self._dir_mtime_ns(directory)
+        index = self._indexes.get(source)
+        if index is None or index.mtime_ns != mtime_ns:
+            entries = None
+            issues: list[tuple[str, ValidationIssue]] = []
+            file_keys: dict[str, FileKey] = {}
+            if source == "built-in":
+                entries = load_snapshot(directory, self.builtin_path / SNAPSHOT_FILE)
+                for filename, _ in entries or []:
+                    file_key = self._file_key(directory / filename)
+                    if file_key is not None:
+                        file_keys[filename] = file_key
+            if entries is None:
+                entries, issues, file_keys = self._scan_agents(directory)
+            index = AgentIndex(entries, mtime_ns, issues, file_keys)
+            self._indexes[source] = index
+        return index
+
+    def _get_fresh_index(self, source: Literal["built-in", "local"]) -> AgentIndex:
+        """Get the agent index for a source with every file checked for edits.
+
+        Costs one stat per file, so it is used where the whole index is read
+        anyway (listing agents or issues) rather than for single lookups.
+        """
+        index = self._get_index(source)
+        directory = self._agents_dir(source)
+        for filename, file_key in index.file_keys().items():
+            if self._file_key(os.path.join(directory, filename)) != file_key:
+                self._refresh_file(index, directory, filename)
+        return index
+
+    def _refresh_file(self, index: AgentIndex, directory: Path, filename: str) -> bool:
+        """Re-read an indexed file if its (mtime_ns, size) changed since it was read.
+
+        Returns:
+            True if the file had changed (the index now holds its new
+            contents, its issue, or nothing if it is gone), False otherwise.
+        """
+        file_key = self._file_key(os.path.join(directory, filename))
+        if file_key is not None and file_key == index.file_key(filename):
+            return False
+
+        if file_key is None:
+            index.discard(filename)
+            return True
+        agent, issue = self._read_agent(directory / filename)
+        if agent is not None:
+            index.put(filename, agent, file_key)
+        elif issue is not None:
+            index.put_issue(filename, issue, file_key)
+        return True
+
+    def _lookup(
+        self, source: Literal["built-in", "local"], find: Callable[[AgentIndex], str | None]
+    ) -> Agent | None:
+        """Get an indexed agent, re-reading its file first if it was edited in place.
+
+        Only the one file is stat'ed. If the edit means it no longer matches,
+        the file that takes its place is checked in turn.
+
+        Args:
+            source: "built-in" or "local".
+            find: Returns the file serving the wanted agent from an index.
+
+        Returns:
+            The indexed agent (not a copy), or None if no file matches.
+        """
+        index = self._get_index(source)
+        directory = self._agents_dir(source)
+        filename = find(index)
+        while filename is not None and self._refresh_file(index, directory, filename):
+            filename = find(index)
+        return index.agent_in(filename) if filename is not None else None
+
+    def _scan_agents(
+        self, directory: Path
+    ) -> tuple[list[tuple[str, Agent]], list[tuple[str, ValidationIssue]], dict[str, FileKey]]:
+        """Load every agent YAML in a directory.
+
+        Files missing from the persistent cache are parsed together, in
+        parallel when there are enough of them (see storage.loader).
+
+        Returns:
+            Tuple of (entries, issues, file_keys): (filename, agent) pairs for
+            valid files and (filename, issue) pairs for invalid ones, in scan
+            order, plus the (mtime_ns, size) of each file taken before reading.
+        """
+        files = self._list_yaml_files(directory)
+        results: list[LoadResult] = []
+        misses: list[tuple[int, os.stat_result | None]] = []
+        file_keys: dict[str, FileKey] = {}
+        for i, yaml_file in enumerate(files):
+            cached, stat = self._get_cached_agent(yaml_file)
+            results.append((cached, None))
+            if stat is not None:
+                file_keys[yaml_file.name] = stat.st_mtime_ns, stat.st_size
+            if cached is None:
+                misses.append((i, stat))
+
+        loaded = load_agent_files([files[i] for i, _ in misses])
+        for (i, stat), (agent, issue) in zip(misses, loaded, strict=True):
+            results[i] = (agent, issue)
+            if agent is not None and self._cache is not None and stat is not None:
+                self._cache.put(files[i], stat, agent)
+        if self._cache is not None:
+            self._cache.flush()
+
+        entries: list[tuple[str, Agent]] = []
+        issues: list[tuple[str, ValidationIssue]] = []
+        for yaml_file, (agent, issue) in zip(files, results, strict=True):
+            if agent:
+                entries.append((yaml_file.name, agent))
+            elif issue:
+                issues.append((yaml_file.name, issue))
+
+        if self._cache is not None:
+            # Forget deleted files, and pushed hashes of agents no longer held locally
+            platform_ids = None
+            if directory == self._agents_dir("local"):
+                platform_ids = {a.platform_agent_id for _, a in entries if a.platform_agent_id}
+            self._cache.prune(directory, files, platform_ids)
+        return entries, issues, file_keys
+
+    def _fresh_local_index(self) -> AgentIndex | None:
+        """Get the local index if it is built and still matches the directory.
+
+        A stale index is dropped so the next lookup rescans the directory.
+        """
+        index = self._indexes.get("local")
+        if index is not None and index.mtime_ns != self._dir_mtime_ns(self._agents_dir("local")):
+            del self._indexes["local"]
+            return None
+        return index
+
+    def _get_cached_agent(self, path: Path) -> tuple[Agent | None, os.stat_result | None]:
+        """Look up a file in the persistent cache.
+
+        Returns:
+            Tuple of (cached agent or None, stat taken before any read). The
+            stat is None when the file can't be stat'ed.
+        """
+        try:
+            stat = path.stat()
+        except OSError:
+            return None, None
+        if self._cache is None:
+            return None, stat
+        return self._cache.get(path, stat), stat
+
+    def _read_agent(self, path: Path) -> LoadResult:
+        """Load an agent YAML file in a single parse/validate pass.
+
+        Unchanged files are served from the persistent cache. Files that fail to
+        load yield the same ValidationIssue the folder validator reports, so
+        validation and loading share one pass over the directory.
+
+        Returns:
+            Tuple of (agent, issue) - exactly one is set.
+        """
+        cached, stat = self._get_cached_agent(path)
+        if cached is not None:
+            return cached, None
+
+        agent, issue = read_agent_file(path)
+        if agent is not None and self._cache is not None and stat is not None:
+            self._cache.put(path, stat, agent)
+        return agent, issue
+
     def _load_agent(self, path: Path, raise_on_error: bool = False) -> Agent | None:
         """Load an agent from a YAML file.
 
@@ -72,33 +293,29 @@ class StorageManager:
         Raises:
             AgentLoadError: If raise_on_error=True and loading fails.
         """
+        if not raise_on_error:
+            return self._read_agent(path)[0]
+
         try:
             with open(path) as f:
-                data = yaml.safe_load(f)
+                data = load_yaml(f)
 
             if data is None:
-                if raise_on_error:
-                    raise AgentLoadError(f"Empty YAML file: {path.name}", yaml_error=True)
-                return None
+                raise AgentLoadError(f"Empty YAML file: {path.name}", yaml_error=True)
 
             return Agent.model_validate(data)
 
         except yaml.YAMLError as e:
-            if raise_on_error:
-                raise AgentLoadError(f"Invalid YAML syntax: {e}", yaml_error=True) from e
-            return None
+            raise AgentLoadError(f"Invalid YAML syntax: {e}", yaml_error=True) from e
 
         except ValidationError as e:
-            if raise_on_error:
-                raise AgentLoadError(
-                    f"Schema validation failed for {path.name}", schema_error=e
-                ) from e
-            return None
+            raise AgentLoadError(f"Schema validation failed for {path.name}", schema_error=e) from e
+
+        except AgentLoadError:
+            raise
 
         except Exception as e:
-            if raise_on_error:
-                raise AgentLoadError(f"Failed to load {path.name}: {e}") from e
-            return None
+            raise AgentLoadError(f"Failed to load {path.name}: {e}") from e
 
     def list_agents(
         self, source: Literal["all", "built-in", "local"] = "all"
@@ -110,25 +327,20 @@ class StorageManager:
 
         Returns:
             List of tuples containing (agent, source_type) where source_type is
-            "built-in" or "local". Sorted by serial number.
+            "built-in" or "local". Sorted by serial number. Agents are copies,
+            so callers may reassign their fields without affecting the index.
         """
         agents: list[tuple[Agent, str]] = []
 
         # Built-in agents
         if source in ("all", "built-in"):
-            builtin_dir = self.builtin_path / "agents"
-            for yaml_file in self._list_yaml_files(builtin_dir):
-                agent = self._load_agent(yaml_file)
-                if agent:
-                    agents.append((agent, "built-in"))
+            for agent in self._get_fresh_index("built-in").agents():
+                agents.append((agent.model_copy(), "built-in"))
 
         # Local agents
         if source in ("all", "local"):
-            local_dir = self.local_path / "agents"
-            for yaml_file in self._list_yaml_files(local_dir):
-                agent = self._load_agent(yaml_file)
-                if agent:
-                    agents.append((agent, "local"))
+            for agent in self._get_fresh_index("local").agents():
+                agents.append((agent.model_copy(), "local"))
 
         # Sort: built-in first (by serial), then local (by serial)
         def sort_key(item: tuple[Agent, str]) -> tuple[int, int]:
@@ -144,32 +356,80 @@ class StorageManager:
     def get_agent(self, agent_id: str) -> Agent | None:
         """Get an agent by ID from local or built-in directory.
 
-        Searches all YAML files and matches by the 'id' field inside the file.
+        Matches by the 'id' field inside the file, not the filename.
         Local agents take precedence over built-in agents.
         """
-        # Check local first
-        local_dir = self.local_path / "agents"
-        for yaml_file in self._list_yaml_files(local_dir):
-            agent = self._load_agent(yaml_file)
-            if agent and agent.id == agent_id:
-                return agent
 
-        # Check built-in
-        builtin_dir = self.builtin_path / "agents"
-        for yaml_file in self._list_yaml_files(builtin_dir):
-            agent = self._load_agent(yaml_file)
-            if agent and agent.id == agent_id:
-                return agent
+        def find(index: AgentIndex) -> str | None:
+            return index.file_of(agent_id)
+
+        agent = self._lookup("local", find) or self._lookup("built-in", find)
+        return agent.model_copy() if agent else None
+
+    def get_agent_by_serial(
+        self, serial: int, source: Literal["built-in", "local"]
+    ) -> Agent | None:
+        """Get an agent by serial number from one source.
+
+        Args:
+            serial: Serial number to look up.
+            source: "built-in" or "local".
+
+        Returns:
+            Agent if found, None otherwise.
+        """
+        agent = self._lookup(source, lambda index: index.file_of_serial(serial))
+        return agent.model_copy() if agent else None
+
+    def next_local_serial(self) -> int:
+        """Get the serial number the next local agent would get, without taking it."""
+        floor = self._get_index("local").max_serial() + 1
+        stored = self._cache.peek_serial() if self._cache else None
+        return max(floor, stored or self._next_serial)
+
+    def allocate_local_serial(self) -> int:
+        """Take the next serial number for a new local agent.
+
+        Serials come from a counter stored in the agent cache, so they are
+        allocated atomically and never handed out twice, even by concurrent
+        lk processes. They are also always above every serial in agents/.
+
+        Returns:
+            The allocated serial number.
+        """
+        floor = self._get_index("local").max_serial() + 1
+        serial = self._cache.allocate_serial(floor) if self._cache else None
+        if serial is None:
+            serial = max(floor, self._next_serial)
+        self._next_serial = serial + 1
+        return serial
+
+    def get_pushed_hashes(self) -> dict[str, str]:
+        """Get the payload hash last pushed for every platform agent.
+
+        Returns:
+            Platform agent ID -> payload hash. Empty without a cache, so every
+            agent then counts as changed.
+        """
+        return self._cache.get_pushed_hashes() if self._cache else {}
 
-        return None
+    def record_pushed_hashes(self, hashes: dict[str, str]) -> None:
+        """Remember the payload hashes just pushed to the platform.
+
+        Args:
+            hashes: Platform agent ID -> payload hash.
+        """
+        if self._cache is not None:
+            self._cache.record_pushed_hashes(hashes)
 
     def save_agent(self, agent: Agent) -> Path:
         """Save an agent to local directory.
 
         Adds a comment warning not to modify the serial number.
         """
-        self._ensure_local_dir("agents")
-        path = self.local_path / "agents" / f"{agent.id}.yaml"
+        agents_dir = self._ensure_local_dir("agents")
+        path = agents_dir / f"{agent.id}.yaml"
+        index = self._fresh_local_index()
 
         data = agent.model_dump(exclude_none=True, exclude_unset=False)
         # Convert datetime to ISO format string
@@ -179,7 +439,12 @@ class StorageManager:
 
         with open(path, "w") as f:
             f.write("# WARNING: Do NOT modify the 'serial' field below\n")
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+            dump_yaml(data, f)
+
+        # Keep the local index current (copy so later caller mutations don't leak in)
+        if index is not None:
+            index.put(path.name, agent.model_copy(), self._file_key(path))
+            index.mtime_ns = self._dir_mtime_ns(agents_dir)
 
         return path
 
@@ -195,23 +460,14 @@ class StorageManager:
         Returns:
             True if agent exists in the specified location(s).
         """
-        # Check local
-        if source in ("all", "local"):
-            local_dir = self.local_path / "agents"
-            for yaml_file in self._list_yaml_files(local_dir):
-                agent = self._load_agent(yaml_file)
-                if agent and agent.id == agent_id:
-                    return True
 
-        # Check built-in
-        if source in ("all", "built-in"):
-            builtin_dir = self.builtin_path / "agents"
-            for yaml_file in self._list_yaml_files(builtin_dir):
-                agent = self._load_agent(yaml_file)
-                if agent and agent.id == agent_id:
-                    return True
+        def find(index: AgentIndex) -> str | None:
+            return index.file_of(agent_id)
 
-        return False
+        if source in ("all", "local") and self._lookup("local", find) is not None:
+            return True
+
+        return source in ("all", "built-in") and self._lookup("built-in", find) is not None
 
     def agent_exists_local(self, agent_id: str) -> bool:
         """Check if agent exists in local directory.
@@ -230,21 +486,47 @@ class StorageManager:
         """
         return [agent for agent, _ in self.list_agents(source="local")]
 
+    def list_local_issues(self) -> list[ValidationIssue]:
+        """List validation issues for local agent files that failed to load.
+
+        Comes from the same pass that loads local agents, so validating the
+        folder and listing agents parse each file only once.
+
+        Returns:
+            ValidationIssue for each invalid YAML file, in scan order.
+        """
+        return self._get_fresh_index("local").issues()
+
     def find_agents_using_subagent(self, agent_id: str) -> list[Agent]:
         """Find all local agents that reference agent_id in their sub_agents.
 
+        Served from the sub-agent graph's reverse edges, so the cost depends
+        on the number of referencing agents rather than the directory size.
+
         Args:
             agent_id: The agent ID to search for in sub_agents arrays.
 
         Returns:
-            List of agents that use the given agent_id as a sub-agent.
+            List of agents that use the given agent_id as a sub-agent, sorted
+            by serial number like list_local_agents().
         """
-        using_agents: list[Agent] = []
-        for agent in self.list_local_agents():
-            if agent_id in agent.sub_agents:
-                using_agents.append(agent)
+        using_agents = [
+            agent.model_copy() for agent in self._get_index("local").referrers(agent_id)
+        ]
+        using_agents.sort(key=lambda agent: agent.serial if agent.serial is not None else 999999)
         return using_agents
 
+    def get_local_sub_agents(self, agent_id: str) -> list[str]:
+        """Get the sub-agent IDs of a local agent that exist locally.
+
+        Args:
+            agent_id: The local agent whose sub_agents to look up.
+
+        Returns:
+            Sub-agent IDs in declaration order (empty if the agent isn't local).
+        """
+        return self._get_index("local").sub_agents(agent_id)
+
     def update_subagent_references(self, old_id: str, new_id: str) -> list[str]:
         """Update all sub_agents arrays from old_id to new_id.
 
@@ -256,16 +538,13 @@ class StorageManager:
             List of agent IDs that were updated.
         """
         updated_agents: list[str] = []
-        local_dir = self.local_path / "agents"
 
-        for yaml_file in self._list_yaml_files(local_dir):
-            agent = self._load_agent(yaml_file)
-            if agent and old_id in agent.sub_agents:
-                # Update the sub_agents array
-                agent.sub_agents = [new_id if sid == old_id else sid for sid in agent.sub_agents]
-                # Save the updated agent
-                self.save_agent(agent)
-                updated_agents.append(agent.id)
+        for agent in self.find_agents_using_subagent(old_id):
+            # Update the sub_agents array
+            agent.sub_agents = [new_id if sid == old_id else sid for sid in agent.sub_agents]
+            # Save the updated agent
+            self.save_agent(agent)
+            updated_agents.append(agent.id)
 
         return updated_agents
 
@@ -282,6 +561,10 @@ class StorageManager:
         yaml_path = local_dir / f"{agent_id}.yaml"
 
         if yaml_path.exists():
+            index = self._fresh_local_index()
             yaml_path.unlink()
+            if index is not None:
+                index.discard(yaml_path.name)
+                index.mtime_ns = self._dir_mtime_ns(local_dir)
             return True
         return False
@@ -14,6 +14,7 @@ project-root/
 ├── .env          # Your API credentials (keep secret!)
 ├── .gitignore    # Ignores sensitive files
 ├── README.md     # This file
+├── .lk/          # Local cache (safe to delete)
 └── agents/       # Your cloned agents
 ```
 
@@ -38,6 +39,7 @@ Run `lk --help` for more information.
 # .gitignore content
 GITIGNORE_CONTENT = """# Lyzr Kit
 .env
+.lk/
 *.pyc
 __pycache__/
 .DS_Store
@@ -1,73 +1,63 @@
 """Serial number management for agents."""
 
-from pathlib import Path
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
 from lyzr_kit.schemas.agent import Agent
 
+if TYPE_CHECKING:
+    from lyzr_kit.storage.manager import StorageManager
+
+
+def _get_storage(storage: StorageManager | None) -> StorageManager:
+    """Use the given StorageManager or create one for the current directory."""
+    if storage is not None:
+        return storage
+
+    # Import here to avoid circular dependency
+    from lyzr_kit.storage.manager import StorageManager
+
+    return StorageManager()
+
 
-def get_builtin_agent_by_serial(serial: int) -> Agent | None:
+def get_builtin_agent_by_serial(serial: int, storage: StorageManager | None = None) -> Agent | None:
     """Get a built-in agent by serial number.
 
     Args:
         serial: Serial number (positive integer).
+        storage: StorageManager to look in. Defaults to a new one.
 
     Returns:
         Agent if found, None otherwise.
     """
-    # Import here to avoid circular dependency
-    from lyzr_kit.storage.manager import StorageManager
-
-    storage = StorageManager()
-    agents = storage.list_agents()
-
-    for agent, source in agents:
-        if source == "built-in" and agent.serial == serial:
-            return agent
-
-    return None
+    return _get_storage(storage).get_agent_by_serial(serial, "built-in")
 
 
-def get_local_agent_by_serial(serial: int) -> Agent | None:
+def get_local_agent_by_serial(serial: int, storage: StorageManager | None = None) -> Agent | None:
     """Get a local agent by serial number.
 
     Args:
         serial: Serial number (positive integer).
+        storage: StorageManager to look in. Defaults to a new one.
 
     Returns:
         Agent if found, None otherwise.
     """
-    # Import here to avoid circular dependency
-    from lyzr_kit.storage.manager import StorageManager
-
-    storage = StorageManager()
-    agents = storage.list_agents()
-
-    for agent, source in agents:
-        if source == "local" and agent.serial == serial:
-            return agent
+    return _get_storage(storage).get_agent_by_serial(serial, "local")
 
-    return None
 
-
-def get_next_local_serial() -> int:
+def get_next_local_serial(storage: StorageManager | None = None) -> int:
     """Get the next available serial number for local agents.
 
-    Local agents use positive serial numbers starting from 1.
-    Returns the maximum local serial + 1 (or 1 if no local agents exist).
-    """
-    # Import here to avoid circular dependency
-    from lyzr_kit.storage.manager import StorageManager
-
-    storage = StorageManager()
-    local_dir = Path.cwd() / "agents"
-
-    if not local_dir.exists():
-        return 1
+    Local agents use positive serial numbers starting from 1. This only
+    peeks at the counter; use StorageManager.allocate_local_serial() to take
+    a serial for a new agent.
 
-    max_serial = 0
-    for yaml_file in storage._list_yaml_files(local_dir):
-        agent = storage._load_agent(yaml_file)
-        if agent and agent.serial is not None and agent.serial > max_serial:
-            max_serial = agent.serial
+    Args:
+        storage: StorageManager to look in. Defaults to a new one.
 
-    return max_serial + 1
+    Returns:
+        The next serial number.
+    """
+    return _get_storage(storage).next_local_serial()
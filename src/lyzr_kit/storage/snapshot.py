@@ -0,0 +1,122 @@
+"""Pre-validated snapshot of the built-in agent collection.
+
+The snapshot is generated when the wheel is built (see hatch_build.py) so
+that loading the built-in agents costs a single JSON read instead of parsing
+and validating every YAML file in the collection. The validated agents are
+kept for the rest of the process, so later StorageManager instances only
+stat the YAML files.
+"""
+
+import json
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from lyzr_kit.schemas.agent import Agent
+from lyzr_kit.storage.yaml_codec import load_yaml
+
+# Snapshot file, stored next to the collection's agents/ directory
+SNAPSHOT_FILE = "agents.snapshot.json"
+
+# Bump when the snapshot layout or the Agent schema changes
+SNAPSHOT_VERSION = 3
+
+# Snapshot path -> ((mtime_ns, size) of the snapshot file, its file
+# fingerprint, its validated agents), for snapshots already loaded
+_loaded: dict[Path, tuple[tuple[int, int], list[list[str | int]], list[tuple[str, Agent]]]] = {}
+
+
+def _stat_files(agents_dir: Path) -> tuple[list[list[str | int]], int]:
+    """Stat the YAML files in a directory.
+
+    Returns:
+        Tuple of (fingerprint, newest): [name, size] pairs in name order, and
+        the newest modification time among the files in nanoseconds (0 if
+        there are none).
+    """
+    files: list[list[str | int]] = []
+    newest = 0
+    for path in agents_dir.glob("*.yaml"):
+        stat = path.stat()
+        files.append([path.name, stat.st_size])
+        newest = max(newest, stat.st_mtime_ns)
+    return sorted(files), newest
+
+
+def build_snapshot(agents_dir: Path) -> dict[str, object]:
+    """Parse and validate every agent YAML in a directory.
+
+    Args:
+        agents_dir: Path to the collection's agents/ directory.
+
+    Returns:
+        Snapshot data ready to be serialized as JSON.
+
+    Raises:
+        yaml.YAMLError: If a file has invalid YAML syntax.
+        ValidationError: If a file does not match the Agent schema.
+    """
+    agents: dict[str, object] = {}
+    for path in sorted(agents_dir.glob("*.yaml")):
+        with open(path) as f:
+            agent = Agent.model_validate(load_yaml(f))
+        agents[path.name] = agent.model_dump(mode="json", exclude_unset=True)
+
+    return {
+        "version": SNAPSHOT_VERSION,
+        "files": _stat_files(agents_dir)[0],
+        "agents": agents,
+    }
+
+
+def write_snapshot(agents_dir: Path, output: Path) -> None:
+    """Build a snapshot of a directory and write it to a JSON file.
+
+    Args:
+        agents_dir: Path to the collection's agents/ directory.
+        output: Path of the snapshot file to write.
+    """
+    snapshot = build_snapshot(agents_dir)
+    output.write_text(json.dumps(snapshot, separators=(",", ":")))
+
+
+def load_snapshot(agents_dir: Path, snapshot_path: Path) -> list[tuple[str, Agent]] | None:
+    """Load agents from a snapshot if it matches the YAML files on disk.
+
+    Only file metadata is checked: the snapshot is stale if YAML files were
+    added, removed or resized, or if any of them was modified after the
+    snapshot was written. The snapshot is written after the YAML files,
+    both when the wheel is built and when it is installed, so an untouched
+    install never looks stale.
+
+    Args:
+        agents_dir: Path to the collection's agents/ directory.
+        snapshot_path: Path to the snapshot file.
+
+    Returns:
+        (filename, agent) pairs in filename order, or None if the snapshot is
+        missing, unreadable or stale.
+    """
+    try:
+        stat = snapshot_path.stat()
+        files, newest = _stat_files(agents_dir)
+        if newest > stat.st_mtime_ns:
+            return None
+
+        key = (stat.st_mtime_ns, stat.st_size)
+        loaded = _loaded.get(snapshot_path)
+        if loaded is None or loaded[0] != key:
+            snapshot = json.loads(snapshot_path.read_text())
+            if snapshot.get("version") != SNAPSHOT_VERSION or snapshot.get("files") != files:
+                return None
+            entries = [
+                (filename, Agent.model_validate(data))
+                for filename, data in snapshot["agents"].items()
+            ]
+            loaded = (key, files, entries)
+            _loaded[snapshot_path] = loaded
+        elif loaded[1] != files:
+            return None
+        return list(loaded[2])
+    except (OSError, ValueError, KeyError, AttributeError, ValidationError):
+        return None
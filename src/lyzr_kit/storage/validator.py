@@ -5,6 +5,7 @@ This module re-exports from the _validation submodule for backward compatibility
 
 # Re-export all public API from the _validation submodule
 from lyzr_kit.storage._validation import (
+    CycleAnalyzer,
     CycleDetector,
     ErrorFormatter,
     FolderValidator,
@@ -15,6 +16,7 @@ from lyzr_kit.storage._validation import (
     format_schema_errors,
     format_subagent_errors,
     format_validation_errors,
+    load_agent_yaml,
     validate_agent_yaml,
     validate_agent_yaml_file,
     validate_agents_folder,
@@ -27,11 +29,13 @@ __all__ = [
     "ValidationResult",
     # Classes
     "FolderValidator",
+    "CycleAnalyzer",
     "CycleDetector",
     "ErrorFormatter",
     # Folder validation
     "validate_agents_folder",
     # YAML validation
+    "load_agent_yaml",
     "validate_agent_yaml",
     "validate_agent_yaml_file",
     # Cycle detection
@@ -0,0 +1,9 @@
+"""Test and benchmark helpers for lyzr-kit."""
+
+from lyzr_kit.testing.fake_server import FakeLyzrServer, FakeServerConfig, RequestRecord
+
+__all__ = [
+    "FakeLyzrServer",
+    "FakeServerConfig",
+    "RequestRecord",
+]
@@ -0,0 +1,460 @@
+"""Local stand-in for the Lyzr API, for offline tests and benchmarks.
+
+Serves the endpoints lyzr-kit calls - the /health check, agent create and
+update, the marketplace /app/ endpoint, chat inference with SSE streaming -
+plus the metrics WebSocket, with knobs for latency, error rate and token
+rate so platform and chat performance can be measured reproducibly.
+
+Usage:
+    python -m lyzr_kit.testing.fake_server [--port 8765] [--ws-port 8766] \\
+        [--latency 0.05] [--error-rate 0.1] [--token-rate 50]
+
+Or from Python:
+    with FakeLyzrServer(FakeServerConfig(latency=0.02)) as server:
+        client = PlatformClient(server.auth_config())
+"""
+
+import argparse
+import asyncio
+import contextlib
+import functools
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from lyzr_kit.utils.auth import AuthConfig
+
+DEFAULT_RESPONSE = (
+    "<think>The user wants a short answer.</think>"
+    "Hello from the fake Lyzr server. Every word of this reply is streamed as its own token."
+)
+
+AGENT_PATH = "/v3/agents/template/single-task"
+WS_PATH = re.compile(r"^/ws/([^/?]+)")
+
+
+@dataclass
+class FakeServerConfig:
+    """Behavior knobs for FakeLyzrServer."""
+
+    latency: float = 0.0  # Seconds added before every HTTP response
+    jitter: float = 0.0  # Extra random latency, uniform in [0, jitter]
+    error_rate: float = 0.0  # Fraction of HTTP requests answered with error_status
+    error_status: int = 503
+    retry_after: float | None = None  # Retry-After sent with injected errors
+    token_rate: float = 0.0  # SSE tokens per second (0 streams as fast as possible)
+    response: str = DEFAULT_RESPONSE  # Text streamed back by inference calls
+    api_key: str | None = None  # Reject other x-api-key values with 401 (None accepts any)
+    seed: int | None = None  # Seed for latency jitter and error injection
+
+
+@dataclass
+class RequestRecord:
+    """One HTTP request the server received."""
+
+    method: str
+    path: str
+    status: int
+    body: dict[str, Any] | None = None
+
+
+@dataclass
+class _State:
+    """Data shared by the HTTP handlers and the WebSocket loop."""
+
+    config: FakeServerConfig
+    rng: random.Random
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    agents: dict[str, dict[str, Any]] = field(default_factory=dict)
+    apps: dict[str, dict[str, Any]] = field(default_factory=dict)
+    requests: list[RequestRecord] = field(default_factory=list)
+
+
+def _tokens(text: str) -> list[str]:
+    """Split text into word tokens that keep their trailing whitespace."""
+    return re.findall(r"\S+\s*|\s+", text)
+
+
+def _encode_sse(token: str) -> str:
+    """Escape a token the way the inference API does."""
+    return token.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Request handler for the fake REST and SSE endpoints."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body are separate writes; with Nagle on, keep-alive
+    # requests stall on delayed ACKs and every response gains ~40ms
+    disable_nagle_algorithm = True
+    server: "_HTTPServer"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Keep test and benchmark output quiet."""
+
+    def do_GET(self) -> None:  # noqa: N802
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:  # noqa: N802
+        self._dispatch("POST")
+
+    def do_PUT(self) -> None:  # noqa: N802
+        self._dispatch("PUT")
+
+    def _dispatch(self, method: str) -> None:
+        state = self.server.state
+        config = state.config
+        path = self.path.split("?", 1)[0]
+        body = self._read_json()
+
+        with state.lock:
+            delay = config.latency + (state.rng.uniform(0, config.jitter) if config.jitter else 0)
+            fail = config.error_rate > 0 and state.rng.random() < config.error_rate
+        if delay:
+            time.sleep(delay)
+
+        if fail:
+            headers = {}
+            if config.retry_after is not None:
+                headers["Retry-After"] = f"{config.retry_after:g}"
+            status = self._send_json(config.error_status, {"detail": "Injected error"}, headers)
+        elif config.api_key is not None and not self._authorized(path):
+            status = self._send_json(401, {"detail": "Invalid API key"})
+        else:
+            status = self._route(method, path, body)
+
+        with state.lock:
+            state.requests.append(RequestRecord(method, path, status, body))
+
+    def _authorized(self, path: str) -> bool:
+        if path == "/app/":
+            return self.headers.get("Authorization", "").startswith("Bearer ")
+        return self.headers.get("x-api-key") == self.server.state.config.api_key
+
+    def _route(self, method: str, path: str, body: dict[str, Any] | None) -> int:
+        state = self.server.state
+        if method == "GET" and path == "/health":
+            return self._send_json(200, {"status": "ok"})
+
+        if method == "POST" and path == AGENT_PATH:
+            agent_id = uuid.uuid4().hex[:24]
+            with state.lock:
+                state.agents[agent_id] = body or {}
+            return self._send_json(200, {"agent_id": agent_id})
+
+        if method == "PUT" and path.startswith(AGENT_PATH + "/"):
+            agent_id = path[len(AGENT_PATH) + 1 :]
+            with state.lock:
+                if agent_id not in state.agents:
+                    return self._send_json(404, {"detail": "Agent not found"})
+                state.agents[agent_id] = body or {}
+            return self._send_json(200, {"agent_id": agent_id})
+
+        if method == "POST" and path == "/app/":
+            app_id = uuid.uuid4().hex[:24]
+            with state.lock:
+                state.apps[app_id] = body or {}
+            return self._send_json(201, {"_id": app_id})
+
+        if method == "POST" and path == "/v3/inference/chat/":
+            return self._send_json(200, {"response": state.config.response})
+
+        if method == "POST" and path == "/v3/inference/stream/":
+            return self._stream(body or {})
+
+        return self._send_json(404, {"detail": "Not found"})
+
+    def _stream(self, body: dict[str, Any]) -> int:
+        """Stream the configured response as SSE, one token per event."""
+        config = self.server.state.config
+        session_id = str(body.get("session_id", ""))
+        publish = self.server.publish
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        publish(session_id, "agent_process_start", "Processing started")
+        interval = 1.0 / config.token_rate if config.token_rate > 0 else 0.0
+        try:
+            for i, token in enumerate(_tokens(config.response)):
+                if i == 0:
+                    publish(session_id, "llm_response", "Generating response")
+                elif interval:
+                    time.sleep(interval)
+                self._write_chunk(f"data: {_encode_sse(token)}\n\n")
+            self._write_chunk("data: [DONE]\n\n")
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            # Client hung up mid-stream
+            self.close_connection = True
+        publish(session_id, "agent_process_end", "Processing complete")
+        return 200
+
+    def _write_chunk(self, text: str) -> None:
+        data = text.encode("utf-8")
+        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+        self.wfile.flush()
+
+    def _read_json(self) -> dict[str, Any] | None:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return None
+        try:
+            data = json.loads(self.rfile.read(length))
+        except ValueError:
+            return None
+        return data if isinstance(data, dict) else None
+
+    def _send_json(
+        self, status: int, data: dict[str, Any], headers: dict[str, str] | None = None
+    ) -> int:
+        payload = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+        return status
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    """Threaded HTTP server carrying the shared state."""
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], owner: "FakeLyzrServer") -> None:
+        super().__init__(address, _Handler)
+        self.state = owner.state
+        self.publish = owner.publish
+
+
+class FakeLyzrServer:
+    """In-process fake of the Lyzr HTTP API and metrics WebSocket.
+
+    HTTP is served by a threaded stdlib server and the WebSocket by an
+    asyncio loop on its own thread, each on a free local port. Events for
+    a chat session are pushed to every WebSocket connected to
+    /ws/<session_id> while its SSE response streams.
+
+    Use as a context manager, or call start() and stop().
+    """
+
+    def __init__(
+        self,
+        config: FakeServerConfig | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        ws_port: int = 0,
+    ) -> None:
+        """Initialize the server (nothing listens until start()).
+
+        Args:
+            config: Behavior knobs. Defaults to no latency and no errors.
+            host: Interface to listen on.
+            port: HTTP port (0 picks a free one).
+            ws_port: WebSocket port (0 picks a free one).
+        """
+        self.config = config or FakeServerConfig()
+        self.host = host
+        self.port = port
+        self.state = _State(self.config, random.Random(self.config.seed))
+        self._http: _HTTPServer | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._ws_port = ws_port
+        self._ws_stop: asyncio.Event | None = None
+        self._sockets: dict[str, set[Any]] = {}
+        self._ws_connections = 0
+        self._threads: list[threading.Thread] = []
+
+    @property
+    def base_url(self) -> str:
+        """Root URL for the REST API (health, agents, inference)."""
+        assert self._http is not None, "server not started"
+        return f"http://{self.host}:{self._http.server_address[1]}"
+
+    @property
+    def marketplace_url(self) -> str:
+        """Root URL for the marketplace API (same server)."""
+        return self.base_url
+
+    @property
+    def stream_url(self) -> str:
+        """SSE inference endpoint."""
+        return f"{self.base_url}/v3/inference/stream/"
+
+    @property
+    def websocket_url(self) -> str:
+        """Base URL of the metrics WebSocket."""
+        return f"ws://{self.host}:{self._ws_port}"
+
+    @property
+    def requests(self) -> list[RequestRecord]:
+        """Every HTTP request received so far."""
+        with self.state.lock:
+            return list(self.state.requests)
+
+    @property
+    def agents(self) -> dict[str, dict[str, Any]]:
+        """Platform agent ID -> last payload created or updated."""
+        with self.state.lock:
+            return dict(self.state.agents)
+
+    @property
+    def websocket_connections(self) -> int:
+        """WebSocket connections accepted so far."""
+        return self._ws_connections
+
+    def auth_config(self, api_key: str | None = None, **kwargs: Any) -> AuthConfig:
+        """Build an AuthConfig pointing at this server.
+
+        Marketplace app creation needs user_id and memberstack_token, so
+        both get placeholder values unless passed in kwargs.
+        """
+        kwargs.setdefault("user_id", "fake-user")
+        kwargs.setdefault("memberstack_token", "fake-token")
+        return AuthConfig(
+            api_key=api_key or self.config.api_key or "fake-api-key",
+            base_url=self.base_url,
+            marketplace_url=self.marketplace_url,
+            stream_url=self.stream_url,
+            websocket_url=self.websocket_url,
+            **kwargs,
+        )
+
+    def start(self) -> "FakeLyzrServer":
+        """Start listening for HTTP and WebSocket connections."""
+        self._http = _HTTPServer((self.host, self.port), self)
+        # A short poll interval keeps stop() quick
+        self._spawn(functools.partial(self._http.serve_forever, poll_interval=0.05))
+
+        ready = threading.Event()
+        self._spawn(lambda: asyncio.run(self._serve_websocket(ready)))
+        ready.wait(timeout=10)
+        return self
+
+    def stop(self) -> None:
+        """Stop both servers and wait for their threads."""
+        if self._loop is not None and self._ws_stop is not None:
+            self._loop.call_soon_threadsafe(self._ws_stop.set)
+        if self._http is not None:
+            self._http.shutdown()
+            self._http.server_close()
+        for thread in self._threads:
+            thread.join(timeout=5)
+        self._threads.clear()
+
+    def __enter__(self) -> "FakeLyzrServer":
+        return self.start()
+
+    def __exit__(self, *args: object) -> None:
+        self.stop()
+
+    def publish(self, session_id: str, event_type: str, message: str = "") -> None:
+        """Send an event to every WebSocket watching a session (thread-safe)."""
+        if self._loop is None or not self._sockets.get(session_id):
+            return
+        event = {
+            "event_type": event_type,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "session_id": session_id,
+            "level": "INFO",
+            "message": message,
+        }
+        future = asyncio.run_coroutine_threadsafe(
+            self._broadcast(session_id, json.dumps(event)), self._loop
+        )
+        # Keep events ordered with the SSE tokens around them
+        future.result(timeout=5)
+
+    def drop_websockets(self, session_id: str) -> None:
+        """Close every WebSocket watching a session, like a network drop (thread-safe)."""
+        if self._loop is None:
+            return
+        future = asyncio.run_coroutine_threadsafe(self._close_sockets(session_id), self._loop)
+        future.result(timeout=5)
+
+    async def _close_sockets(self, session_id: str) -> None:
+        for ws in list(self._sockets.get(session_id, ())):
+            await ws.close(code=1012, reason="Dropped by test")
+
+    async def _broadcast(self, session_id: str, message: str) -> None:
+        for ws in list(self._sockets.get(session_id, ())):
+            try:
+                await ws.send(message)
+            except Exception:
+                self._sockets[session_id].discard(ws)
+
+    async def _serve_websocket(self, ready: threading.Event) -> None:
+        from websockets.asyncio.server import serve
+
+        self._loop = asyncio.get_running_loop()
+        self._ws_stop = asyncio.Event()
+        async with serve(self._handle_websocket, self.host, self._ws_port) as server:
+            self._ws_port = next(iter(server.sockets)).getsockname()[1]
+            ready.set()
+            await self._ws_stop.wait()
+
+    async def _handle_websocket(self, ws: Any) -> None:
+        match = WS_PATH.match(ws.request.path)
+        if match is None:
+            await ws.close(code=1008, reason="Unknown path")
+            return
+        session_id = match.group(1)
+        self._ws_connections += 1
+        self._sockets.setdefault(session_id, set()).add(ws)
+        try:
+            await ws.wait_closed()
+        finally:
+            self._sockets[session_id].discard(ws)
+
+    def _spawn(self, target: Any) -> None:
+        thread = threading.Thread(target=target, daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run a fake Lyzr API server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--ws-port", type=int, default=8766)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds per response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of errors")
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--retry-after", type=float, default=None)
+    parser.add_argument("--token-rate", type=float, default=0.0, help="SSE tokens per second")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    config = FakeServerConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        retry_after=args.retry_after,
+        token_rate=args.token_rate,
+        seed=args.seed,
+    )
+    with FakeLyzrServer(config, host=args.host, port=args.port, ws_port=args.ws_port) as server:
+        print(f"API:       {server.base_url}")
+        print(f"Stream:    {server.stream_url}")
+        print(f"WebSocket: {server.websocket_url}")
+        with contextlib.suppress(KeyboardInterrupt):
+            threading.Event().wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,21 +3,33 @@
 from lyzr_kit.utils.auth import (
     AuthConfig,
     AuthError,
+    cache_auth,
     get_api_headers,
+    invalidate_auth_cache,
     load_auth,
     require_auth,
     validate_auth,
 )
-from lyzr_kit.utils.platform import AgentResponse, PlatformClient, PlatformError
+from lyzr_kit.utils.platform import (
+    AgentResponse,
+    AsyncPlatformClient,
+    PlatformClient,
+    PlatformError,
+    PlatformSession,
+)
 
 __all__ = [
     "AuthConfig",
     "AuthError",
+    "cache_auth",
     "get_api_headers",
+    "invalidate_auth_cache",
     "load_auth",
     "require_auth",
     "validate_auth",
     "AgentResponse",
+    "AsyncPlatformClient",
     "PlatformClient",
     "PlatformError",
+    "PlatformSession",
 ]
@@ -1,8 +1,12 @@
 """Authentication utilities for lyzr-kit."""
 
+import hashlib
+import json
 import os
+import time
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Protocol
 
 import httpx
 from dotenv import load_dotenv
@@ -15,11 +19,30 @@ ENV_MEMBERSTACK_TOKEN = "LYZR_MEMBERSTACK_TOKEN"
 API_BASE_URL = "https://agent-prod.studio.lyzr.ai"
 MARKETPLACE_BASE_URL = "https://marketplace-prod.studio.lyzr.ai"
 STUDIO_BASE_URL = "https://studio.lyzr.ai"
+WEBSOCKET_BASE_URL = "wss://metrics.studio.lyzr.ai"
+STREAM_PATH = "/v3/inference/stream/"
+
+# Endpoint overrides (.env or environment), e.g. for a regional edge,
+# a local caching proxy or lyzr_kit.testing.FakeLyzrServer
+ENV_API_BASE_URL = "LYZR_API_BASE_URL"
+ENV_MARKETPLACE_URL = "LYZR_MARKETPLACE_URL"
+ENV_STREAM_URL = "LYZR_STREAM_URL"
+ENV_WEBSOCKET_URL = "LYZR_WEBSOCKET_URL"
+
+# Successful health checks are remembered per API key (hashed) for a while,
+# so back-to-back commands skip the /health round trip
+AUTH_CACHE_FILE = Path(".lk") / "auth.json"
+ENV_AUTH_CACHE_TTL = "LK_AUTH_CACHE_TTL"
+DEFAULT_AUTH_CACHE_TTL = 300.0
 
 
 @dataclass
 class AuthConfig:
-    """Authentication configuration."""
+    """Authentication configuration.
+
+    stream_url defaults to the inference stream endpoint under base_url, so
+    pointing base_url elsewhere moves chat streaming with it.
+    """
 
     api_key: str
     base_url: str = API_BASE_URL
@@ -28,6 +51,12 @@ class AuthConfig:
     user_id: str | None = None
     org_id: str | None = None
     memberstack_token: str | None = None
+    stream_url: str = ""
+    websocket_url: str = WEBSOCKET_BASE_URL
+
+    def __post_init__(self) -> None:
+        if not self.stream_url:
+            self.stream_url = f"{self.base_url}{STREAM_PATH}"
 
 
 class AuthError(Exception):
@@ -75,17 +104,104 @@ def load_auth() -> AuthConfig:
 
     return AuthConfig(
         api_key=api_key,
+        base_url=_env_url(ENV_API_BASE_URL) or API_BASE_URL,
+        marketplace_url=_env_url(ENV_MARKETPLACE_URL) or MARKETPLACE_BASE_URL,
         user_id=user_id,
         org_id=org_id,
         memberstack_token=memberstack_token,
+        stream_url=os.getenv(ENV_STREAM_URL, "").strip(),
+        websocket_url=_env_url(ENV_WEBSOCKET_URL) or WEBSOCKET_BASE_URL,
     )
 
 
-def validate_auth(auth: AuthConfig) -> bool:
+def _env_url(name: str) -> str:
+    """Read a base URL override, without a trailing slash ('' if unset)."""
+    return os.getenv(name, "").strip().rstrip("/")
+
+
+def get_auth_cache_ttl() -> float:
+    """Get how long a successful health check stays valid, in seconds.
+
+    Read from LK_AUTH_CACHE_TTL (0 disables caching). Invalid values fall
+    back to DEFAULT_AUTH_CACHE_TTL.
+    """
+    value = os.getenv(ENV_AUTH_CACHE_TTL, "").strip()
+    if not value:
+        return DEFAULT_AUTH_CACHE_TTL
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return DEFAULT_AUTH_CACHE_TTL
+
+
+def _auth_cache_key(auth: AuthConfig) -> str:
+    """Hash the API key and base URL so the key itself is never written."""
+    return hashlib.sha256(f"{auth.base_url}\n{auth.api_key}".encode()).hexdigest()
+
+
+def _read_auth_cache() -> dict[str, float]:
+    """Read the cached key hash -> expiry map, ignoring unreadable files."""
+    try:
+        data = json.loads(AUTH_CACHE_FILE.read_text())
+        return {str(k): float(v) for k, v in data.items()}
+    except (OSError, ValueError, TypeError, AttributeError):
+        return {}
+
+
+def _write_auth_cache(entries: dict[str, float]) -> None:
+    """Write the auth cache atomically. Failures only cost a later health check."""
+    try:
+        AUTH_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = AUTH_CACHE_FILE.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(entries))
+        os.replace(tmp_path, AUTH_CACHE_FILE)
+    except OSError:
+        pass
+
+
+def is_auth_cached(auth: AuthConfig) -> bool:
+    """Check whether a recent health check already validated these credentials."""
+    if get_auth_cache_ttl() <= 0:
+        return False
+    expires_at = _read_auth_cache().get(_auth_cache_key(auth))
+    return expires_at is not None and expires_at > time.time()
+
+
+def cache_auth(auth: AuthConfig) -> None:
+    """Remember a successful health check for the configured TTL."""
+    ttl = get_auth_cache_ttl()
+    if ttl <= 0:
+        return
+    now = time.time()
+    entries = {k: v for k, v in _read_auth_cache().items() if v > now}
+    entries[_auth_cache_key(auth)] = now + ttl
+    _write_auth_cache(entries)
+
+
+def invalidate_auth_cache(auth: AuthConfig) -> None:
+    """Forget a cached health check, e.g. after the API rejected the key."""
+    entries = _read_auth_cache()
+    if entries.pop(_auth_cache_key(auth), None) is not None:
+        _write_auth_cache(entries)
+
+
+class HealthCheckClient(Protocol):
+    """Anything that can send the health check GET (httpx.Client, PlatformSession)."""
+
+    def get(self, url: str, *, headers: dict[str, str], timeout: float) -> httpx.Response: ...
+
+
+def validate_auth(
+    auth: AuthConfig, use_cache: bool = False, client: HealthCheckClient | None = None
+) -> bool:
     """Validate authentication by calling health endpoint.
 
     Args:
         auth: AuthConfig with API key.
+        use_cache: Skip the health check if it succeeded within the auth
+            cache TTL, and record a successful check for later calls.
+        client: Pooled client to send the check through (e.g. a
+            PlatformSession), so the connection is reused by later API calls.
 
     Returns:
         True if authentication is valid.
@@ -93,8 +209,12 @@ def validate_auth(auth: AuthConfig) -> bool:
     Raises:
         AuthError: If authentication fails.
     """
+    if use_cache and is_auth_cached(auth):
+        return True
+
+    get = client.get if client is not None else httpx.get
     try:
-        response = httpx.get(
+        response = get(
             f"{auth.base_url}/health",
             headers={
                 "accept": "application/json",
@@ -104,8 +224,14 @@ def validate_auth(auth: AuthConfig) -> bool:
         )
 
         if response.status_code == 200:
+            if use_cache:
+                cache_auth(auth)
             return True
-        elif response.status_code == 401:
+
+        if response.status_code in (401, 403):
+            invalidate_auth_cache(auth)
+
+        if response.status_code == 401:
             raise AuthError(
                 "Invalid API key.\n"
                 "  → Run 'lk auth' to update your API key.\n"
@@ -140,6 +266,8 @@ def validate_auth(auth: AuthConfig) -> bool:
 def require_auth() -> AuthConfig:
     """Load and validate authentication.
 
+    A successful validation is cached for LK_AUTH_CACHE_TTL seconds.
+
     Returns:
         AuthConfig if authentication is valid.
 
@@ -147,7 +275,7 @@ def require_auth() -> AuthConfig:
         AuthError: If authentication fails.
     """
     auth = load_auth()
-    validate_auth(auth)
+    validate_auth(auth, use_cache=True)
     return auth
 
 
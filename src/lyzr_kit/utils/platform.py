@@ -1,11 +1,157 @@
 """Platform client for Lyzr Agent API v3."""
 
+import asyncio
+import hashlib
+import importlib.util
+import json
+import os
+import sys
+import threading
+from collections.abc import Coroutine
 from dataclasses import dataclass
+from types import TracebackType
+from typing import Any, TypeVar
 
 import httpx
 
 from lyzr_kit.schemas.agent import Agent
-from lyzr_kit.utils.auth import AuthConfig
+from lyzr_kit.utils.auth import AuthConfig, invalidate_auth_cache
+from lyzr_kit.utils.transport import RetryTransport, TransportMetrics
+
+# Set to 1 to negotiate HTTP/2 (needs the optional h2 package: pip install lyzr-kit[http2])
+ENV_HTTP2 = "LK_HTTP2"
+HAS_H2: bool = importlib.util.find_spec("h2") is not None
+
+# Connection pool shared by every request in one CLI invocation
+HTTP_TIMEOUT = 30.0
+HTTP_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=30.0)
+
+# Set to 1 to print per-session HTTP metrics (attempts, retries, latency) to stderr
+ENV_HTTP_METRICS = "LK_HTTP_METRICS"
+
+# Platform calls allowed in flight at once per client
+DEFAULT_MAX_CONCURRENCY = 8
+
+T = TypeVar("T")
+
+
+def use_http2() -> bool:
+    """Check whether HTTP/2 is requested via LK_HTTP2 and h2 is installed."""
+    return HAS_H2 and os.getenv(ENV_HTTP2, "").strip().lower() in ("1", "true", "yes")
+
+
+def create_http_client(
+    http2: bool | None = None, metrics: TransportMetrics | None = None
+) -> httpx.AsyncClient:
+    """Create a pooled keep-alive async HTTP client for Lyzr API calls.
+
+    Reusing one client lets consecutive requests share TCP/TLS connections
+    instead of paying a handshake per call. Requests go through a
+    RetryTransport, so they are rate-limited and throttled or transient
+    failures are retried.
+
+    Args:
+        http2: Negotiate HTTP/2. Defaults to use_http2(). Ignored without h2.
+        metrics: Collector for per-attempt latency metrics.
+
+    Returns:
+        A new httpx.AsyncClient. The caller closes it (aclose()).
+    """
+    if http2 is None:
+        http2 = use_http2()
+    transport = httpx.AsyncHTTPTransport(http2=http2 and HAS_H2, limits=HTTP_LIMITS)
+    return httpx.AsyncClient(
+        transport=RetryTransport(transport, metrics=metrics), timeout=HTTP_TIMEOUT
+    )
+
+
+class PlatformSession:
+    """A pooled httpx.AsyncClient driven by a private event loop thread.
+
+    Lets synchronous command code (and worker threads) share one async
+    connection pool: run() submits a coroutine to the loop and blocks for
+    its result, and get() sends a single request, so the auth health check
+    can use the same connections as later platform calls.
+
+    Requests it creates its own client for are retried and rate-limited
+    (see RetryTransport), and each attempt is recorded in metrics.
+
+    Use as a context manager, or call close() when done.
+    """
+
+    def __init__(self, client: httpx.AsyncClient | None = None) -> None:
+        """Start the event loop thread.
+
+        Args:
+            client: Async client to drive. Defaults to create_http_client()
+                on first use. The session closes it either way.
+        """
+        self._client = client
+        self.metrics = TransportMetrics()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="lk-platform-session", daemon=True
+        )
+        self._thread.start()
+
+    def __enter__(self) -> "PlatformSession":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The pooled async client, created on first use if not given."""
+        if self._client is None:
+            self._client = create_http_client(metrics=self.metrics)
+        return self._client
+
+    @property
+    def is_closed(self) -> bool:
+        """Whether close() has been called."""
+        return self._loop.is_closed()
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the session loop and wait for its result.
+
+        Safe to call from several threads at once; the coroutines then run
+        concurrently on the loop. If the wait is interrupted (e.g. Ctrl+C),
+        the coroutine is cancelled.
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        try:
+            return future.result()
+        except BaseException:
+            future.cancel()
+            raise
+
+    def get(self, url: str, *, headers: dict[str, str], timeout: float) -> httpx.Response:
+        """Send a GET request through the pooled client and wait for the response."""
+        return self.run(self.client.get(url, headers=headers, timeout=timeout))
+
+    def close(self) -> None:
+        """Close the HTTP client and stop the event loop thread.
+
+        With LK_HTTP_METRICS=1, a summary of the session's HTTP attempts is
+        printed to stderr.
+        """
+        if self._loop.is_closed():
+            return
+        if os.getenv(ENV_HTTP_METRICS) and self.metrics.attempts:
+            print(f"[lk http] {self.metrics.summary()}", file=sys.stderr)
+        try:
+            if self._client is not None:
+                self.run(self._client.aclose())
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
 
 
 class PlatformError(Exception):
@@ -84,23 +230,92 @@ def _build_agent_payload(agent: Agent) -> dict[str, object]:
     return payload
 
 
-class PlatformClient:
-    """Client for interacting with Lyzr platform API v3."""
+def payload_hash(agent: Agent) -> str:
+    """Hash the platform payload of an agent.
+
+    Stable across runs (keys are sorted), so comparing it with the hash
+    recorded at the last push tells whether the platform copy is stale.
+    Local-only fields such as serial or sub_agents don't affect it.
+    """
+    payload = json.dumps(_build_agent_payload(agent), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class AsyncPlatformClient:
+    """Async client for interacting with Lyzr platform API v3.
+
+    Requests go through one pooled httpx.AsyncClient, so they reuse
+    connections, and at most max_concurrency of them are in flight at once.
+    Pass client to share a caller-owned pool; otherwise the client creates
+    its own on first use, and closes it in aclose() or when used as an
+    async context manager.
+    """
 
-    def __init__(self, auth: AuthConfig) -> None:
+    def __init__(
+        self,
+        auth: AuthConfig,
+        client: httpx.AsyncClient | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        timeout: float = HTTP_TIMEOUT,
+    ) -> None:
         """Initialize platform client.
 
         Args:
             auth: Authentication configuration with API key.
+            client: Shared HTTP client. The caller stays responsible for closing it.
+            max_concurrency: Maximum platform requests in flight at once.
+            timeout: Timeout in seconds applied to each request.
         """
         self.auth = auth
+        self.timeout = timeout
         self._headers = {
             "Content-Type": "application/json",
             "accept": "application/json",
             "x-api-key": auth.api_key,
         }
+        self._client = client
+        self._owns_client = client is None
+        self._limit = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def __aenter__(self) -> "AsyncPlatformClient":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The HTTP client used for requests, created on first use if not shared."""
+        if self._client is None:
+            self._client = create_http_client()
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the HTTP client if this AsyncPlatformClient created it."""
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _request(
+        self, method: str, url: str, json: dict[str, Any], headers: dict[str, str]
+    ) -> httpx.Response:
+        """Send a request within the concurrency limit and per-call timeout."""
+        async with self._limit:
+            return await self.client.request(
+                method, url, json=json, headers=headers, timeout=self.timeout
+            )
 
-    def create_agent(self, agent: Agent) -> AgentResponse:
+    def _check_auth_rejected(self, response: httpx.Response) -> None:
+        """Drop the cached health check if the API rejected our credentials."""
+        if response.status_code in (401, 403):
+            invalidate_auth_cache(self.auth)
+
+    async def create_agent(self, agent: Agent) -> AgentResponse:
         """Create agent on the platform using v3 API.
 
         Args:
@@ -117,9 +332,10 @@ class PlatformClient:
 
             # Create agent via v3 API
             url = f"{self.auth.base_url}/v3/agents/template/single-task"
-            response = httpx.post(url, json=payload, headers=self._headers, timeout=30.0)
+            response = await self._request("POST", url, json=payload, headers=self._headers)
 
             if response.status_code not in (200, 201):
+                self._check_auth_rejected(response)
                 raise Exception(f"{response.status_code} - {response.text}")
 
             data = response.json()
@@ -131,7 +347,7 @@ class PlatformClient:
             # Create app on marketplace first (required for Studio chat to work)
             app_id = None
             if self.auth.memberstack_token and self.auth.user_id:
-                app_id = self._create_marketplace_app(
+                app_id = await self._create_marketplace_app(
                     agent_id=agent_id,
                     name=agent.name,
                     description=agent.description or "",
@@ -155,7 +371,7 @@ class PlatformClient:
         except Exception as e:
             raise PlatformError(f"Failed to create agent: {e}") from e
 
-    def update_agent(self, agent: Agent, agent_id: str, env_id: str) -> AgentResponse:
+    async def update_agent(self, agent: Agent, agent_id: str, env_id: str) -> AgentResponse:
         """Update agent on the platform using v3 API.
 
         Args:
@@ -174,9 +390,10 @@ class PlatformClient:
 
             # Update agent via v3 API
             url = f"{self.auth.base_url}/v3/agents/template/single-task/{agent_id}"
-            response = httpx.put(url, json=payload, headers=self._headers, timeout=30.0)
+            response = await self._request("PUT", url, json=payload, headers=self._headers)
 
             if response.status_code not in (200, 201):
+                self._check_auth_rejected(response)
                 raise Exception(f"{response.status_code} - {response.text}")
 
             # Build URLs - use v3 inference endpoint
@@ -196,7 +413,9 @@ class PlatformClient:
         except Exception as e:
             raise PlatformError(f"Failed to update agent: {e}") from e
 
-    def _create_marketplace_app(self, agent_id: str, name: str, description: str) -> str | None:
+    async def _create_marketplace_app(
+        self, agent_id: str, name: str, description: str
+    ) -> str | None:
         """Create an app on the marketplace for the agent.
 
         Args:
@@ -215,7 +434,8 @@ class PlatformClient:
             # This prevents "App with this name already exists" errors
             unique_name = f"{name} ({agent_id[-8:]})"
 
-            response = httpx.post(
+            response = await self._request(
+                "POST",
                 f"{self.auth.marketplace_url}/app/",
                 json={
                     "name": unique_name,
@@ -232,7 +452,6 @@ class PlatformClient:
                     "Content-Type": "application/json",
                     "Authorization": f"Bearer {self.auth.memberstack_token}",
                 },
-                timeout=30.0,
             )
 
             if response.status_code in (200, 201):
@@ -243,3 +462,77 @@ class PlatformClient:
         except Exception:
             # Marketplace app creation is optional, don't fail the whole operation
             return None
+
+
+class PlatformClient:
+    """Client for interacting with Lyzr platform API v3.
+
+    A blocking wrapper around AsyncPlatformClient: each call runs on a
+    PlatformSession's event loop, so calls made from several threads share
+    one connection pool and overlap on the wire. Pass session to share a
+    caller-owned session (e.g. with the auth health check); otherwise the
+    client starts its own on first use, and closes it in close() or when
+    used as a context manager.
+    """
+
+    def __init__(
+        self,
+        auth: AuthConfig,
+        session: PlatformSession | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> None:
+        """Initialize platform client.
+
+        Args:
+            auth: Authentication configuration with API key.
+            session: Shared session. The caller stays responsible for closing it.
+            max_concurrency: Maximum platform requests in flight at once.
+        """
+        self.auth = auth
+        self._session = session
+        self._owns_session = session is None
+        self.async_client = AsyncPlatformClient(
+            auth,
+            client=session.client if session is not None else None,
+            max_concurrency=max_concurrency,
+        )
+        self._headers = self.async_client._headers
+
+    def __enter__(self) -> "PlatformClient":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    @property
+    def session(self) -> PlatformSession:
+        """The session requests run on, started on first use if not shared."""
+        if self._session is None:
+            self._session = PlatformSession()
+        return self._session
+
+    def close(self) -> None:
+        """Close the session if this PlatformClient started it."""
+        if self._owns_session and self._session is not None:
+            self._session.run(self.async_client.aclose())
+            self._session.close()
+            self._session = None
+
+    def create_agent(self, agent: Agent) -> AgentResponse:
+        """Create agent on the platform (see AsyncPlatformClient.create_agent)."""
+        return self.session.run(self.async_client.create_agent(agent))
+
+    def update_agent(self, agent: Agent, agent_id: str, env_id: str) -> AgentResponse:
+        """Update agent on the platform (see AsyncPlatformClient.update_agent)."""
+        return self.session.run(self.async_client.update_agent(agent, agent_id, env_id))
+
+    def _create_marketplace_app(self, agent_id: str, name: str, description: str) -> str | None:
+        """Create a marketplace app (see AsyncPlatformClient._create_marketplace_app)."""
+        return self.session.run(
+            self.async_client._create_marketplace_app(agent_id, name, description)
+        )
@@ -0,0 +1,289 @@
+"""HTTP transport with retries, backoff and client-side rate limiting."""
+
+import asyncio
+import os
+import random
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+# Environment variables for tuning (rate limit 0 disables it, retries 0 disables them)
+ENV_RATE_LIMIT = "LK_RATE_LIMIT"
+ENV_MAX_RETRIES = "LK_MAX_RETRIES"
+
+DEFAULT_RATE_LIMIT = 10.0  # Requests per second
+DEFAULT_MAX_RETRIES = 4
+
+# Exponential backoff with full jitter: attempt n sleeps up to base * 2**n, capped
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 30.0
+# Longest Retry-After we honor before giving up on the request
+RETRY_AFTER_MAX = 120.0
+
+# 429 means the request was not processed, so any method may be retried.
+# Other failures are only retried for methods that are safe to repeat.
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+# Refill arithmetic can leave a token a rounding error short of whole
+_TOKEN_EPSILON = 1e-9
+
+
+def _env_number(name: str, default: float) -> float:
+    """Read a non-negative number from the environment, ignoring invalid values."""
+    value = os.getenv(name, "").strip()
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return default
+
+
+def get_rate_limit() -> float:
+    """Get the request rate limit in requests per second (0 means unlimited)."""
+    return _env_number(ENV_RATE_LIMIT, DEFAULT_RATE_LIMIT)
+
+
+def get_max_retries() -> int:
+    """Get how many times a failed request is retried."""
+    return int(_env_number(ENV_MAX_RETRIES, DEFAULT_MAX_RETRIES))
+
+
+def parse_retry_after(value: str | None, now: float | None = None) -> float | None:
+    """Parse a Retry-After header into a delay in seconds.
+
+    Args:
+        value: Header value, either delay-seconds or an HTTP date.
+        now: Current Unix time, for HTTP dates. Defaults to time.time().
+
+    Returns:
+        Non-negative delay in seconds, or None if missing or unparseable.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at - (time.time() if now is None else now))
+
+
+def backoff_delay(
+    attempt: int,
+    base: float = BACKOFF_BASE,
+    cap: float = BACKOFF_MAX,
+    rng: Callable[[], float] = random.random,
+) -> float:
+    """Get the full-jitter backoff before retry number attempt (0-based)."""
+    return rng() * min(cap, base * 2.0**attempt)
+
+
+class TokenBucket:
+    """Token-bucket rate limiter shared by concurrent requests.
+
+    Tokens refill at rate per second up to capacity; each request takes one.
+    pause() holds every caller back until a time, e.g. after a 429 with
+    Retry-After, so concurrent requests don't keep hitting the limit.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second (0 disables limiting).
+            capacity: Maximum burst. Defaults to max(1, rate).
+            clock: Monotonic time source (for tests).
+            sleep: Async sleep (for tests).
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock: asyncio.Lock | None = None
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for the next seconds."""
+        self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+    async def acquire(self) -> float:
+        """Wait for a token.
+
+        Returns:
+            Seconds spent waiting.
+        """
+        if self.rate <= 0 and self._paused_until <= self._clock():
+            return 0.0
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        waited = 0.0
+        # Callers queue on the lock, so tokens are handed out in arrival order
+        async with self._lock:
+            while True:
+                now = self._clock()
+                if now < self._paused_until:
+                    delay = self._paused_until - now
+                else:
+                    if self.rate <= 0:
+                        return waited
+                    self._tokens = min(
+                        self.capacity, self._tokens + (now - self._updated) * self.rate
+                    )
+                    self._updated = now
+                    if self._tokens >= 1 - _TOKEN_EPSILON:
+                        self._tokens = max(0.0, self._tokens - 1)
+                        return waited
+                    delay = (1 - self._tokens) / self.rate
+                await self._sleep(delay)
+                waited += delay
+
+
+@dataclass
+class AttemptMetric:
+    """Timing of one HTTP attempt."""
+
+    method: str
+    path: str
+    attempt: int  # 0 for the first try
+    latency: float  # Seconds from sending to response headers (or failure)
+    waited: float  # Seconds spent on rate limiting and backoff before sending
+    status: int | None = None
+    error: str | None = None
+
+
+@dataclass
+class TransportMetrics:
+    """Per-attempt latency metrics collected by a RetryTransport."""
+
+    attempts: list[AttemptMetric] = field(default_factory=list)
+
+    def record(self, metric: AttemptMetric) -> None:
+        """Add one attempt."""
+        self.attempts.append(metric)
+
+    def summary(self) -> str:
+        """Summarize attempts, retries, throttling and latency percentiles."""
+        if not self.attempts:
+            return "no requests"
+        latencies = sorted(metric.latency for metric in self.attempts)
+        requests = sum(1 for metric in self.attempts if metric.attempt == 0)
+        retries = len(self.attempts) - requests
+        throttled = sum(1 for metric in self.attempts if metric.status == 429)
+        waited = sum(metric.waited for metric in self.attempts)
+
+        def percentile(p: float) -> float:
+            return latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000
+
+        return (
+            f"{requests} requests, {len(self.attempts)} attempts "
+            f"({retries} retries, {throttled} throttled), "
+            f"latency p50 {percentile(0.5):.0f}ms p95 {percentile(0.95):.0f}ms "
+            f"max {latencies[-1] * 1000:.0f}ms, waited {waited:.1f}s"
+        )
+
+
+class RetryTransport(httpx.AsyncBaseTransport):
+    """Transport that rate-limits, retries and times requests.
+
+    Wraps another transport. Every attempt first takes a token from the
+    shared TokenBucket. 429 responses are retried for any method, since
+    the server did not process them. 5xx responses and network errors
+    are only retried for idempotent methods; connection failures are the
+    exception, because the request was never sent. Retries wait for the
+    server's Retry-After when it is given, or else an exponential backoff
+    with full jitter.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        max_retries: int | None = None,
+        rate_limiter: TokenBucket | None = None,
+        metrics: TransportMetrics | None = None,
+        backoff_base: float = BACKOFF_BASE,
+        backoff_max: float = BACKOFF_MAX,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        """Initialize the transport.
+
+        Args:
+            transport: Transport that actually sends requests.
+            max_retries: Retries per request. Defaults to get_max_retries().
+            rate_limiter: Shared limiter. Defaults to a TokenBucket at get_rate_limit().
+            metrics: Collector for per-attempt metrics.
+            backoff_base: First backoff ceiling in seconds.
+            backoff_max: Largest backoff ceiling in seconds.
+            sleep: Async sleep (for tests).
+        """
+        self.transport = transport
+        self.max_retries = get_max_retries() if max_retries is None else max_retries
+        self.rate_limiter = rate_limiter or TokenBucket(get_rate_limit(), sleep=sleep)
+        self.metrics = metrics if metrics is not None else TransportMetrics()
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._sleep = sleep
+
+    def _backoff(self, attempt: int) -> float:
+        return backoff_delay(attempt, self.backoff_base, self.backoff_max)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request, retrying throttled and transient failures."""
+        idempotent = request.method in IDEMPOTENT_METHODS
+        attempt = 0
+        delay = 0.0
+        while True:
+            waited = delay + await self.rate_limiter.acquire()
+            started = time.perf_counter()
+            metric = AttemptMetric(request.method, request.url.path, attempt, 0.0, waited)
+            try:
+                response = await self.transport.handle_async_request(request)
+            except httpx.TransportError as e:
+                metric.latency = time.perf_counter() - started
+                metric.error = type(e).__name__
+                self.metrics.record(metric)
+                never_sent = isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout))
+                if attempt >= self.max_retries or not (idempotent or never_sent):
+                    raise
+                delay = self._backoff(attempt)
+            else:
+                metric.latency = time.perf_counter() - started
+                metric.status = response.status_code
+                self.metrics.record(metric)
+                status = response.status_code
+                retryable = status == 429 or (status in RETRYABLE_STATUS and idempotent)
+                if not retryable or attempt >= self.max_retries:
+                    return response
+
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                if retry_after is not None and retry_after > RETRY_AFTER_MAX:
+                    return response
+                await response.aclose()
+                delay = retry_after if retry_after is not None else self._backoff(attempt)
+                if status == 429:
+                    # Hold back every concurrent request, not just this one
+                    self.rate_limiter.pause(delay)
+
+            await self._sleep(delay)
+            attempt += 1
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+        await self.transport.aclose()
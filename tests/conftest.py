@@ -2,10 +2,13 @@
 
 import os
 import shutil
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
 
+from lyzr_kit.schemas.agent import Agent, ModelConfig
+
 SANDBOX_DIR = Path(__file__).parent / "sandbox"
 ROOT_DIR = Path(__file__).parent.parent
 ROOT_ENV_FILE = ROOT_DIR / ".env"
@@ -47,3 +50,26 @@ def setup_sandbox():
     _setup_env_for_tests()
     os.chdir(SANDBOX_DIR)
     yield
+
+
+@pytest.fixture
+def make_agent() -> Callable[..., Agent]:
+    """Factory for minimal valid agents (chat category, OpenAI model)."""
+
+    def _make_agent(
+        agent_id: str,
+        sub_agents: list[str] | None = None,
+        *,
+        name: str | None = None,
+        serial: int | None = None,
+    ) -> Agent:
+        return Agent(
+            id=agent_id,
+            name=name or f"Agent {agent_id}",
+            category="chat",
+            model=ModelConfig(provider="openai", name="gpt-4", credential_id="cred-1"),
+            serial=serial,
+            sub_agents=sub_agents or [],
+        )
+
+    return _make_agent
@@ -0,0 +1,110 @@
+"""Tests for frame-rate-limited chat rendering."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from lyzr_kit.commands._chat import RenderMetrics, RenderScheduler
+
+
+class FakeClock:
+    """Clock that only moves when told to."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _scheduler(clock: FakeClock, fps: float = 10.0) -> tuple[RenderScheduler, MagicMock]:
+    live = MagicMock()
+    frames = iter(range(1000))
+    return RenderScheduler(live, lambda: next(frames), fps=fps, clock=clock), live
+
+
+class TestRenderScheduler:
+    """Tests for RenderScheduler."""
+
+    def test_first_update_draws_immediately(self):
+        scheduler, live = _scheduler(FakeClock())
+
+        scheduler.update()
+
+        live.update.assert_called_once_with(0, refresh=True)
+        assert not scheduler.dirty
+
+    def test_bursts_are_coalesced(self):
+        """Updates within one frame interval should not draw until it has passed."""
+        clock = FakeClock()
+        scheduler, live = _scheduler(clock, fps=10)
+
+        scheduler.update()
+        for _ in range(50):
+            clock.now += 0.001
+            scheduler.update()
+        assert live.update.call_count == 1
+        assert scheduler.dirty
+
+        clock.now += 0.1
+        scheduler.update()
+        assert live.update.call_count == 2
+        assert scheduler.metrics.updates == 52
+
+    def test_flush_draws_pending_changes_once(self):
+        clock = FakeClock()
+        scheduler, live = _scheduler(clock)
+        scheduler.update()
+        scheduler.update()
+
+        scheduler.flush()
+        scheduler.flush()
+
+        assert live.update.call_count == 2
+
+    def test_next_frame_in(self):
+        clock = FakeClock()
+        scheduler, _ = _scheduler(clock, fps=10)
+        assert scheduler.next_frame_in() == 0.0
+
+        scheduler.update()
+        clock.now += 0.04
+
+        assert scheduler.next_frame_in() == pytest.approx(0.06)
+
+    def test_zero_fps_draws_every_update(self):
+        scheduler, live = _scheduler(FakeClock(), fps=0)
+
+        for _ in range(5):
+            scheduler.update()
+
+        assert live.update.call_count == 5
+
+    def test_frame_times_are_recorded(self):
+        clock = FakeClock()
+        live = MagicMock()
+
+        def slow_update(renderable, refresh):
+            clock.now += 0.004
+
+        live.update.side_effect = slow_update
+        scheduler = RenderScheduler(live, lambda: "frame", clock=clock)
+
+        scheduler.update()
+
+        assert scheduler.metrics.frame_times == [0.004]
+
+
+class TestRenderMetrics:
+    """Tests for RenderMetrics."""
+
+    def test_summary(self):
+        metrics = RenderMetrics(updates=10, frame_times=[0.001, 0.002, 0.004])
+
+        summary = metrics.summary()
+
+        assert "10 updates, 3 frames (7 coalesced)" in summary
+        assert "max 4.0ms" in summary
+
+    def test_empty_summary(self):
+        assert RenderMetrics().summary() == "no frames"
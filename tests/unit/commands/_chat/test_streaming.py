@@ -1,10 +1,93 @@
 """Tests for chat streaming helpers."""
 
+import asyncio
+import json
+import random
+from collections.abc import AsyncIterator
+from datetime import datetime
+
+import httpx
+import pytest
+
 from lyzr_kit.commands._chat import (
+    ChatEngine,
+    ChatStreamer,
     StreamState,
+    ThinkingDecoder,
     decode_sse_data,
     separate_thinking_content,
 )
+from lyzr_kit.commands._chat.streaming import SSE_ESCAPES
+from lyzr_kit.commands._websocket import ChatEvent, WebSocketClient
+from lyzr_kit.schemas.agent import Agent, ModelConfig
+from lyzr_kit.testing import FakeLyzrServer
+from lyzr_kit.testing.fake_server import _encode_sse
+from lyzr_kit.utils.auth import AuthConfig
+
+# (SSE data, decoded text) pairs the old chained str.replace decoder also got right
+SSE_CORPUS = [
+    ("", ""),
+    ("Hello", "Hello"),
+    (" world", " world"),
+    ("line\\nbreak", "line\nbreak"),
+    ("tab\\tstop", "tab\tstop"),
+    ("crlf\\r\\n", "crlf\r\n"),
+    ('say \\"hi\\"', 'say "hi"'),
+    ("it\\'s", "it's"),
+    ("R\\&D", "R&D"),
+    ("C:\\\\Users", "C:\\Users"),
+    ("&lt;div class=&quot;x&quot;&gt;", '<div class="x">'),
+    ("Tom &amp; Jerry", "Tom & Jerry"),
+    ("&apos;quoted&apos;", "'quoted'"),
+    ("&amp;lt;", "&lt;"),
+    ("&amplifier; &lt", "&amplifier; &lt"),
+    ("unknown \\x escape", "unknown \\x escape"),
+    ("trailing backslash \\", "trailing backslash \\"),
+    ('def f():\\n    return \\"ok\\"\\n', 'def f():\n    return "ok"\n'),
+    ("caf\u00e9 \u2192 \U0001f600", "caf\u00e9 \u2192 \U0001f600"),
+]
+
+# Escapes the old decoder decoded twice, corrupting literal backslashes
+SSE_DOUBLE_DECODED = [
+    ("C:\\\\new", "C:\\new"),
+    ("\\\\t", "\\t"),
+    ("a\\\\nb", "a\\nb"),
+    ("\\&amp;", "&amp;"),
+]
+
+
+def _reference_decode(data: str) -> str:
+    """Decode escapes one at a time, left to right."""
+    out = []
+    i = 0
+    while i < len(data):
+        for escape, text in SSE_ESCAPES.items():
+            if data.startswith(escape, i):
+                out.append(text)
+                i += len(escape)
+                break
+        else:
+            out.append(data[i])
+            i += 1
+    return "".join(out)
+
+
+def _chained_decode(data: str) -> str:
+    """The original decode_sse_data, kept as a reference."""
+    return (
+        data.replace("\\n", "\n")
+        .replace('\\"', '"')
+        .replace("\\'", "'")
+        .replace("\\&", "&")
+        .replace("\\r", "\r")
+        .replace("\\\\", "\\")
+        .replace("\\t", "\t")
+        .replace("&quot;", '"')
+        .replace("&apos;", "'")
+        .replace("&lt;", "<")
+        .replace("&gt;", ">")
+        .replace("&amp;", "&")
+    )
 
 
 class TestSeparateThinkingContent:
@@ -32,9 +115,97 @@ class TestSeparateThinkingContent:
         assert actual == "The answer is 42"
 
 
+def _decode(chunks: list[str]) -> tuple[list[str], str]:
+    """Feed chunks through a ThinkingDecoder and return (blocks, content)."""
+    decoder = ThinkingDecoder()
+    blocks: list[str] = []
+    content = ""
+    for chunk in [*chunks, None]:
+        decoded = decoder.feed(chunk) if chunk is not None else decoder.finish()
+        blocks.extend(decoded.blocks)
+        content += decoded.content
+    return blocks, content
+
+
+class TestThinkingDecoder:
+    """Tests for incremental <think> tag decoding."""
+
+    def test_matches_separate_thinking_content_at_every_split(self):
+        """Tags split across chunk boundaries should decode the same as one buffer."""
+        text = "<think>Step 1: Analyze\nStep 2: Process</think>  The answer is 42"
+        thinking, content = separate_thinking_content(text)
+        for split in range(len(text) + 1):
+            assert _decode([text[:split], text[split:]]) == ([thinking], content), split
+
+    def test_one_character_chunks(self):
+        text = "<think> plan </think>\nDone."
+        assert _decode(list(text)) == (["plan"], "Done.")
+
+    def test_without_think_tags(self):
+        assert _decode(["Just a ", "regular response"]) == ([], "Just a regular response")
+
+    def test_lookalike_tags_are_content(self):
+        """A held-back partial tag should be released when it turns out not to be one."""
+        assert _decode(["a <thi", "s is not a tag", " <"]) == ([], "a <this is not a tag <")
+
+    def test_thinking_deltas_stream_before_the_block_closes(self):
+        decoder = ThinkingDecoder()
+        decoded = decoder.feed("<think>partial thought")
+        assert decoded.thinking == "partial thought"
+        assert decoded.content == ""
+        assert decoder.in_think
+
+    def test_unclosed_block_is_shown_as_content(self):
+        """A <think> block never closed should be returned as the model sent it."""
+        assert _decode(["Hi <think>never", " closed</th"]) == ([], "Hi <think>never closed</th")
+
+    def test_multiple_blocks(self):
+        blocks, content = _decode(["<think>a</think>one <think>b</think> two"])
+        assert blocks == ["a", "b"]
+        assert content == "one two"
+
+    def test_long_answer_in_small_chunks(self):
+        """A 60k character answer should decode exactly, chunk by chunk."""
+        body = "def f():\n    return '<tag>'\n" * 2000
+        text = "<think>" + "reasoning " * 500 + "</think>" + body
+        chunks = [text[i : i + 7] for i in range(0, len(text), 7)]
+
+        blocks, content = _decode(chunks)
+
+        assert blocks == [("reasoning " * 500).strip()]
+        assert content == body
+
+
 class TestDecodeSSEData:
     """Tests for SSE data decoding."""
 
+    @pytest.mark.parametrize(("data", "expected"), SSE_CORPUS)
+    def test_corpus(self, data, expected):
+        assert decode_sse_data(data) == expected
+        assert _chained_decode(data) == expected
+
+    @pytest.mark.parametrize(("data", "expected"), SSE_DOUBLE_DECODED)
+    def test_escapes_are_decoded_once(self, data, expected):
+        """Text produced by an escape should not be decoded again."""
+        assert decode_sse_data(data) == expected
+        assert _chained_decode(data) != expected
+
+    def test_matches_reference_decoder(self):
+        """Random escape-dense strings should decode like a left-to-right scan."""
+        rng = random.Random(0)
+        # Includes the control characters decode_sse_data uses as sentinels
+        pieces = [*SSE_ESCAPES, "\\", "&", "amp;", "lt;", "n", "t", "x", " ", "é", "\x00", "\x01"]
+        for _ in range(2000):
+            data = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 12)))
+            assert decode_sse_data(data) == _reference_decode(data), repr(data)
+
+    @pytest.mark.parametrize(
+        "text", ["C:\\new\\table", 'print("a\\nb")\n', "\\\\\\", 'a\\tb "c"\n\\']
+    )
+    def test_round_trips_server_encoding(self, text):
+        """Text escaped the way the inference API does should decode to itself."""
+        assert decode_sse_data(_encode_sse(text)) == text
+
     def test_escapes(self):
         """Should decode common escape sequences."""
         data = 'Hello\\nWorld\\t"quoted"'
@@ -74,6 +245,16 @@ class TestStreamState:
         assert state.latency_ms == 500.0  # 0.5 seconds = 500ms
         assert state.total_time_ms == 2000.0  # 2 seconds = 2000ms
 
+    def test_append_content(self):
+        """Appended chunks should read back as one string."""
+        state = StreamState()
+        for chunk in ("Hello", ", ", "world"):
+            state.append_content(chunk)
+        assert state.content == "Hello, world"
+
+        state.append_content("!")
+        assert state.content == "Hello, world!"
+
     def test_clear(self):
         """StreamState clear should reset all values."""
         state = StreamState()
@@ -88,3 +269,128 @@ class TestStreamState:
         assert state.is_streaming is False
         assert state.start_time == 0.0
         assert state.error is None
+
+
+class TestChatStreamerEndpoints:
+    """Tests for ChatStreamer against configurable endpoints."""
+
+    def test_streams_from_configured_endpoints(self):
+        """Chat should use AuthConfig.stream_url and websocket_url."""
+        model = ModelConfig(provider="openai", name="gpt-4o", credential_id="cred")
+        agent = Agent(
+            id="chat-agent",
+            name="Chat",
+            category="chat",
+            model=model,
+            platform_agent_id="platform-1",
+        )
+        with (
+            FakeLyzrServer() as server,
+            ChatStreamer(server.auth_config(), agent, "session-1") as streamer,
+        ):
+            streamer.stream_message("hi")
+
+        assert streamer.state.error is None
+        assert streamer.state.content.startswith("Hello from the fake Lyzr server.")
+        assert "<think>" not in streamer.state.content
+        thinking = [e for e in streamer.state.events if e.event_type == "thinking"]
+        assert [e.message for e in thinking] == ["The user wants a short answer."]
+        assert [r.path for r in server.requests] == ["/v3/inference/stream/"]
+        metrics = streamer.render_metrics
+        assert 0 < len(metrics.frame_times) <= metrics.updates
+
+    def test_session_shares_one_websocket(self):
+        """Every message of a session should use the same event connection."""
+        model = ModelConfig(provider="openai", name="gpt-4o", credential_id="cred")
+        agent = Agent(
+            id="chat-agent",
+            name="Chat",
+            category="chat",
+            model=model,
+            platform_agent_id="platform-1",
+        )
+        with FakeLyzrServer() as server:
+            with ChatStreamer(server.auth_config(), agent, "session-1") as streamer:
+                turns = []
+                for message in ("hi", "again"):
+                    streamer.stream_message(message)
+                    turns.append([event.event_type for event in streamer.state.events])
+
+            assert server.websocket_connections == 1
+
+        for event_types in turns:
+            assert "agent_process_start" in event_types
+
+
+def _chat_agent() -> Agent:
+    model = ModelConfig(provider="openai", name="gpt-4o", credential_id="cred")
+    return Agent(
+        id="chat-agent", name="Chat", category="chat", model=model, platform_agent_id="platform-1"
+    )
+
+
+def _engine(handler, events: WebSocketClient | None = None) -> ChatEngine:
+    """Build a ChatEngine whose HTTP client is served by handler."""
+    auth = AuthConfig(api_key="test-key")
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return ChatEngine(auth, _chat_agent(), "session-1", client, events=events)
+
+
+class TestChatEngine:
+    """Tests for the asyncio ChatEngine."""
+
+    def test_events_are_shown_while_sse_is_silent(self):
+        """A WebSocket event should be applied without waiting for the next SSE line."""
+        events = WebSocketClient("session-1", "key")
+        events._on_connect()  # Pretend the socket is up
+        seen_during_gap: list[bool] = []
+
+        async def body() -> AsyncIterator[bytes]:
+            yield b"data: Hello\n\n"
+            events._receive(ChatEvent(event_type="tool_call_prepare", timestamp=datetime.now()))
+            for _ in range(200):
+                if engine.state.has_event("tool_call_prepare"):
+                    break
+                await asyncio.sleep(0.01)
+            seen_during_gap.append(engine.state.has_event("tool_call_prepare"))
+            yield b"data:  world\n\ndata: [DONE]\n\n"
+
+        engine = _engine(lambda request: httpx.Response(200, content=body()), events)
+        asyncio.run(engine.stream_message("hi"))
+
+        assert seen_during_gap == [True]
+        assert engine.state.content == "Hello world"
+        assert engine.state.error is None
+        assert not engine.state.is_streaming
+
+    def test_error_status(self):
+        engine = _engine(lambda request: httpx.Response(500))
+
+        asyncio.run(engine.stream_message("hi"))
+
+        assert engine.state.error == "API returned status 500"
+        assert engine.state.end_time > 0
+
+    def test_error_event(self):
+        content = b"data: partial\n\ndata: [ERROR] model overloaded\n\n"
+        engine = _engine(lambda request: httpx.Response(200, content=content))
+
+        asyncio.run(engine.stream_message("hi"))
+
+        assert engine.state.content == "partial"
+        assert engine.state.error == "model overloaded"
+
+    def test_sends_message_payload(self):
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, content=b"data: [DONE]\n\n")
+
+        engine = _engine(handler)
+        asyncio.run(engine.stream_message("hello there"))
+
+        payload = json.loads(requests[0].content)
+        assert payload["message"] == "hello there"
+        assert payload["agent_id"] == "platform-1"
+        assert requests[0].headers["x-api-key"] == "test-key"
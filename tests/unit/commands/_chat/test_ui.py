@@ -1,11 +1,19 @@
 """Tests for chat UI component builders."""
 
+import io
 from datetime import datetime
 from unittest.mock import MagicMock
 
+from rich.console import Console
 from rich.panel import Panel
 
-from lyzr_kit.commands._chat import StreamState, build_agent_box, build_session_box, build_user_box
+from lyzr_kit.commands._chat import (
+    AgentBox,
+    StreamState,
+    build_agent_box,
+    build_session_box,
+    build_user_box,
+)
 from lyzr_kit.commands._websocket import ChatEvent
 
 
@@ -136,3 +144,63 @@ class TestBuildAgentBox:
         # Subtitle should contain latency
         assert panel.subtitle is not None
         assert "1.50s" in str(panel.subtitle)
+
+
+def _rendered(panel: Panel) -> str:
+    """Render a panel to plain text."""
+    console = Console(file=io.StringIO(), width=60, color_system=None)
+    console.print(panel)
+    return console.file.getvalue()
+
+
+class TestAgentBox:
+    """Tests for the incrementally updated AgentBox."""
+
+    def test_matches_fresh_box_at_every_step(self):
+        """An updated box should render like one built from scratch."""
+        state = StreamState(is_streaming=True, start_time=1000.0)
+        box = AgentBox(state, "14:32:21")
+        event = ChatEvent(
+            event_type="tool_call_prepare", timestamp=datetime.now(), function_name="search"
+        )
+
+        steps = [
+            lambda: None,
+            lambda: state.append_content("Hello"),
+            lambda: state.append_content(", world"),
+            lambda: state.add_event(event),
+            lambda: state.append_content("!\nSecond line"),
+            lambda: setattr(state, "error", "stream cut"),
+            lambda: setattr(state, "is_streaming", False),
+            lambda: setattr(state, "end_time", 1002.0),
+        ]
+        for step in steps:
+            step()
+            assert _rendered(box.render()) == _rendered(build_agent_box(state, "14:32:21"))
+
+    def test_streamed_text_is_appended_in_place(self):
+        """New content alone should reuse the panel and its response Text."""
+        state = StreamState(is_streaming=True)
+        state.append_content("Hello")
+        box = AgentBox(state, "14:32:21")
+        panel = box.render()
+
+        state.append_content(" there")
+
+        assert box.render() is panel
+        assert "Hello there" in _rendered(panel)
+
+    def test_cleared_state_starts_over(self):
+        """Content that no longer extends the rendered text should be rebuilt."""
+        state = StreamState(is_streaming=True)
+        state.append_content("First answer")
+        box = AgentBox(state, "14:32:21")
+        box.render()
+
+        state.clear()
+        state.is_streaming = True
+        state.append_content("Second")
+
+        output = _rendered(box.render())
+        assert "Second" in output
+        assert "First" not in output
@@ -1,8 +1,18 @@
 """Tests for WebSocket event handling."""
 
-from datetime import datetime
+import asyncio
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
 
-from lyzr_kit.commands._websocket import ChatEvent, EventState, parse_event
+from lyzr_kit.commands._websocket import (
+    ChatEvent,
+    EventState,
+    WebSocketClient,
+    build_websocket_url,
+    parse_event,
+)
+from lyzr_kit.testing import FakeLyzrServer
 
 
 class TestChatEventFormatting:
@@ -106,3 +116,125 @@ class TestEventState:
 
         assert len(state.events) == 0
         assert state.error is None
+
+
+class TestWebSocketClient:
+    """Tests for WebSocketClient endpoints."""
+
+    def test_build_websocket_url(self):
+        url = build_websocket_url("ws://localhost:8766/", "session-1", "key")
+        assert url == "ws://localhost:8766/ws/session-1?x-api-key=key"
+
+    def test_connects_to_configured_base_url(self):
+        """The client should receive events from the server it was pointed at."""
+        with FakeLyzrServer() as server:
+
+            async def run() -> list[str]:
+                client = WebSocketClient("session-1", "key", base_url=server.websocket_url)
+                await client.start()
+                for _ in range(100):
+                    if client.is_connected:
+                        break
+                    await asyncio.sleep(0.01)
+                await asyncio.to_thread(server.publish, "session-1", "agent_process_start")
+                for _ in range(100):
+                    if client.get_events():
+                        break
+                    await asyncio.sleep(0.01)
+                await client.stop()
+                return [event.event_type for event in client.get_events()]
+
+            assert asyncio.run(run()) == ["agent_process_start"]
+
+
+async def _wait_for(predicate: Callable[[], object], timeout: float = 5.0) -> bool:
+    """Poll until predicate is truthy or timeout passes."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        await asyncio.sleep(0.01)
+    return False
+
+
+class TestSessionWebSocket:
+    """Tests for WebSocketClient kept open for a whole chat session."""
+
+    def test_turn_events_are_routed(self):
+        """Events published during a turn should reach the turn's sink."""
+        events: list[ChatEvent] = []
+        with FakeLyzrServer() as server:
+            client = WebSocketClient("session-1", "key", base_url=server.websocket_url)
+
+            async def run() -> None:
+                await client.start()
+                try:
+                    assert await _wait_for(lambda: server.websocket_connections == 1)
+                    client.begin_turn(events.append)
+                    await asyncio.to_thread(server.publish, "session-1", "agent_process_start")
+                    assert await _wait_for(lambda: events)
+                finally:
+                    await client.stop()
+
+            asyncio.run(run())
+
+        assert [event.event_type for event in events] == ["agent_process_start"]
+        assert not client.is_connected
+
+    def test_reconnects_after_drop(self):
+        """A dropped connection should be re-established and keep delivering events."""
+        events: list[ChatEvent] = []
+        with FakeLyzrServer() as server:
+            client = WebSocketClient("session-1", "key", base_url=server.websocket_url)
+
+            async def run() -> None:
+                await client.start()
+                try:
+                    assert await _wait_for(lambda: server.websocket_connections == 1)
+                    await asyncio.to_thread(server.drop_websockets, "session-1")
+                    assert await _wait_for(lambda: server.websocket_connections == 2)
+                    assert await asyncio.to_thread(client.wait_connected, 5)
+
+                    client.begin_turn(events.append)
+                    await asyncio.to_thread(server.publish, "session-1", "tool_response")
+                    assert await _wait_for(lambda: events)
+                finally:
+                    await client.stop()
+
+            asyncio.run(run())
+
+        assert client.connections == 2
+
+    def test_events_outside_a_turn_are_not_routed(self):
+        """Events arriving after end_turn() should not reach the finished turn's sink."""
+        events: list[ChatEvent] = []
+        client = WebSocketClient("session-1", "key")
+        client.begin_turn(events.append)
+        client._receive(ChatEvent(event_type="tool_response", timestamp=datetime.now()))
+        client.end_turn()
+        client._receive(ChatEvent(event_type="llm_response", timestamp=datetime.now()))
+
+        assert [event.event_type for event in events] == ["tool_response"]
+
+    def test_begin_turn_forgets_previous_turn(self):
+        """begin_turn() should drop the previous turn's events and dedup hashes."""
+        client = WebSocketClient("session-1", "key")
+        event = ChatEvent(event_type="tool_response", timestamp=datetime.now(timezone.utc))
+        client.begin_turn()
+        client.state.add_event(event)
+
+        client.begin_turn()
+
+        assert client.get_events() == []
+        assert client.state.add_event(event) is True
+
+    def test_stale_events_are_dropped(self):
+        """Events stamped well before the turn began belong to an earlier turn."""
+        events: list[ChatEvent] = []
+        client = WebSocketClient("session-1", "key")
+        client.begin_turn(events.append)
+        old = datetime.now(timezone.utc) - timedelta(minutes=1)
+        client._receive(ChatEvent(event_type="tool_response", timestamp=old))
+        client._receive(ChatEvent(event_type="llm_response", timestamp=datetime.now(timezone.utc)))
+
+        assert [event.event_type for event in events] == ["llm_response"]
@@ -1,16 +1,52 @@
 """Unit tests for 'lk agent get' command."""
 
+import threading
+import time
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import httpx
+import pytest
+import typer
 from typer.testing import CliRunner
 
+from lyzr_kit.commands.agent_get import CLONE_WORKERS_ENV, _build_clone_plan
 from lyzr_kit.main import app
+from lyzr_kit.schemas.agent import Agent, ModelConfig
+from lyzr_kit.storage import CloneJournal, StorageManager
+from lyzr_kit.storage.journal import JOURNAL_DIR
 from lyzr_kit.utils.auth import AuthConfig, AuthError
-from lyzr_kit.utils.platform import AgentResponse, PlatformError
+from lyzr_kit.utils.platform import AgentResponse, PlatformError, PlatformSession
 
 runner = CliRunner()
 
 
+class TestAgentGetConnectionReuse:
+    """Tests for HTTP client sharing in 'lk agent get'."""
+
+    @patch("lyzr_kit.commands._auth_helper.validate_auth")
+    @patch("lyzr_kit.commands._auth_helper.load_auth")
+    @patch("lyzr_kit.commands.agent_get.PlatformClient")
+    def test_auth_and_platform_share_client(
+        self, mock_platform_class, mock_load_auth, mock_validate
+    ):
+        """The health check and create calls should use one pooled session."""
+        mock_load_auth.return_value = AuthConfig(api_key="test-key")
+        mock_validate.return_value = True
+        mock_platform_class.return_value.create_agent.return_value = AgentResponse(
+            agent_id="agent-123",
+            env_id="env-456",
+            endpoint="https://api.example.com/chat/agent-123",
+        )
+
+        result = runner.invoke(app, ["agent", "get", "chat-agent"], input="y\n")
+        assert result.exit_code == 0
+
+        shared = mock_validate.call_args.kwargs["client"]
+        assert mock_platform_class.call_args.kwargs["session"] is shared
+        assert shared.is_closed
+
+
 class TestAgentGetSerialNumbers:
     """Tests for serial number support in 'lk agent get' command."""
 
@@ -129,6 +165,265 @@ class TestAgentGetErrors:
             assert "Cancelled" in result.output
 
 
+class RecordingPlatform:
+    """Fake PlatformClient that records concurrency and creation order."""
+
+    def __init__(self, delay: float = 0.05, fail_ids: tuple[str, ...] = ()) -> None:
+        self.delay = delay
+        self.fail_ids = fail_ids
+        self.created: list[str] = []
+        self.sub_agents: dict[str, list[str]] = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def create_agent(self, agent: Agent) -> AgentResponse:
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            self.sub_agents[agent.id] = list(agent.sub_agents)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+            if agent.id in self.fail_ids:
+                raise PlatformError("API error")
+            self.created.append(agent.id)
+        return AgentResponse(
+            agent_id=f"platform-{agent.id}",
+            env_id="env",
+            endpoint="https://api.example.com/chat/",
+        )
+
+
+class TestAgentGetConcurrentClone:
+    """Tests for DAG-ordered, concurrent clone execution."""
+
+    @pytest.fixture(autouse=True)
+    def _auth(self):
+        with (
+            patch("lyzr_kit.commands._auth_helper.validate_auth", return_value=True),
+            patch(
+                "lyzr_kit.commands._auth_helper.load_auth",
+                return_value=AuthConfig(api_key="test-key"),
+            ),
+        ):
+            yield
+
+    def _clone(self, platform: RecordingPlatform, source_id: str = "tech-director"):
+        with patch("lyzr_kit.commands.agent_get.PlatformClient", return_value=platform):
+            return runner.invoke(app, ["agent", "get", source_id], input="y\n")
+
+    def test_siblings_are_created_concurrently(self):
+        """Independent sub-agents should be created in parallel."""
+        platform = RecordingPlatform()
+        result = self._clone(platform)
+
+        assert result.exit_code == 0, result.output
+        assert len(platform.created) == 8
+        assert platform.max_in_flight > 1
+
+    def test_parents_wait_for_their_sub_agents(self):
+        """A parent should be created after every sub-agent, with remapped IDs."""
+        platform = RecordingPlatform()
+        result = self._clone(platform)
+        assert result.exit_code == 0, result.output
+
+        position = {agent_id: i for i, agent_id in enumerate(platform.created)}
+        assert platform.created[-1] == "copy-of-tech-director"
+        for agent_id, sub_ids in platform.sub_agents.items():
+            for sub_id in sub_ids:
+                assert sub_id.startswith("copy-of-")
+                assert position[sub_id] < position[agent_id]
+
+        saved = (Path.cwd() / "agents" / "copy-of-tech-director.yaml").read_text()
+        assert "copy-of-dev-lead" in saved
+
+    def test_clone_records_pushed_hashes(self):
+        """Cloned agents should not count as changed for 'lk agent set --all'."""
+        result = self._clone(RecordingPlatform(delay=0))
+        assert result.exit_code == 0, result.output
+
+        pushed = StorageManager().get_pushed_hashes()
+        assert len(pushed) == 8
+        assert "platform-copy-of-tech-director" in pushed
+
+    def test_worker_override_creates_one_at_a_time(self, monkeypatch):
+        """LK_CLONE_WORKERS=1 should make platform calls sequential."""
+        monkeypatch.setenv(CLONE_WORKERS_ENV, "1")
+        platform = RecordingPlatform(delay=0.01)
+        result = self._clone(platform)
+
+        assert result.exit_code == 0, result.output
+        assert platform.max_in_flight == 1
+
+    def test_failure_stops_dependents_and_keeps_finished_agents(self):
+        """A failed sub-agent should block its parents but keep created siblings."""
+        platform = RecordingPlatform(fail_ids=("copy-of-code-reviewer",))
+        result = self._clone(platform)
+
+        assert result.exit_code == 1
+        assert "Platform Error creating 'copy-of-code-reviewer'" in result.output
+        assert "copy-of-dev-lead" not in platform.created
+        assert "copy-of-tech-director" not in platform.created
+        for agent_id in platform.created:
+            assert (Path.cwd() / "agents" / f"{agent_id}.yaml").exists()
+
+    def test_shared_sub_agent_is_planned_once(self):
+        """A sub-agent used by two siblings should only be cloned once."""
+        model = ModelConfig(provider="openai", name="gpt-4", credential_id="cred")
+        agents = {
+            "root": Agent(
+                id="root", name="Root", category="chat", model=model, sub_agents=["left", "right"]
+            ),
+            "left": Agent(
+                id="left", name="Left", category="chat", model=model, sub_agents=["shared"]
+            ),
+            "right": Agent(
+                id="right", name="Right", category="chat", model=model, sub_agents=["shared"]
+            ),
+            "shared": Agent(id="shared", name="Shared", category="chat", model=model),
+        }
+        storage = MagicMock()
+        storage.get_agent.side_effect = lambda agent_id: agents[agent_id].model_copy()
+        storage.agent_exists_local.return_value = False
+        storage.agent_exists.return_value = False
+
+        plan = _build_clone_plan("root", storage)
+
+        assert [item.source_id for item in plan] == ["shared", "left", "right", "root"]
+        assert plan[-1].is_main
+
+    def test_cycle_in_plan_is_rejected(self):
+        """A sub-agent cycle should still abort planning."""
+        model = ModelConfig(provider="openai", name="gpt-4", credential_id="cred")
+        agents = {
+            "loop-a": Agent(
+                id="loop-a", name="A", category="chat", model=model, sub_agents=["loop-b"]
+            ),
+            "loop-b": Agent(
+                id="loop-b", name="B", category="chat", model=model, sub_agents=["loop-a"]
+            ),
+        }
+        storage = MagicMock()
+        storage.get_agent.side_effect = lambda agent_id: agents[agent_id].model_copy()
+        storage.agent_exists_local.return_value = False
+
+        with pytest.raises(typer.Exit):
+            _build_clone_plan("loop-a", storage)
+
+
+class TestAgentGetResume:
+    """Tests for resuming a failed clone from its journal."""
+
+    @pytest.fixture(autouse=True)
+    def _auth(self):
+        with (
+            patch("lyzr_kit.commands._auth_helper.validate_auth", return_value=True),
+            patch(
+                "lyzr_kit.commands._auth_helper.load_auth",
+                return_value=AuthConfig(api_key="test-key"),
+            ),
+        ):
+            yield
+
+    def _clone(self, platform: RecordingPlatform, *args: str):
+        with patch("lyzr_kit.commands.agent_get.PlatformClient", return_value=platform):
+            return runner.invoke(app, ["agent", "get", "tech-director", *args], input="y\n")
+
+    def _journals(self) -> list[Path]:
+        return sorted((Path.cwd() / JOURNAL_DIR).glob("*.jsonl"))
+
+    def _fail_once(self) -> RecordingPlatform:
+        platform = RecordingPlatform(delay=0, fail_ids=("copy-of-code-reviewer",))
+        result = self._clone(platform)
+        assert result.exit_code == 1
+        return platform
+
+    def test_failure_keeps_journal_and_suggests_resume(self):
+        """A failed clone should journal every finished create."""
+        platform = self._fail_once()
+
+        journals = self._journals()
+        assert len(journals) == 1
+        assert journals[0].name.startswith("tech-director-")
+        entries = CloneJournal(journals[0]).load()
+        assert {entry.target_id for entry in entries.values()} == set(platform.created)
+
+    def test_resume_skips_finished_agents(self):
+        """--resume should only create what the failed run did not."""
+        first = self._fail_once()
+
+        platform = RecordingPlatform(delay=0)
+        result = self._clone(platform, "--resume")
+
+        assert result.exit_code == 0, result.output
+        assert "done" in result.output
+        assert not set(platform.created) & set(first.created)
+        assert len(platform.created) + len(first.created) == 8
+        assert "copy-of-code-reviewer" in platform.created
+        # Parents reference the agents the first run created, not new copies
+        assert all(
+            not sub_id.endswith("-2") for subs in platform.sub_agents.values() for sub_id in subs
+        )
+        assert not list((Path.cwd() / "agents").glob("*-2.yaml"))
+        assert self._journals() == []
+
+    def test_resume_saves_journaled_agent_missing_locally(self):
+        """An agent created on the platform but never saved should be written, not recreated."""
+        first = self._fail_once()
+        lost = first.created[0]
+        (Path.cwd() / "agents" / f"{lost}.yaml").unlink()
+
+        platform = RecordingPlatform(delay=0)
+        result = self._clone(platform, "--resume")
+
+        assert result.exit_code == 0, result.output
+        assert lost not in platform.created
+        saved = StorageManager().get_agent(lost)
+        assert saved is not None
+        assert saved.platform_agent_id == f"platform-{lost}"
+
+    def test_edits_before_resume_are_still_pushed_by_set_all(self):
+        """Resuming should not mark a reused agent's unpushed local edits as synced."""
+        first = self._fail_once()
+        edited_id = first.created[0]
+        storage = StorageManager()
+        edited = storage.get_agent(edited_id)
+        assert edited is not None
+        edited.description = "Edited between the failed run and --resume"
+        storage.save_agent(edited)
+
+        result = self._clone(RecordingPlatform(delay=0), "--resume")
+        assert result.exit_code == 0, result.output
+
+        updated: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            updated.append(request.url.path.rsplit("/", 1)[-1])
+            return httpx.Response(200, json={})
+
+        def session() -> PlatformSession:
+            return PlatformSession(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+        with patch("lyzr_kit.commands.agent_set.PlatformSession", side_effect=session):
+            synced = runner.invoke(app, ["agent", "set", "--all"])
+
+        assert synced.exit_code == 0, synced.output
+        assert updated == [f"platform-{edited_id}"]
+
+    def test_fresh_run_warns_and_starts_over(self):
+        """Without --resume, a leftover journal should be reported and replaced."""
+        self._fail_once()
+
+        platform = RecordingPlatform(delay=0)
+        result = self._clone(platform)
+
+        assert result.exit_code == 0, result.output
+        assert "--resume" in result.output
+        assert len(platform.created) == 8
+        assert self._journals() == []
+
+
 class TestAgentGetHelp:
     """Tests for agent get help."""
 
@@ -6,7 +6,7 @@ from unittest.mock import MagicMock, patch
 import yaml
 from typer.testing import CliRunner
 
-from lyzr_kit.commands.agent_list import _count_sub_agents_recursive
+from lyzr_kit.commands.agent_list import _count_sub_agents, _count_sub_agents_recursive
 from lyzr_kit.main import app
 from lyzr_kit.schemas.agent import Agent, ModelConfig
 from lyzr_kit.storage.validator import ValidationResult
@@ -198,56 +198,46 @@ class TestAgentLs:
 class TestCountSubAgentsRecursive:
     """Tests for _count_sub_agents_recursive function."""
 
-    def _make_agent(self, agent_id: str, sub_agents: list[str] | None = None) -> Agent:
-        """Helper to create a minimal agent."""
-        return Agent(
-            id=agent_id,
-            name=agent_id.title(),
-            category="chat",
-            model=ModelConfig(provider="openai", name="gpt-4", credential_id="cred-1"),
-            sub_agents=sub_agents or [],
-        )
-
-    def test_no_sub_agents(self):
+    def test_no_sub_agents(self, make_agent):
         """Should return 0 for agent with no sub-agents."""
-        agent = self._make_agent("solo-agent")
+        agent = make_agent("solo-agent")
         agent_map = {"solo-agent": agent}
 
         count = _count_sub_agents_recursive(agent, agent_map)
         assert count == 0
 
-    def test_direct_sub_agents_only(self):
+    def test_direct_sub_agents_only(self, make_agent):
         """Should count direct sub-agents."""
-        parent = self._make_agent("parent", ["child1", "child2"])
-        child1 = self._make_agent("child1")
-        child2 = self._make_agent("child2")
+        parent = make_agent("parent", ["child1", "child2"])
+        child1 = make_agent("child1")
+        child2 = make_agent("child2")
         agent_map = {"parent": parent, "child1": child1, "child2": child2}
 
         count = _count_sub_agents_recursive(parent, agent_map)
         assert count == 2
 
-    def test_nested_sub_agents(self):
+    def test_nested_sub_agents(self, make_agent):
         """Should count nested sub-agents recursively."""
         # grandparent -> parent -> child (3 levels)
-        grandparent = self._make_agent("grandparent", ["parent"])
-        parent = self._make_agent("parent", ["child"])
-        child = self._make_agent("child")
+        grandparent = make_agent("grandparent", ["parent"])
+        parent = make_agent("parent", ["child"])
+        child = make_agent("child")
         agent_map = {"grandparent": grandparent, "parent": parent, "child": child}
 
         count = _count_sub_agents_recursive(grandparent, agent_map)
         assert count == 2  # parent + child
 
-    def test_complex_tree(self):
+    def test_complex_tree(self, make_agent):
         """Should count all agents in a complex tree."""
         # root -> [branch1, branch2]
         # branch1 -> [leaf1, leaf2]
         # branch2 -> [leaf3]
-        root = self._make_agent("root", ["branch1", "branch2"])
-        branch1 = self._make_agent("branch1", ["leaf1", "leaf2"])
-        branch2 = self._make_agent("branch2", ["leaf3"])
-        leaf1 = self._make_agent("leaf1")
-        leaf2 = self._make_agent("leaf2")
-        leaf3 = self._make_agent("leaf3")
+        root = make_agent("root", ["branch1", "branch2"])
+        branch1 = make_agent("branch1", ["leaf1", "leaf2"])
+        branch2 = make_agent("branch2", ["leaf3"])
+        leaf1 = make_agent("leaf1")
+        leaf2 = make_agent("leaf2")
+        leaf3 = make_agent("leaf3")
         agent_map = {
             "root": root,
             "branch1": branch1,
@@ -260,20 +250,36 @@ class TestCountSubAgentsRecursive:
         count = _count_sub_agents_recursive(root, agent_map)
         assert count == 5  # branch1 + branch2 + leaf1 + leaf2 + leaf3
 
-    def test_missing_sub_agent_in_map(self):
+    def test_missing_sub_agent_in_map(self, make_agent):
         """Should handle sub-agents not in the map (external references)."""
-        parent = self._make_agent("parent", ["child", "missing-agent"])
-        child = self._make_agent("child")
+        parent = make_agent("parent", ["child", "missing-agent"])
+        child = make_agent("child")
         agent_map = {"parent": parent, "child": child}  # missing-agent not in map
 
         count = _count_sub_agents_recursive(parent, agent_map)
         assert count == 2  # child + missing-agent (counted but not recursed)
 
-    def test_cycle_detection(self):
+    def test_shared_sub_agent_counted_once(self, make_agent):
+        """Should count a sub-agent shared by two branches once."""
+        root = make_agent("root", ["branch1", "branch2"])
+        branch1 = make_agent("branch1", ["shared"])
+        branch2 = make_agent("branch2", ["shared"])
+        shared = make_agent("shared")
+        agent_map = {a.id: a for a in (root, branch1, branch2, shared)}
+
+        assert _count_sub_agents_recursive(root, agent_map) == 3
+        assert _count_sub_agents(agent_map) == {
+            "root": 3,
+            "branch1": 1,
+            "branch2": 1,
+            "shared": 0,
+        }
+
+    def test_cycle_detection(self, make_agent):
         """Should handle cycles without infinite recursion."""
         # agent1 -> agent2 -> agent1 (cycle)
-        agent1 = self._make_agent("agent1", ["agent2"])
-        agent2 = self._make_agent("agent2", ["agent1"])
+        agent1 = make_agent("agent1", ["agent2"])
+        agent2 = make_agent("agent2", ["agent1"])
         agent_map = {"agent1": agent1, "agent2": agent2}
 
         count = _count_sub_agents_recursive(agent1, agent_map)
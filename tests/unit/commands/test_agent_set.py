@@ -3,11 +3,14 @@
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import httpx
+import pytest
 from typer.testing import CliRunner
 
 from lyzr_kit.main import app
+from lyzr_kit.storage import StorageManager
 from lyzr_kit.utils.auth import AuthConfig, AuthError
-from lyzr_kit.utils.platform import PlatformError
+from lyzr_kit.utils.platform import PlatformError, PlatformSession
 
 runner = CliRunner()
 
@@ -210,3 +213,129 @@ class TestAgentSetHelp:
         assert result.exit_code == 0
         assert "IDENTIFIER" in result.output
         assert "Sync" in result.output or "platform" in result.output.lower()
+
+
+def _write_synced_agent(agent_id: str, description: str = "v1", platform: bool = True) -> Path:
+    """Write a local agent YAML, with platform IDs unless platform is False."""
+    agents_dir = Path.cwd() / "agents"
+    agents_dir.mkdir(parents=True, exist_ok=True)
+    path = agents_dir / f"{agent_id}.yaml"
+    platform_ids = (
+        f"platform_agent_id: platform-{agent_id}\nplatform_env_id: env-{agent_id}\n"
+        if platform
+        else ""
+    )
+    path.write_text(
+        f"id: {agent_id}\nname: {agent_id}\ncategory: chat\ndescription: {description}\n"
+        f"{platform_ids}model:\n  provider: openai\n  name: gpt-4\n  credential_id: cred-1\n"
+    )
+    return path
+
+
+class TestAgentSetAll:
+    """Tests for 'lk agent set --all'."""
+
+    @pytest.fixture(autouse=True)
+    def platform_api(self):
+        """Serve PUTs from a mock transport and record which agents were updated."""
+        self.updated: list[str] = []
+        self.failing: set[str] = set()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            agent_id = request.url.path.rsplit("/", 1)[-1]
+            if agent_id in self.failing:
+                return httpx.Response(500, text="Server Error")
+            self.updated.append(agent_id)
+            return httpx.Response(200, json={})
+
+        def session() -> PlatformSession:
+            return PlatformSession(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+        with (
+            patch("lyzr_kit.commands._auth_helper.validate_auth", return_value=True),
+            patch(
+                "lyzr_kit.commands._auth_helper.load_auth",
+                return_value=AuthConfig(api_key="test-key"),
+            ),
+            patch("lyzr_kit.commands.agent_set.PlatformSession", side_effect=session),
+        ):
+            yield
+
+    def test_only_changed_agents_are_pushed(self):
+        """Unchanged agents should be skipped on later syncs."""
+        for i in range(5):
+            _write_synced_agent(f"bulk-agent-{i}")
+
+        first = runner.invoke(app, ["agent", "set", "--all"])
+        assert first.exit_code == 0, first.output
+        assert len(self.updated) == 5
+
+        self.updated.clear()
+        second = runner.invoke(app, ["agent", "set", "--all"])
+        assert second.exit_code == 0, second.output
+        assert self.updated == []
+        assert "5 unchanged" in second.output
+
+        _write_synced_agent("bulk-agent-3", description="v2")
+        third = runner.invoke(app, ["agent", "set", "--all"])
+        assert third.exit_code == 0, third.output
+        assert self.updated == ["platform-bulk-agent-3"]
+        assert "1 updated, 4 unchanged" in third.output
+
+    def test_local_only_fields_do_not_count_as_changes(self):
+        """Fields not sent to the platform (e.g. serial) should not trigger a push."""
+        path = _write_synced_agent("serial-only-agent")
+        runner.invoke(app, ["agent", "set", "--all"])
+        self.updated.clear()
+
+        path.write_text(path.read_text() + "serial: 42\n")
+        result = runner.invoke(app, ["agent", "set", "--all"])
+
+        assert result.exit_code == 0, result.output
+        assert self.updated == []
+
+    def test_agents_without_platform_ids_are_skipped(self):
+        """Agents never created on the platform should be reported, not pushed."""
+        _write_synced_agent("local-only-agent", platform=False)
+
+        result = runner.invoke(app, ["agent", "set", "--all"])
+
+        assert result.exit_code == 0, result.output
+        assert self.updated == []
+        assert "no platform IDs" in result.output
+
+    def test_failed_agents_are_retried_next_time(self):
+        """A failed push should fail the command and stay pending."""
+        _write_synced_agent("good-agent")
+        _write_synced_agent("flaky-agent")
+        self.failing.add("platform-flaky-agent")
+
+        result = runner.invoke(app, ["agent", "set", "--all"])
+        assert result.exit_code == 1
+        assert "failed" in result.output
+        assert self.updated == ["platform-good-agent"]
+
+        self.failing.clear()
+        self.updated.clear()
+        retry = runner.invoke(app, ["agent", "set", "--all"])
+        assert retry.exit_code == 0, retry.output
+        assert self.updated == ["platform-flaky-agent"]
+
+    def test_single_set_records_hash(self):
+        """'lk agent set <id>' should count as a push for later bulk syncs."""
+        _write_synced_agent("single-set-agent")
+
+        result = runner.invoke(app, ["agent", "set", "single-set-agent"])
+        assert result.exit_code == 0, result.output
+        assert "platform-single-set-agent" in StorageManager().get_pushed_hashes()
+
+        self.updated.clear()
+        bulk = runner.invoke(app, ["agent", "set", "--all"])
+        assert bulk.exit_code == 0, bulk.output
+        assert self.updated == []
+
+    @pytest.mark.parametrize("args", [[], ["some-agent", "--all"]])
+    def test_requires_exactly_one_of_id_or_all(self, args):
+        """set should reject both or neither of an identifier and --all."""
+        result = runner.invoke(app, ["agent", "set", *args])
+        assert result.exit_code == 2
@@ -0,0 +1,73 @@
+"""Regression tests for CLI startup cost (lazy command imports)."""
+
+import subprocess
+import sys
+
+import pytest
+
+# Budget for lyzr_kit's own imports during `lk --help`, in microseconds.
+# Eager command imports (httpx, websockets, prompt_toolkit, Pydantic) cost
+# several times this.
+IMPORT_BUDGET_US = 150_000
+
+# Modules that only online or interactive commands need
+ONLINE_MODULES = {
+    "httpx",
+    "websockets",
+    "prompt_toolkit",
+    "rich.live",
+    "lyzr_kit.utils.platform",
+    "lyzr_kit.commands._websocket",
+    "lyzr_kit.commands._chat",
+}
+
+
+def _import_times(*args: str) -> dict[str, int]:
+    """Run `python -X importtime -m lyzr_kit.main <args>` and parse its report.
+
+    Returns:
+        Map of every imported module -> cumulative import time in us. Nested
+        imports keep their indentation, so top-level modules have none.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "lyzr_kit.main", *args],
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.rstrip()[1:]] = int(cumulative)
+    return times
+
+
+def _loaded_modules(times: dict[str, int]) -> set[str]:
+    return {name.strip() for name in times}
+
+
+class TestCliStartup:
+    """Tests for lazy command registration in lyzr_kit.main."""
+
+    def test_help_stays_under_import_budget(self):
+        """`lk --help` should keep lyzr_kit's own imports under budget."""
+        times = _import_times("--help")
+        assert times, "no -X importtime output"
+
+        own = sum(t for name, t in times.items() if name.startswith("lyzr_kit"))
+        assert own < IMPORT_BUDGET_US, f"lyzr_kit imports took {own}us"
+
+    @pytest.mark.parametrize("args", [["--help"], ["agent", "--help"]])
+    def test_help_loads_no_implementations(self, args):
+        """Help output should not import command implementations or models."""
+        loaded = _loaded_modules(_import_times(*args))
+        assert not loaded & (ONLINE_MODULES | {"pydantic", "lyzr_kit.storage"})
+
+    @pytest.mark.parametrize("args", [["ls"], ["tree"], ["doctor"]])
+    def test_offline_commands_skip_online_modules(self, args):
+        """Offline commands should not load the chat, websocket or platform stacks."""
+        loaded = _loaded_modules(_import_times(*args))
+        assert "lyzr_kit.storage" in loaded
+        assert not loaded & ONLINE_MODULES
@@ -499,6 +499,22 @@ class TestAgentTreeCommand:
         assert result.exit_code == 0
         assert "missing" in result.output.lower()
 
+    def test_tree_reuses_shared_sub_trees_and_marks_cycles(self):
+        """tree should repeat shared sub-agents and mark circular references."""
+        storage = StorageManager()
+        storage.save_agent(create_test_agent("shared-leaf"))
+        storage.save_agent(create_test_agent("branch-one", sub_agents=["shared-leaf"]))
+        storage.save_agent(create_test_agent("branch-two", sub_agents=["shared-leaf", "loop-a"]))
+        storage.save_agent(create_test_agent("loop-a", sub_agents=["loop-b"]))
+        storage.save_agent(create_test_agent("loop-b", sub_agents=["loop-a"]))
+        storage.save_agent(create_test_agent("tree-root", sub_agents=["branch-one", "branch-two"]))
+
+        result = runner.invoke(app, ["agent", "tree", "tree-root"])
+        assert result.exit_code == 0
+        assert result.output.count("shared-leaf") == 2
+        assert result.output.count("loop-a") == 2
+        assert "circular reference" in result.output
+
 
 class TestAgentDoctorCommand:
     """Tests for lk agent doctor command."""
@@ -535,6 +551,56 @@ class TestAgentDoctorCommand:
         assert result.exit_code == 1
         assert "missing" in result.output.lower() or "not found" in result.output.lower()
 
+    def test_doctor_detects_circular_dependencies(self):
+        """doctor should report every agent on a cycle and every agent leading into one."""
+        storage = StorageManager()
+        storage.save_agent(create_test_agent("cycle-a", sub_agents=["cycle-b"]))
+        storage.save_agent(create_test_agent("cycle-b", sub_agents=["cycle-a"]))
+        storage.save_agent(create_test_agent("cycle-parent", sub_agents=["cycle-a"]))
+        storage.save_agent(create_test_agent("cycle-free"))
+
+        from lyzr_kit.commands.agent_doctor import _run_doctor
+
+        report = _run_doctor(StorageManager())
+        messages = {
+            issue.agent_id: issue.message
+            for issue in report.agent_issues
+            if issue.issue_type == "circular_dependency"
+        }
+        cycle_path = "cycle-a → cycle-b → cycle-a"
+        assert messages == {
+            "cycle-a": f"Circular dependency: {cycle_path}",
+            "cycle-b": f"Circular dependency: {cycle_path}",
+            "cycle-parent": f"Sub-agents lead into circular dependency: {cycle_path}",
+        }
+        assert report.healthy_count == 1
+
+        result = runner.invoke(app, ["agent", "doctor"])
+        assert result.exit_code == 1
+
+    def test_doctor_reports_cycle_through_builtin_agent(self, tmp_path: Path):
+        """doctor should report local agents on a cycle that starts at a built-in agent."""
+        builtin = StorageManager(local_path=tmp_path, use_cache=False)
+        builtin.save_agent(create_test_agent("builtin-root", sub_agents=["local-member"]))
+        storage = StorageManager(builtin_path=tmp_path)
+        storage.save_agent(create_test_agent("local-member", sub_agents=["builtin-root"]))
+        storage.save_agent(create_test_agent("local-parent", sub_agents=["local-member"]))
+
+        from lyzr_kit.commands.agent_doctor import _run_doctor
+
+        report = _run_doctor(StorageManager(builtin_path=tmp_path))
+        messages = {
+            issue.agent_id: issue.message
+            for issue in report.agent_issues
+            if issue.issue_type == "circular_dependency"
+        }
+        cycle_path = "builtin-root → local-member → builtin-root"
+        assert messages == {
+            "local-member": f"Circular dependency: {cycle_path}",
+            "local-parent": f"Sub-agents lead into circular dependency: {cycle_path}",
+        }
+        assert report.healthy_count == 0
+
 
 class TestAgentRmTreeFlag:
     """Tests for lk agent rm --tree flag."""
@@ -0,0 +1,104 @@
+"""Unit tests for the sub-agent graph."""
+
+from lyzr_kit.storage.graph import (
+    SubAgentGraph,
+    count_descendants,
+    strongly_connected_components,
+)
+
+
+class TestSubAgentGraph:
+    """Tests for SubAgentGraph."""
+
+    def test_forward_and_reverse_edges(self):
+        """Children and parents should mirror each other."""
+        graph = SubAgentGraph()
+        graph.set_children("a", ["b", "c"])
+        graph.set_children("d", ["c"])
+
+        assert graph.children("a") == ["b", "c"]
+        assert graph.parents("c") == ["a", "d"]
+        assert graph.parents("b") == ["a"]
+        assert graph.parents("a") == []
+        assert "a" in graph
+        assert "b" not in graph
+
+    def test_set_children_replaces_edges(self):
+        """Re-setting a node should drop its old reverse edges."""
+        graph = SubAgentGraph()
+        graph.set_children("a", ["b"])
+        graph.set_children("a", ["c"])
+
+        assert graph.children("a") == ["c"]
+        assert graph.parents("b") == []
+        assert graph.parents("c") == ["a"]
+
+    def test_remove(self):
+        """Removing a node should drop its edges but keep references to it."""
+        graph = SubAgentGraph()
+        graph.set_children("a", ["b"])
+        graph.set_children("b", ["c"])
+        graph.remove("b")
+        graph.remove("missing")
+
+        assert "b" not in graph
+        assert graph.children("b") == []
+        assert graph.parents("c") == []
+        assert graph.parents("b") == ["a"]
+
+    def test_returns_copies(self):
+        """Callers should not be able to mutate the graph through results."""
+        children = ["b"]
+        graph = SubAgentGraph()
+        graph.set_children("a", children)
+        children.append("c")
+        graph.children("a").append("d")
+
+        assert graph.children("a") == ["b"]
+
+
+class TestStronglyConnectedComponents:
+    """Tests for strongly_connected_components."""
+
+    def test_reverse_topological_order(self):
+        """Components should come after the components they point to."""
+        adjacency = {"a": ["b"], "b": ["c", "d"], "c": ["b"], "d": []}
+        components = strongly_connected_components(adjacency)
+
+        assert components == [["d"], ["b", "c"], ["a"]]
+
+    def test_deep_chain(self):
+        """Long chains should not hit the recursion limit."""
+        adjacency = {f"n{i}": [f"n{i + 1}"] for i in range(5000)}
+        adjacency["n5000"] = []
+
+        assert len(strongly_connected_components(adjacency)) == 5001
+
+
+class TestCountDescendants:
+    """Tests for count_descendants."""
+
+    def test_shared_subtrees_counted_once(self):
+        """A diamond should count the shared leaf once."""
+        counts = count_descendants({"a": ["b", "c"], "b": ["d"], "c": ["d"], "d": []})
+        assert counts == {"a": 3, "b": 1, "c": 1, "d": 0}
+
+    def test_cycles(self):
+        """Agents in a cycle should count each other but not themselves."""
+        counts = count_descendants({"a": ["b"], "b": ["a", "c"], "c": [], "s": ["s"]})
+        assert counts == {"a": 2, "b": 2, "c": 0, "s": 0}
+
+    def test_unknown_references_are_leaves(self):
+        """IDs that aren't keys should be counted once but not expanded."""
+        counts = count_descendants({"a": ["missing", "b"], "b": ["missing"]})
+        assert counts == {"a": 2, "b": 1}
+
+    def test_wide_shared_subtree(self):
+        """Many parents of one large subtree should each see its full size."""
+        adjacency = {f"leaf{i}": [] for i in range(500)}
+        adjacency["hub"] = [f"leaf{i}" for i in range(500)]
+        adjacency.update({f"parent{i}": ["hub"] for i in range(500)})
+
+        counts = count_descendants(adjacency)
+        assert counts["hub"] == 500
+        assert all(counts[f"parent{i}"] == 501 for i in range(500))
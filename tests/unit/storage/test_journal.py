@@ -0,0 +1,48 @@
+"""Unit tests for the clone journal."""
+
+from pathlib import Path
+
+from lyzr_kit.storage import CloneJournal, JournalEntry
+
+
+def _entry(source_id: str) -> JournalEntry:
+    """Build a journal entry for a built-in agent ID."""
+    return JournalEntry(
+        source_id=source_id,
+        target_id=f"copy-of-{source_id}",
+        agent_id=f"platform-{source_id}",
+        env_id="env",
+        endpoint="https://api.example.com/chat/",
+    )
+
+
+class TestCloneJournal:
+    """Tests for CloneJournal."""
+
+    def test_records_round_trip(self, tmp_path: Path):
+        """Recorded entries should load back keyed by source ID."""
+        journal = CloneJournal.for_plan(tmp_path, "plan")
+        assert not journal.exists()
+
+        journal.record(_entry("a"))
+        journal.record(_entry("b"))
+
+        assert journal.path == tmp_path / ".lk" / "journal" / "plan.jsonl"
+        assert CloneJournal(journal.path).load() == {"a": _entry("a"), "b": _entry("b")}
+
+    def test_torn_line_is_skipped(self, tmp_path: Path):
+        """A line cut short by a crash should not hide later records."""
+        journal = CloneJournal(tmp_path / "plan.jsonl")
+        journal.record(_entry("a"))
+        with journal.path.open("a") as f:
+            f.write('{"source_id": "b", "tar')
+
+        journal.record(_entry("c"))
+
+        assert set(journal.load()) == {"a", "c"}
+
+    def test_missing_journal_is_empty(self, tmp_path: Path):
+        """A journal that was never written should load empty and remove cleanly."""
+        journal = CloneJournal(tmp_path / "plan.jsonl")
+        assert journal.load() == {}
+        journal.remove()
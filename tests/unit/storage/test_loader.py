@@ -0,0 +1,140 @@
+"""Unit tests for the parallel agent loader."""
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from lyzr_kit.storage.loader import (
+    LOAD_WORKERS_ENV,
+    MAX_AUTO_WORKERS,
+    PARALLEL_THRESHOLD,
+    get_load_workers,
+    load_agent_files,
+)
+from lyzr_kit.storage.manager import StorageManager
+
+
+def _write_agents(agents_dir: Path, count: int) -> list[Path]:
+    """Write count agent files (every fifth one invalid) and return their paths."""
+    agents_dir.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for i in range(count):
+        path = agents_dir / f"agent-{i:03d}.yaml"
+        if i % 5 == 4:
+            path.write_text("id: broken\n")
+        else:
+            path.write_text(
+                f"id: agent-{i:03d}\nname: Agent {i}\ncategory: chat\nserial: {count - i}\n"
+                "model:\n  provider: openai\n  name: gpt-4\n  credential_id: cred-1\n"
+            )
+        paths.append(path)
+    return paths
+
+
+class TestGetLoadWorkers:
+    """Tests for get_load_workers."""
+
+    def test_small_batches_load_serially(self, monkeypatch):
+        """Batches below the threshold should use a single worker."""
+        monkeypatch.delenv(LOAD_WORKERS_ENV, raising=False)
+        assert get_load_workers(PARALLEL_THRESHOLD - 1) == 1
+
+    def test_large_batches_use_one_worker_per_cpu(self, monkeypatch):
+        """Large batches should be sized automatically from the CPU count."""
+        monkeypatch.delenv(LOAD_WORKERS_ENV, raising=False)
+        monkeypatch.setattr("lyzr_kit.storage.loader.os.cpu_count", lambda: 4)
+        assert get_load_workers(PARALLEL_THRESHOLD) == 4
+
+    def test_auto_workers_are_capped(self, monkeypatch):
+        """Automatic sizing should not exceed MAX_AUTO_WORKERS."""
+        monkeypatch.setenv(LOAD_WORKERS_ENV, "auto")
+        monkeypatch.setattr("lyzr_kit.storage.loader.os.cpu_count", lambda: 64)
+        assert get_load_workers(10_000) == MAX_AUTO_WORKERS
+
+    def test_env_override(self, monkeypatch):
+        """LK_LOAD_WORKERS should win over the automatic choice."""
+        monkeypatch.setenv(LOAD_WORKERS_ENV, "3")
+        assert get_load_workers(50) == 3
+
+    def test_env_override_is_capped_by_file_count(self, monkeypatch):
+        """There should never be more workers than files."""
+        monkeypatch.setenv(LOAD_WORKERS_ENV, "8")
+        assert get_load_workers(2) == 2
+
+    @pytest.mark.parametrize("value", ["1", "0", "-2"])
+    def test_env_override_of_one_or_less_is_serial(self, monkeypatch, value):
+        """LK_LOAD_WORKERS=1 (or less) should load serially even for large batches."""
+        monkeypatch.setenv(LOAD_WORKERS_ENV, value)
+        assert get_load_workers(10_000) == 1
+
+    def test_invalid_env_override_is_ignored(self, monkeypatch):
+        """Non-integer overrides should fall back to the automatic choice."""
+        monkeypatch.setenv(LOAD_WORKERS_ENV, "many")
+        assert get_load_workers(5) == 1
+
+
+class TestLoadAgentFiles:
+    """Tests for load_agent_files."""
+
+    @pytest.mark.parametrize("executor", [ThreadPoolExecutor, ProcessPoolExecutor])
+    def test_parallel_matches_serial(self, executor):
+        """Parallel loading should return the same results in the same order."""
+        paths = _write_agents(Path.cwd() / "agents", 25)
+
+        serial = load_agent_files(paths, workers=1)
+        parallel = load_agent_files(paths, workers=3, create_executor=executor)
+
+        assert [(a, i is not None) for a, i in parallel] == [(a, i is not None) for a, i in serial]
+        assert [a.id for a, _ in parallel if a] == [a.id for a, _ in serial if a]
+        assert sum(1 for a, _ in parallel if a is None) == 5
+
+    def test_falls_back_to_serial_when_pool_fails(self):
+        """An unavailable pool should not prevent loading."""
+        paths = _write_agents(Path.cwd() / "agents", 3)
+
+        def broken_executor(workers: int) -> ThreadPoolExecutor:
+            raise OSError("no pools here")
+
+        results = load_agent_files(paths, workers=2, create_executor=broken_executor)
+        assert [a.id for a, _ in results if a] == ["agent-000", "agent-001", "agent-002"]
+
+    def test_undecodable_file_is_reported(self):
+        """A file that can't be decoded should come back with an issue, not be dropped."""
+        paths = _write_agents(Path.cwd() / "agents", 1)
+        paths[0].write_bytes(b"id: \xff\xfe\n")
+
+        [(agent, issue)] = load_agent_files(paths, workers=1)
+
+        assert agent is None
+        assert issue is not None
+        assert issue.issue_type == "invalid_yaml"
+        assert "Cannot read agent-000.yaml" in issue.message
+
+
+class TestStorageManagerParallelLoad:
+    """Tests for StorageManager with parallel loading enabled."""
+
+    def test_list_agents_is_deterministic(self, monkeypatch):
+        """list_agents output should not depend on the worker count."""
+        _write_agents(Path.cwd() / "agents", 25)
+
+        monkeypatch.setenv(LOAD_WORKERS_ENV, "1")
+        serial = StorageManager(use_cache=False).list_agents("local")
+        monkeypatch.setenv(LOAD_WORKERS_ENV, "4")
+        parallel = StorageManager(use_cache=False).list_agents("local")
+
+        assert [a.id for a, _ in parallel] == [a.id for a, _ in serial]
+        assert len(parallel) == 20
+        # Sorted by serial, which runs opposite to filename order
+        assert parallel[0][0].id == "agent-023"
+
+    def test_undecodable_file_is_listed_as_issue(self):
+        """Broken files should show up in the issue list alongside valid agents."""
+        paths = _write_agents(Path.cwd() / "agents", 2)
+        paths[1].write_bytes(b"\xff\xfe")
+
+        storage = StorageManager(use_cache=False)
+
+        assert [a.id for a, _ in storage.list_agents("local")] == ["agent-000"]
+        assert [issue.path for issue in storage.list_local_issues()] == [paths[1]]
@@ -3,6 +3,7 @@
 from pathlib import Path
 
 from lyzr_kit.schemas.agent import Agent
+from lyzr_kit.storage.loader import load_agent_files
 from lyzr_kit.storage.manager import StorageManager
 
 
@@ -352,3 +353,316 @@ class TestBuiltinAgentsWithSubAgents:
         project_manager = storage.get_agent("project-manager")
         assert project_manager is not None
         assert len(project_manager.sub_agents) == 3
+
+
+class TestStorageManagerIndex:
+    """Tests for the in-memory agent index used by StorageManager lookups."""
+
+    def test_lookups_parse_each_file_once(self, make_agent):
+        """Repeated lookups should be served from the index after the first scan."""
+        from unittest.mock import patch
+
+        storage = StorageManager()
+        for i in range(3):
+            storage.save_agent(make_agent(f"index-agent-{i}"))
+
+        with patch(
+            "lyzr_kit.storage.manager.load_agent_files", wraps=load_agent_files
+        ) as mock_load:
+            assert storage.list_agents()
+            for _ in range(5):
+                assert storage.get_agent("index-agent-1") is not None
+                assert storage.agent_exists_local("index-agent-2") is True
+                assert storage.agent_exists("chat-agent") is True
+
+        # One scan of the local directory (built-ins may come from the snapshot)
+        local_scans = [c for c in mock_load.call_args_list if len(c.args[0]) == 3]
+        assert len(local_scans) == 1
+        assert mock_load.call_count <= 2
+
+    def test_save_agent_updates_index(self, make_agent):
+        """save_agent should make new and changed agents visible immediately."""
+        storage = StorageManager()
+        assert storage.get_agent("index-saved") is None
+
+        storage.save_agent(make_agent("index-saved"))
+        assert storage.agent_exists_local("index-saved") is True
+
+        storage.save_agent(make_agent("index-saved", sub_agents=["chat-agent"]))
+        reloaded = storage.get_agent("index-saved")
+        assert reloaded is not None
+        assert reloaded.sub_agents == ["chat-agent"]
+
+    def test_delete_agent_updates_index(self, make_agent):
+        """delete_agent should remove the agent from the index."""
+        storage = StorageManager()
+        storage.save_agent(make_agent("index-deleted"))
+        assert storage.agent_exists_local("index-deleted") is True
+
+        assert storage.delete_agent("index-deleted") is True
+        assert storage.agent_exists_local("index-deleted") is False
+        assert storage.get_agent("index-deleted") is None
+
+    def test_subagent_graph_tracks_saves_and_deletes(self, make_agent):
+        """Parent lookups should reflect saves and deletes without rescanning."""
+        from unittest.mock import patch
+
+        storage = StorageManager()
+        storage.save_agent(make_agent("graph-child"))
+        storage.save_agent(make_agent("graph-parent-1", sub_agents=["graph-child"]))
+        storage.save_agent(make_agent("graph-parent-2", sub_agents=["graph-child"]))
+        assert storage.get_local_sub_agents("graph-parent-1") == ["graph-child"]
+
+        with patch.object(storage, "_scan_agents", wraps=storage._scan_agents) as mock_scan:
+            parents = storage.find_agents_using_subagent("graph-child")
+            assert sorted(a.id for a in parents) == ["graph-parent-1", "graph-parent-2"]
+
+            storage.save_agent(make_agent("graph-parent-1"))
+            assert [a.id for a in storage.find_agents_using_subagent("graph-child")] == [
+                "graph-parent-2"
+            ]
+            assert storage.get_local_sub_agents("graph-parent-1") == []
+
+            storage.delete_agent("graph-parent-2")
+            assert storage.find_agents_using_subagent("graph-child") == []
+
+            assert storage.update_subagent_references("graph-child", "graph-renamed") == []
+
+        assert mock_scan.call_count == 0
+
+    def test_get_local_sub_agents_skips_missing(self, make_agent):
+        """Only sub-agents that exist locally should be returned."""
+        storage = StorageManager()
+        storage.save_agent(make_agent("graph-local"))
+        storage.save_agent(
+            make_agent("graph-root", sub_agents=["chat-agent", "graph-local", "gone"])
+        )
+
+        assert storage.get_local_sub_agents("graph-root") == ["graph-local"]
+        assert storage.get_local_sub_agents("not-local") == []
+
+    def test_returned_agents_are_copies(self):
+        """Reassigning fields on a returned agent should not change the index."""
+        storage = StorageManager()
+        agent = storage.get_agent("chat-agent")
+        assert agent is not None
+
+        agent.id = "mutated-id"
+        agent.serial = 999
+
+        original = storage.get_agent("chat-agent")
+        assert original is not None
+        assert original.id == "chat-agent"
+        assert original.serial != 999
+
+    def test_duplicate_ids_fall_back_to_remaining_file(self, make_agent):
+        """When two files share an ID, deleting one should expose the other."""
+        storage = StorageManager()
+        storage.save_agent(make_agent("index-dup"))
+
+        agents_dir = Path.cwd() / "agents"
+        content = (agents_dir / "index-dup.yaml").read_text()
+        (agents_dir / "index-dup-copy.yaml").write_text(content)
+
+        assert storage.agent_exists_local("index-dup") is True
+        storage.delete_agent("index-dup")
+        assert storage.agent_exists_local("index-dup") is True
+
+    def test_duplicates_are_promoted_in_scan_order(self, make_agent):
+        """Each delete should hand the ID and serial to the next file scanned."""
+        agents_dir = Path.cwd() / "agents"
+        agents_dir.mkdir()
+        for suffix in "abc":
+            agent = make_agent("index-multi")
+            agent.serial = 7
+            StorageManager(use_cache=False).save_agent(agent)
+            (agents_dir / "index-multi.yaml").rename(agents_dir / f"{suffix}.yaml")
+
+        index = StorageManager()._get_index("local")
+        first, second, third = index.file_keys()
+        assert index.file_of("index-multi") == first
+        index.discard(first)
+        assert index.file_of("index-multi") == second
+        assert index.file_of_serial(7) == second
+        index.discard(second)
+        assert index.get("index-multi") is index.agent_in(third)
+        assert index.get_by_serial(7) is index.agent_in(third)
+        assert index.max_serial() == 7
+        index.discard(third)
+        assert "index-multi" not in index
+        assert index.get_by_serial(7) is None
+        assert index.max_serial() == 0
+
+    def test_in_place_edit_is_picked_up(self, make_agent):
+        """Editing a file without adding or removing any should not serve stale data."""
+        storage = StorageManager()
+        storage.save_agent(make_agent("index-edited"))
+        assert storage.get_agent("index-edited").name == "Agent index-edited"
+
+        path = Path.cwd() / "agents" / "index-edited.yaml"
+        path.write_text(path.read_text().replace("Agent index-edited", "Edited elsewhere"))
+
+        assert storage.get_agent("index-edited").name == "Edited elsewhere"
+        assert [a.name for a in storage.list_local_agents()] == ["Edited elsewhere"]
+
+    def test_in_place_breakage_is_reported(self, make_agent):
+        """A file broken in place should move from the agents to the issues."""
+        storage = StorageManager()
+        storage.save_agent(make_agent("index-broken"))
+        assert storage.list_local_issues() == []
+
+        (Path.cwd() / "agents" / "index-broken.yaml").write_text("id: index-broken\n")
+
+        assert storage.get_agent("index-broken") is None
+        assert storage.list_local_agents() == []
+        assert [issue.issue_type for issue in storage.list_local_issues()] == ["invalid_schema"]
+
+
+class TestStorageManagerCache:
+    """Tests for the persistent agent parse cache in .lk/cache/."""
+
+    def test_second_run_skips_yaml_parsing(self, make_agent):
+        """A fresh StorageManager should load unchanged agents from the cache."""
+        from unittest.mock import patch
+
+        StorageManager().save_agent(make_agent("cached-agent"))
+        assert len(StorageManager().list_agents()) > 1
+        assert (Path.cwd() / ".lk" / "cache" / "agents.sqlite").exists()
+
+        with patch("lyzr_kit.storage.manager.load_yaml") as mock_load:
+            agent = StorageManager().get_agent("cached-agent")
+            assert agent is not None
+            assert agent.name == "Agent cached-agent"
+            assert StorageManager().agent_exists("chat-agent") is True
+            mock_load.assert_not_called()
+
+    def test_changed_file_is_reparsed(self, make_agent):
+        """Editing a YAML file should invalidate its cache entry."""
+        storage = StorageManager()
+        storage.save_agent(make_agent("cached-edit"))
+        assert StorageManager().get_agent("cached-edit") is not None
+
+        storage.save_agent(make_agent("cached-edit", name="Renamed Agent Name"))
+
+        agent = StorageManager().get_agent("cached-edit")
+        assert agent is not None
+        assert agent.name == "Renamed Agent Name"
+
+    def test_corrupt_cache_falls_back_to_yaml(self, make_agent):
+        """An unreadable cache file should be ignored."""
+        StorageManager().save_agent(make_agent("cached-corrupt"))
+        cache_file = Path.cwd() / ".lk" / "cache" / "agents.sqlite"
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text("not a database")
+
+        assert StorageManager().get_agent("cached-corrupt") is not None
+
+    def test_rescan_prunes_deleted_files(self, make_agent):
+        """Cache rows for YAML files that were removed should be deleted on rescan."""
+        import sqlite3
+
+        StorageManager().save_agent(make_agent("cached-keep"))
+        StorageManager().save_agent(make_agent("cached-gone"))
+        assert StorageManager().get_agent("cached-gone") is not None
+        gone = next((Path.cwd() / "agents").glob("*cached-gone*.yaml"))
+        gone.unlink()
+
+        assert StorageManager().get_agent("cached-keep") is not None
+
+        cache_file = Path.cwd() / ".lk" / "cache" / "agents.sqlite"
+        with sqlite3.connect(cache_file) as conn:
+            paths = [row[0] for row in conn.execute("SELECT path FROM agents")]
+        assert any("cached-keep" in path for path in paths)
+        assert not any("cached-gone" in path for path in paths)
+
+    def test_rescan_prunes_pushed_hashes_of_removed_agents(self, make_agent):
+        """Pushed hashes should only be kept for platform agents still held locally."""
+        kept = make_agent("pushed-keep")
+        kept.platform_agent_id = "platform-keep"
+        StorageManager().save_agent(kept)
+        StorageManager().record_pushed_hashes(
+            {"platform-keep": "hash-1", "platform-gone": "hash-2"}
+        )
+
+        assert StorageManager().get_agent("pushed-keep") is not None
+
+        assert StorageManager().get_pushed_hashes() == {"platform-keep": "hash-1"}
+
+    def test_cache_disabled(self, make_agent):
+        """use_cache=False should not create a cache file."""
+        StorageManager().save_agent(make_agent("uncached-agent"))
+        storage = StorageManager(use_cache=False)
+        assert storage.get_agent("uncached-agent") is not None
+        assert not (Path.cwd() / ".lk").exists()
+
+
+class TestStorageManagerSerials:
+    """Tests for serial number lookups and allocation."""
+
+    def test_lookup_by_serial(self, make_agent):
+        """Serial lookups should be served per source from the index."""
+        storage = StorageManager()
+        storage.save_agent(make_agent("serial-one", serial=1))
+
+        local = storage.get_agent_by_serial(1, "local")
+        assert local is not None
+        assert local.id == "serial-one"
+        builtin = storage.get_agent_by_serial(1, "built-in")
+        assert builtin is not None
+        assert builtin.id == "chat-agent"
+        assert storage.get_agent_by_serial(99, "local") is None
+
+    def test_save_and_delete_update_serial_index(self, make_agent):
+        """Changing or deleting an agent should update its serial entry."""
+        storage = StorageManager()
+        storage.save_agent(make_agent("serial-moved", serial=3))
+        storage.save_agent(make_agent("serial-moved", serial=4))
+        assert storage.get_agent_by_serial(3, "local") is None
+        assert storage.get_agent_by_serial(4, "local") is not None
+
+        storage.delete_agent("serial-moved")
+        assert storage.get_agent_by_serial(4, "local") is None
+
+    def test_allocation_starts_above_existing_serials(self, make_agent):
+        """Allocated serials should be past every serial in agents/."""
+        storage = StorageManager()
+        storage.save_agent(make_agent("serial-high", serial=7))
+
+        assert storage.next_local_serial() == 8
+        assert storage.allocate_local_serial() == 8
+        assert storage.allocate_local_serial() == 9
+
+    def test_allocation_is_shared_across_instances(self, make_agent):
+        """The counter in the cache should be shared by every StorageManager."""
+        StorageManager().save_agent(make_agent("serial-base", serial=1))
+
+        assert StorageManager().allocate_local_serial() == 2
+        assert StorageManager().allocate_local_serial() == 3
+        assert StorageManager().next_local_serial() == 4
+        assert (Path.cwd() / ".lk" / "cache" / "agents.sqlite").exists()
+
+    def test_allocation_without_cache(self, make_agent):
+        """Without a cache the counter should still be monotonic in-process."""
+        StorageManager().save_agent(make_agent("serial-nocache", serial=2))
+        storage = StorageManager(use_cache=False)
+
+        assert storage.allocate_local_serial() == 3
+        assert storage.allocate_local_serial() == 4
+        assert not (Path.cwd() / ".lk").exists()
+
+    def test_serial_helpers_reuse_storage(self, make_agent):
+        """The serialization helpers should use a given StorageManager's index."""
+        from unittest.mock import patch
+
+        from lyzr_kit.storage import get_local_agent_by_serial, get_next_local_serial
+
+        storage = StorageManager()
+        storage.save_agent(make_agent("serial-helper", serial=5))
+        assert storage.list_agents("local")
+
+        with patch.object(storage, "_scan_agents", wraps=storage._scan_agents) as mock_scan:
+            agent = get_local_agent_by_serial(5, storage)
+            assert agent is not None
+            assert agent.id == "serial-helper"
+            assert get_next_local_serial(storage) == 6
+        mock_scan.assert_not_called()
@@ -0,0 +1,96 @@
+"""Unit tests for the built-in collection snapshot."""
+
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from lyzr_kit.storage.manager import COLLECTION_DIR, StorageManager
+from lyzr_kit.storage.snapshot import SNAPSHOT_FILE, load_snapshot, write_snapshot
+
+
+@pytest.fixture
+def collection(tmp_path: Path) -> Path:
+    """Copy of the built-in collection with a freshly written snapshot."""
+    shutil.copytree(COLLECTION_DIR / "agents", tmp_path / "agents")
+    write_snapshot(tmp_path / "agents", tmp_path / SNAPSHOT_FILE)
+    return tmp_path
+
+
+class TestLoadSnapshot:
+    """Tests for load_snapshot function."""
+
+    def test_matches_yaml_files(self, collection: Path):
+        """Snapshot agents should equal the agents parsed from YAML."""
+        entries = load_snapshot(collection / "agents", collection / SNAPSHOT_FILE)
+        assert entries is not None
+
+        from_yaml = StorageManager(builtin_path=COLLECTION_DIR, use_cache=False)
+        assert len(entries) == len(list((collection / "agents").glob("*.yaml")))
+        for _, agent in entries:
+            assert agent == from_yaml.get_agent(agent.id)
+
+    def test_missing_snapshot_returns_none(self, collection: Path):
+        """load_snapshot should return None when the file does not exist."""
+        (collection / SNAPSHOT_FILE).unlink()
+        assert load_snapshot(collection / "agents", collection / SNAPSHOT_FILE) is None
+
+    def test_stale_snapshot_returns_none(self, collection: Path):
+        """load_snapshot should return None when a YAML file changed size."""
+        yaml_file = collection / "agents" / "chat-agent.yaml"
+        yaml_file.write_text(yaml_file.read_text() + "\n# edited\n")
+        assert load_snapshot(collection / "agents", collection / SNAPSHOT_FILE) is None
+
+    def test_same_size_edit_makes_snapshot_stale(self, collection: Path):
+        """load_snapshot should return None when a YAML file changed but kept its size."""
+        yaml_file = collection / "agents" / "chat-agent.yaml"
+        content = yaml_file.read_text()
+        edited = content.replace('name: "Chat Assistant"', 'name: "Chat Assistanx"')
+        assert edited != content and len(edited) == len(content)
+        yaml_file.write_text(edited)
+        assert load_snapshot(collection / "agents", collection / SNAPSHOT_FILE) is None
+
+    def test_validated_agents_are_reused(self, collection: Path):
+        """Loading the same snapshot again should not read or validate it again."""
+        first = load_snapshot(collection / "agents", collection / SNAPSHOT_FILE)
+        with (
+            patch("lyzr_kit.storage.snapshot.json.loads") as mock_loads,
+            patch("lyzr_kit.schemas.agent.Agent.model_validate") as mock_validate,
+        ):
+            second = load_snapshot(collection / "agents", collection / SNAPSHOT_FILE)
+            mock_loads.assert_not_called()
+            mock_validate.assert_not_called()
+
+        assert second == first
+
+    def test_corrupt_snapshot_returns_none(self, collection: Path):
+        """load_snapshot should return None for unreadable snapshot data."""
+        (collection / SNAPSHOT_FILE).write_text("{not json")
+        assert load_snapshot(collection / "agents", collection / SNAPSHOT_FILE) is None
+
+
+class TestStorageManagerSnapshot:
+    """Tests for StorageManager using the built-in snapshot."""
+
+    def test_builtin_agents_load_without_yaml_parsing(self, collection: Path):
+        """Built-in agents should come from the snapshot when it is fresh."""
+        storage = StorageManager(builtin_path=collection, use_cache=False)
+        with patch("lyzr_kit.storage.manager.load_yaml") as mock_load:
+            agents = storage.list_agents(source="built-in")
+            mock_load.assert_not_called()
+
+        assert len(agents) == len(list((collection / "agents").glob("*.yaml")))
+
+    def test_falls_back_to_yaml_when_stale(self, collection: Path):
+        """Edited built-in YAML files should be read instead of the snapshot."""
+        yaml_file = collection / "agents" / "chat-agent.yaml"
+        content = yaml_file.read_text().replace(
+            'name: "Chat Assistant"', 'name: "Edited Assistant"'
+        )
+        yaml_file.write_text(content)
+
+        storage = StorageManager(builtin_path=collection, use_cache=False)
+        agent = storage.get_agent("chat-agent")
+        assert agent is not None
+        assert agent.name == "Edited Assistant"
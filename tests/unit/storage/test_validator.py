@@ -6,6 +6,7 @@ from pydantic import ValidationError
 
 from lyzr_kit.schemas.agent import Agent
 from lyzr_kit.storage.validator import (
+    CycleAnalyzer,
     ValidationResult,
     detect_cycle,
     format_cycle_error,
@@ -116,6 +117,17 @@ model:
         assert result.is_valid is False
         assert len(result.invalid_yaml_files) == 1
 
+    def test_detects_undecodable_yaml_file(self):
+        """Should report files that aren't valid UTF-8 instead of skipping them."""
+        agents_dir = Path.cwd() / ".local-kit" / "agents"
+        agents_dir.mkdir(parents=True, exist_ok=True)
+
+        (agents_dir / "binary.yaml").write_bytes(b"\xff\xfe\x00")
+
+        result = validate_agents_folder(Path.cwd() / ".local-kit")
+        assert result.is_valid is False
+        assert [p.name for p in result.invalid_yaml_files] == ["binary.yaml"]
+
     def test_detects_invalid_schema(self):
         """Should detect YAML files that don't match Agent schema."""
         agents_dir = Path.cwd() / ".local-kit" / "agents"
@@ -157,6 +169,40 @@ other_field: 123
         assert len(result.invalid_yaml_files) == 1
         assert len(result.invalid_schema_files) == 1
 
+    def test_shares_load_pass_with_storage(self):
+        """With a StorageManager, validation and listing should parse each file once."""
+        from unittest.mock import patch
+
+        from lyzr_kit.storage.manager import StorageManager
+        from lyzr_kit.storage.yaml_codec import load_yaml
+
+        agents_dir = Path.cwd() / "agents"
+        agents_dir.mkdir(parents=True, exist_ok=True)
+        (agents_dir / "broken.yaml").write_text("invalid: yaml: [")
+        (agents_dir / "bad-schema.yaml").write_text("field: value")
+        (agents_dir / "good-agent.yaml").write_text("""
+id: good-agent
+name: Good Agent
+category: chat
+model:
+  provider: openai
+  name: gpt-4
+  credential_id: cred-1
+""")
+
+        storage = StorageManager()
+        with patch(
+            "lyzr_kit.storage._validation.yaml_validator.load_yaml", wraps=load_yaml
+        ) as mock_load:
+            result = validate_agents_folder(Path.cwd(), storage)
+            local_agents = storage.list_local_agents()
+
+        assert mock_load.call_count == 3
+        assert [a.id for a in local_agents] == ["good-agent"]
+        assert result.is_valid is False
+        assert [p.name for p in result.invalid_yaml_files] == ["broken.yaml"]
+        assert [p.name for p in result.invalid_schema_files] == ["bad-schema.yaml"]
+
 
 class TestFormatValidationErrors:
     """Tests for format_validation_errors function."""
@@ -566,6 +612,108 @@ class TestDetectCycle:
         assert cycle is None  # No cycle if agent doesn't exist
 
 
+class TestCycleAnalyzer:
+    """Tests for CycleAnalyzer."""
+
+    def test_acyclic_graph(self):
+        """An acyclic graph should have no cycles."""
+        analyzer = CycleAnalyzer({"a": ["b", "c"], "b": ["c"], "c": []})
+        assert analyzer.cyclic_components() == []
+        assert analyzer.find_cycle("a") is None
+        assert analyzer.find_cycle("unknown") is None
+
+    def test_paths_match_detect_cycle_shape(self):
+        """Cycle paths should start at the agent and end at the repeated agent."""
+        analyzer = CycleAnalyzer({"a": ["b"], "b": ["c"], "c": ["a"]})
+        assert analyzer.find_cycle("a") == ["a", "b", "c", "a"]
+        assert analyzer.find_cycle("b") == ["b", "c", "a", "b"]
+
+    def test_self_reference(self):
+        """An agent referencing itself is a cycle of one."""
+        analyzer = CycleAnalyzer({"a": ["a"], "b": []})
+        assert analyzer.cyclic_components() == [["a"]]
+        assert analyzer.find_cycle("a") == ["a", "a"]
+        assert analyzer.find_cycle("b") is None
+
+    def test_cycle_by_agent_covers_members_and_upstream_agents(self):
+        """Every member of a cycle and every agent leading into it should map to the cycle."""
+        analyzer = CycleAnalyzer(
+            {"up": ["mid"], "mid": ["a"], "a": ["b"], "b": ["c"], "c": ["a"], "free": ["up2"]}
+        )
+        cycle = ["a", "b", "c", "a"]
+        assert analyzer.cycle_by_agent() == {
+            "up": cycle,
+            "mid": cycle,
+            "a": cycle,
+            "b": cycle,
+            "c": cycle,
+        }
+
+    def test_reports_every_cycle(self):
+        """Disjoint cycles should all be found in one pass."""
+        analyzer = CycleAnalyzer(
+            {"a": ["b"], "b": ["a"], "c": ["d"], "d": ["e"], "e": ["c"], "f": ["a"]}
+        )
+        components = sorted(sorted(c) for c in analyzer.cyclic_components())
+        assert components == [["a", "b"], ["c", "d", "e"]]
+        assert sorted(analyzer.cycles()) == [["a", "b", "a"], ["c", "d", "e", "c"]]
+
+    def test_agent_reaching_a_cycle(self):
+        """Agents that only lead into a cycle should get the path into it."""
+        analyzer = CycleAnalyzer({"root": ["safe", "a"], "safe": [], "a": ["b"], "b": ["a"]})
+        assert analyzer.find_cycle("root") == ["root", "a", "b", "a"]
+        assert analyzer.find_cycle("safe") is None
+
+    def test_members_off_the_chosen_cycle(self):
+        """Every member of a component should get a valid cycle path."""
+        graph = {"a": ["b"], "b": ["a", "c"], "c": ["b"]}
+        analyzer = CycleAnalyzer(graph)
+        for agent_id in graph:
+            cycle = analyzer.find_cycle(agent_id)
+            assert cycle is not None
+            assert cycle[0] == agent_id
+            assert cycle[-1] in cycle[:-1]
+            for src, dst in zip(cycle, cycle[1:], strict=False):
+                assert dst in graph[src]
+
+    def test_ignores_missing_sub_agents(self):
+        """References to unknown agents should be ignored."""
+        analyzer = CycleAnalyzer({"a": ["missing"]})
+        assert analyzer.find_cycle("a") is None
+
+    def test_handles_deep_graphs(self):
+        """Long chains should not hit the recursion limit."""
+        count = 5000
+        graph = {f"agent-{i}": [f"agent-{i + 1}"] for i in range(count)}
+        graph[f"agent-{count}"] = ["agent-4000"]
+        analyzer = CycleAnalyzer(graph)
+
+        cycle = analyzer.find_cycle("agent-0")
+        assert cycle is not None
+        assert len(cycle) == count + 2
+        assert cycle[-1] == "agent-4000"
+
+    def test_from_storage_applies_overrides(self):
+        """Overrides should replace stored sub-agents."""
+        from lyzr_kit.schemas.agent import ModelConfig
+        from lyzr_kit.storage.manager import StorageManager
+
+        storage = StorageManager()
+        storage.save_agent(
+            Agent(
+                id="agent-b",
+                name="Agent B",
+                category="chat",
+                model=ModelConfig(provider="openai", name="gpt-4", credential_id="cred-1"),
+                sub_agents=["agent-a"],
+            )
+        )
+
+        assert CycleAnalyzer.from_storage(storage).find_cycle("agent-b") is None
+        analyzer = CycleAnalyzer.from_storage(storage, overrides={"agent-a": ["agent-b"]})
+        assert analyzer.find_cycle("agent-a") == ["agent-a", "agent-b", "agent-a"]
+
+
 class TestFormatCycleError:
     """Tests for format_cycle_error function."""
 
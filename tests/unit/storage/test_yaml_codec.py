@@ -0,0 +1,41 @@
+"""Unit tests for the shared YAML codec."""
+
+import io
+
+import pytest
+import yaml
+
+from lyzr_kit.storage.yaml_codec import dump_yaml, load_yaml
+
+
+class TestYamlCodec:
+    """Tests for load_yaml and dump_yaml."""
+
+    def test_round_trip_preserves_data_and_order(self):
+        """dump_yaml output should load back to the same data in the same order."""
+        data = {"serial": 3, "id": "agent", "config": {"instructions": "line 1\nline 2 → ok"}}
+        stream = io.StringIO()
+        dump_yaml(data, stream)
+
+        loaded = load_yaml(stream.getvalue())
+        assert loaded == data
+        assert list(loaded) == ["serial", "id", "config"]
+
+    def test_matches_pure_python_loader(self):
+        """load_yaml should produce the same data as yaml.safe_load."""
+        text = 'id: "a"\ntags: [x, y]\nmodel:\n  temperature: 0.7\n'
+        assert load_yaml(text) == yaml.safe_load(text)
+
+    def test_empty_document_returns_none(self):
+        """An empty document should load as None."""
+        assert load_yaml("") is None
+
+    def test_invalid_syntax_raises_yaml_error(self):
+        """Syntax errors should surface as yaml.YAMLError."""
+        with pytest.raises(yaml.YAMLError):
+            load_yaml("invalid: yaml: content: [")
+
+    def test_refuses_arbitrary_python_objects(self):
+        """The codec must stay a safe loader."""
+        with pytest.raises(yaml.YAMLError):
+            load_yaml("!!python/object/apply:os.system ['true']")
@@ -0,0 +1,122 @@
+"""Unit tests for the fake Lyzr API server."""
+
+import json
+import time
+
+import httpx
+import pytest
+from websockets.sync.client import connect
+
+from lyzr_kit.schemas.agent import Agent, ModelConfig
+from lyzr_kit.testing import FakeLyzrServer, FakeServerConfig
+from lyzr_kit.testing.fake_server import _tokens
+from lyzr_kit.utils.auth import AuthError, validate_auth
+from lyzr_kit.utils.platform import PlatformClient, PlatformError
+from lyzr_kit.utils.transport import ENV_MAX_RETRIES
+
+
+def _agent() -> Agent:
+    model = ModelConfig(provider="openai", name="gpt-4o", credential_id="cred")
+    return Agent(id="fake-agent", name="Fake Agent", category="chat", model=model)
+
+
+def _stream(server: FakeLyzrServer, session_id: str = "session-1") -> list[str]:
+    """POST to the SSE endpoint and return the data of every event."""
+    with httpx.stream(
+        "POST",
+        server.stream_url,
+        json={"agent_id": "a", "session_id": session_id, "message": "hi"},
+        timeout=10,
+    ) as response:
+        assert response.status_code == 200
+        return [line[6:] for line in response.iter_lines() if line.startswith("data: ")]
+
+
+class TestFakeServerPlatform:
+    """Tests for the REST endpoints used by PlatformClient and auth."""
+
+    def test_create_and_update_agent(self):
+        with FakeLyzrServer() as server, PlatformClient(server.auth_config()) as client:
+            created = client.create_agent(_agent())
+            updated = client.update_agent(_agent(), created.agent_id, created.env_id)
+
+            assert created.app_id is not None
+            assert updated.agent_id == created.agent_id
+            assert server.agents[created.agent_id]["name"] == "Fake Agent"
+            assert [(r.method, r.status) for r in server.requests] == [
+                ("POST", 200),
+                ("POST", 201),
+                ("PUT", 200),
+            ]
+
+    def test_update_unknown_agent_fails(self):
+        with (
+            FakeLyzrServer() as server,
+            PlatformClient(server.auth_config()) as client,
+            pytest.raises(PlatformError, match="404"),
+        ):
+            client.update_agent(_agent(), "missing", "env")
+
+    def test_health_check_accepts_configured_key(self):
+        with FakeLyzrServer(FakeServerConfig(api_key="secret")) as server:
+            assert validate_auth(server.auth_config())
+            with pytest.raises(AuthError, match="Invalid API key"):
+                validate_auth(server.auth_config(api_key="wrong"))
+
+    def test_latency_is_added(self):
+        with FakeLyzrServer(FakeServerConfig(latency=0.1)) as server:
+            start = time.perf_counter()
+            httpx.get(f"{server.base_url}/health")
+            assert time.perf_counter() - start >= 0.1
+
+    def test_injected_errors_reach_the_retry_transport(self, monkeypatch):
+        """Injected 429s should be retried, then surface as a PlatformError."""
+        monkeypatch.setenv(ENV_MAX_RETRIES, "2")
+        config = FakeServerConfig(error_rate=1.0, error_status=429, retry_after=0)
+        with FakeLyzrServer(config) as server, PlatformClient(server.auth_config()) as client:
+            with pytest.raises(PlatformError, match="429"):
+                client.create_agent(_agent())
+            assert [r.status for r in server.requests] == [429, 429, 429]
+
+    def test_error_rate_is_reproducible_with_seed(self):
+        def statuses() -> list[int]:
+            config = FakeServerConfig(error_rate=0.5, seed=7)
+            with FakeLyzrServer(config) as server, httpx.Client() as client:
+                return [client.get(f"{server.base_url}/health").status_code for _ in range(20)]
+
+        first = statuses()
+        assert first == statuses()
+        assert {200, 503} == set(first)
+
+
+class TestFakeServerChat:
+    """Tests for the SSE and WebSocket chat endpoints."""
+
+    def test_stream_sends_one_event_per_token(self):
+        with FakeLyzrServer() as server:
+            data = _stream(server)
+
+        assert data[-1] == "[DONE]"
+        assert data[:-1] == _tokens(server.config.response)
+        assert "".join(data[:-1]) == server.config.response
+
+    def test_stream_escapes_newlines(self):
+        with FakeLyzrServer(FakeServerConfig(response="line one\nline two")) as server:
+            data = _stream(server)
+
+        assert "\n" not in "".join(data)
+        assert "".join(data[:-1]).replace("\\n", "\n") == "line one\nline two"
+
+    def test_token_rate_paces_the_stream(self):
+        config = FakeServerConfig(response="one two three four five", token_rate=20)
+        with FakeLyzrServer(config) as server:
+            start = time.perf_counter()
+            _stream(server)
+            assert time.perf_counter() - start >= 4 / 20
+
+    def test_websocket_receives_session_events(self):
+        with FakeLyzrServer() as server, connect(f"{server.websocket_url}/ws/session-1") as ws:
+            _stream(server, session_id="session-1")
+            events = [json.loads(ws.recv(timeout=5))["event_type"] for _ in range(3)]
+
+        assert events == ["agent_process_start", "llm_response", "agent_process_end"]
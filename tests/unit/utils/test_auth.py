@@ -1,18 +1,28 @@
 """Unit tests for auth utility module."""
 
 import os
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from lyzr_kit.utils.auth import (
+    AUTH_CACHE_FILE,
+    ENV_API_BASE_URL,
+    ENV_AUTH_CACHE_TTL,
     ENV_MEMBERSTACK_TOKEN,
+    ENV_STREAM_URL,
     ENV_USER_ID,
     ENV_VAR_NAME,
+    ENV_WEBSOCKET_URL,
+    WEBSOCKET_BASE_URL,
     AuthConfig,
     AuthError,
+    cache_auth,
     get_api_headers,
+    invalidate_auth_cache,
+    is_auth_cached,
     load_auth,
     require_auth,
     validate_auth,
@@ -33,6 +43,19 @@ class TestAuthConfig:
         config = AuthConfig(api_key="test-key", base_url="https://custom.api.com")
         assert config.base_url == "https://custom.api.com"
 
+    def test_auth_config_stream_url_follows_base_url(self):
+        """The stream endpoint should default to the inference path under base_url."""
+        config = AuthConfig(api_key="test-key", base_url="http://localhost:8765")
+        assert config.stream_url == "http://localhost:8765/v3/inference/stream/"
+        assert config.websocket_url == WEBSOCKET_BASE_URL
+
+    def test_auth_config_explicit_endpoints(self):
+        config = AuthConfig(
+            api_key="test-key", stream_url="https://edge/stream/", websocket_url="ws://edge"
+        )
+        assert config.stream_url == "https://edge/stream/"
+        assert config.websocket_url == "ws://edge"
+
 
 class TestLoadAuth:
     """Tests for load_auth function."""
@@ -91,6 +114,36 @@ class TestLoadAuth:
         config = load_auth()
         assert config.api_key == "my-test-key"
         assert config.base_url == "https://agent-prod.studio.lyzr.ai"
+        assert config.stream_url == "https://agent-prod.studio.lyzr.ai/v3/inference/stream/"
+        assert config.websocket_url == WEBSOCKET_BASE_URL
+
+    def test_load_auth_endpoint_overrides(self, monkeypatch):
+        """Endpoint URLs in .env should override the production defaults."""
+        # load_dotenv writes to os.environ - setenv first so teardown unsets them
+        for name in (ENV_API_BASE_URL, ENV_STREAM_URL, ENV_WEBSOCKET_URL):
+            monkeypatch.setenv(name, "")
+        env_file = Path.cwd() / ".env"
+        env_file.write_text(
+            "LYZR_API_KEY=my-test-key\n"
+            f"{ENV_API_BASE_URL}=http://localhost:8765/\n"
+            f"{ENV_WEBSOCKET_URL}=ws://localhost:8766\n"
+        )
+
+        config = load_auth()
+        assert config.base_url == "http://localhost:8765"
+        assert config.stream_url == "http://localhost:8765/v3/inference/stream/"
+        assert config.websocket_url == "ws://localhost:8766"
+
+    def test_load_auth_stream_url_from_environment(self, monkeypatch):
+        """A stream endpoint set in the environment should be used as is."""
+        for name in (ENV_API_BASE_URL, ENV_WEBSOCKET_URL):
+            monkeypatch.setenv(name, "")
+        monkeypatch.setenv(ENV_STREAM_URL, "https://edge.example.com/stream/")
+        (Path.cwd() / ".env").write_text("LYZR_API_KEY=my-test-key\n")
+
+        config = load_auth()
+        assert config.base_url == "https://agent-prod.studio.lyzr.ai"
+        assert config.stream_url == "https://edge.example.com/stream/"
 
 
 class TestValidateAuth:
@@ -111,6 +164,17 @@ class TestValidateAuth:
         call_kwargs = mock_get.call_args[1]
         assert call_kwargs["headers"]["x-api-key"] == "valid-key"
 
+    def test_validate_auth_uses_shared_client(self):
+        """validate_auth should send the health check through a given client."""
+        client = MagicMock()
+        client.get.return_value.status_code = 200
+
+        with patch("lyzr_kit.utils.auth.httpx.get") as mock_get:
+            assert validate_auth(AuthConfig(api_key="valid-key"), client=client) is True
+
+        client.get.assert_called_once()
+        mock_get.assert_not_called()
+
     @patch("lyzr_kit.utils.auth.httpx.get")
     def test_validate_auth_invalid_key(self, mock_get):
         """validate_auth should raise AuthError for 401."""
@@ -188,6 +252,126 @@ class TestRequireAuth:
         mock_validate.assert_called_once()
 
 
+class TestAuthCache:
+    """Tests for the cached health check used by require_auth."""
+
+    @staticmethod
+    def _response(status_code: int) -> MagicMock:
+        response = MagicMock()
+        response.status_code = status_code
+        return response
+
+    @patch("lyzr_kit.utils.auth.httpx.get")
+    def test_cached_success_skips_health_check(self, mock_get):
+        """A second cached validation should not call /health."""
+        mock_get.return_value = self._response(200)
+        config = AuthConfig(api_key="valid-key")
+
+        assert validate_auth(config, use_cache=True) is True
+        assert validate_auth(config, use_cache=True) is True
+        mock_get.assert_called_once()
+
+    @patch("lyzr_kit.utils.auth.httpx.get")
+    def test_cache_does_not_store_api_key(self, mock_get):
+        """The cache file should hold a hash, never the key itself."""
+        mock_get.return_value = self._response(200)
+        validate_auth(AuthConfig(api_key="secret-key-123"), use_cache=True)
+
+        assert AUTH_CACHE_FILE.exists()
+        assert "secret-key-123" not in AUTH_CACHE_FILE.read_text()
+
+    @patch("lyzr_kit.utils.auth.httpx.get")
+    def test_uncached_validation_always_probes(self, mock_get):
+        """validate_auth without use_cache should ignore the cache."""
+        mock_get.return_value = self._response(200)
+        config = AuthConfig(api_key="valid-key")
+        cache_auth(config)
+
+        validate_auth(config)
+        mock_get.assert_called_once()
+
+    def test_cache_is_keyed_by_api_key(self):
+        """A cached key should not validate a different key."""
+        cache_auth(AuthConfig(api_key="key-a"))
+
+        assert is_auth_cached(AuthConfig(api_key="key-a"))
+        assert not is_auth_cached(AuthConfig(api_key="key-b"))
+        assert not is_auth_cached(AuthConfig(api_key="key-a", base_url="https://other"))
+
+    def test_cache_expires_after_ttl(self, monkeypatch):
+        """Entries should stop counting once the TTL has passed."""
+        monkeypatch.setenv(ENV_AUTH_CACHE_TTL, "60")
+        config = AuthConfig(api_key="valid-key")
+        cache_auth(config)
+
+        now = time.time()
+        monkeypatch.setattr("lyzr_kit.utils.auth.time.time", lambda: now + 61)
+        assert not is_auth_cached(config)
+
+    @patch("lyzr_kit.utils.auth.httpx.get")
+    def test_zero_ttl_disables_cache(self, mock_get, monkeypatch):
+        """LK_AUTH_CACHE_TTL=0 should probe /health every time."""
+        monkeypatch.setenv(ENV_AUTH_CACHE_TTL, "0")
+        mock_get.return_value = self._response(200)
+        config = AuthConfig(api_key="valid-key")
+
+        validate_auth(config, use_cache=True)
+        validate_auth(config, use_cache=True)
+        assert mock_get.call_count == 2
+        assert not AUTH_CACHE_FILE.exists()
+
+    def test_corrupt_cache_is_ignored(self):
+        """An unreadable cache file should behave like an empty one."""
+        AUTH_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        AUTH_CACHE_FILE.write_text("not json")
+        config = AuthConfig(api_key="valid-key")
+
+        assert not is_auth_cached(config)
+        cache_auth(config)
+        assert is_auth_cached(config)
+
+    @pytest.mark.parametrize("status_code", [401, 403])
+    @patch("lyzr_kit.utils.auth.httpx.get")
+    def test_rejected_key_invalidates_cache(self, mock_get, status_code):
+        """A 401/403 from /health should drop the cached success."""
+        mock_get.return_value = self._response(status_code)
+        config = AuthConfig(api_key="revoked-key")
+        cache_auth(config)
+
+        with pytest.raises(AuthError):
+            validate_auth(config)
+        assert not is_auth_cached(config)
+
+    def test_invalidate_leaves_other_keys(self):
+        """Invalidating one key should keep the others cached."""
+        cache_auth(AuthConfig(api_key="key-a"))
+        cache_auth(AuthConfig(api_key="key-b"))
+
+        invalidate_auth_cache(AuthConfig(api_key="key-a"))
+        assert not is_auth_cached(AuthConfig(api_key="key-a"))
+        assert is_auth_cached(AuthConfig(api_key="key-b"))
+
+    @patch("lyzr_kit.utils.platform.httpx.AsyncClient.request")
+    def test_platform_rejection_invalidates_cache(self, mock_post):
+        """A 401 from the platform API should drop the cached success."""
+        from lyzr_kit.schemas.agent import Agent, ModelConfig
+        from lyzr_kit.utils.platform import PlatformClient
+
+        mock_post.return_value = self._response(401)
+        config = AuthConfig(api_key="revoked-key")
+        cache_auth(config)
+
+        agent = Agent(
+            id="test-agent",
+            name="Test",
+            category="chat",
+            model=ModelConfig(provider="openai", name="gpt-4", credential_id="cred"),
+        )
+        with pytest.raises(Exception, match="401"):
+            PlatformClient(config).create_agent(agent)
+        assert not is_auth_cached(config)
+
+
 class TestGetApiHeaders:
     """Tests for get_api_headers function."""
 
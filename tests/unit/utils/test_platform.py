@@ -1,16 +1,22 @@
 """Unit tests for platform client utilities."""
 
+import asyncio
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 
-from lyzr_kit.utils.auth import AuthConfig
+from lyzr_kit.utils.auth import AuthConfig, validate_auth
 from lyzr_kit.utils.platform import (
     AgentResponse,
+    AsyncPlatformClient,
     PlatformClient,
     PlatformError,
+    PlatformSession,
+    create_http_client,
     get_provider_for_model,
 )
+from lyzr_kit.utils.transport import RetryTransport, TransportMetrics
 
 
 class TestGetProviderForModel:
@@ -86,35 +92,32 @@ class TestPlatformClientInit:
     def test_platform_client_init(self):
         """PlatformClient should initialize with auth config."""
         auth = AuthConfig(api_key="test-key")
-        client = PlatformClient(auth)
-
-        assert client.auth == auth
-        assert client._headers["x-api-key"] == "test-key"
-        assert client._headers["Content-Type"] == "application/json"
+        with PlatformClient(auth) as client:
+            assert client.auth == auth
+            assert client._headers["x-api-key"] == "test-key"
+            assert client._headers["Content-Type"] == "application/json"
 
     def test_marketplace_app_without_token(self):
         """_create_marketplace_app returns None when no memberstack token."""
         auth = AuthConfig(api_key="test-key", user_id="user-123")  # No token
-        client = PlatformClient(auth)
-
-        result = client._create_marketplace_app("agent-123", "Test", "Description")
+        with PlatformClient(auth) as client:
+            result = client._create_marketplace_app("agent-123", "Test", "Description")
 
-        assert result is None
+            assert result is None
 
     def test_marketplace_app_without_user_id(self):
         """_create_marketplace_app returns None when no user_id."""
         auth = AuthConfig(api_key="test-key", memberstack_token="token-123")  # No user_id
-        client = PlatformClient(auth)
-
-        result = client._create_marketplace_app("agent-123", "Test", "Description")
+        with PlatformClient(auth) as client:
+            result = client._create_marketplace_app("agent-123", "Test", "Description")
 
-        assert result is None
+            assert result is None
 
 
 class TestPlatformClientCreateAgent:
     """Tests for PlatformClient.create_agent method."""
 
-    @patch("lyzr_kit.utils.platform.httpx.post")
+    @patch("lyzr_kit.utils.platform.httpx.AsyncClient.request")
     def test_create_agent_error_status(self, mock_post):
         """create_agent should raise PlatformError on non-200/201 status."""
         mock_response = MagicMock()
@@ -123,26 +126,25 @@ class TestPlatformClientCreateAgent:
         mock_post.return_value = mock_response
 
         auth = AuthConfig(api_key="test-key")
-        client = PlatformClient(auth)
-
-        # Create a minimal mock agent
-        mock_agent = MagicMock()
-        mock_agent.name = "Test Agent"
-        mock_agent.description = "Test"
-        mock_agent.config.instructions = "Test instructions"
-        mock_agent.config.role = None
-        mock_agent.config.goal = None
-        mock_agent.model.name = "gpt-4o"
-        mock_agent.model.temperature = 0.7
-        mock_agent.model.top_p = 0.9
-
-        with pytest.raises(PlatformError) as exc_info:
-            client.create_agent(mock_agent)
-
-        assert "Failed to create agent" in str(exc_info.value)
-        assert "400" in str(exc_info.value)
-
-    @patch("lyzr_kit.utils.platform.httpx.post")
+        with PlatformClient(auth) as client:
+            # Create a minimal mock agent
+            mock_agent = MagicMock()
+            mock_agent.name = "Test Agent"
+            mock_agent.description = "Test"
+            mock_agent.config.instructions = "Test instructions"
+            mock_agent.config.role = None
+            mock_agent.config.goal = None
+            mock_agent.model.name = "gpt-4o"
+            mock_agent.model.temperature = 0.7
+            mock_agent.model.top_p = 0.9
+
+            with pytest.raises(PlatformError) as exc_info:
+                client.create_agent(mock_agent)
+
+            assert "Failed to create agent" in str(exc_info.value)
+            assert "400" in str(exc_info.value)
+
+    @patch("lyzr_kit.utils.platform.httpx.AsyncClient.request")
     def test_create_agent_no_agent_id_in_response(self, mock_post):
         """create_agent should raise PlatformError if no agent_id in response."""
         mock_response = MagicMock()
@@ -151,28 +153,27 @@ class TestPlatformClientCreateAgent:
         mock_post.return_value = mock_response
 
         auth = AuthConfig(api_key="test-key")
-        client = PlatformClient(auth)
+        with PlatformClient(auth) as client:
+            mock_agent = MagicMock()
+            mock_agent.name = "Test Agent"
+            mock_agent.description = "Test"
+            mock_agent.config.instructions = "Test instructions"
+            mock_agent.config.role = None
+            mock_agent.config.goal = None
+            mock_agent.model.name = "gpt-4o"
+            mock_agent.model.temperature = 0.7
+            mock_agent.model.top_p = 0.9
 
-        mock_agent = MagicMock()
-        mock_agent.name = "Test Agent"
-        mock_agent.description = "Test"
-        mock_agent.config.instructions = "Test instructions"
-        mock_agent.config.role = None
-        mock_agent.config.goal = None
-        mock_agent.model.name = "gpt-4o"
-        mock_agent.model.temperature = 0.7
-        mock_agent.model.top_p = 0.9
+            with pytest.raises(PlatformError) as exc_info:
+                client.create_agent(mock_agent)
 
-        with pytest.raises(PlatformError) as exc_info:
-            client.create_agent(mock_agent)
-
-        assert "No agent_id in response" in str(exc_info.value)
+            assert "No agent_id in response" in str(exc_info.value)
 
 
 class TestPlatformClientUpdateAgent:
     """Tests for PlatformClient.update_agent method."""
 
-    @patch("lyzr_kit.utils.platform.httpx.put")
+    @patch("lyzr_kit.utils.platform.httpx.AsyncClient.request")
     def test_update_agent_error_status(self, mock_put):
         """update_agent should raise PlatformError on non-200/201 status."""
         mock_response = MagicMock()
@@ -181,29 +182,28 @@ class TestPlatformClientUpdateAgent:
         mock_put.return_value = mock_response
 
         auth = AuthConfig(api_key="test-key")
-        client = PlatformClient(auth)
-
-        mock_agent = MagicMock()
-        mock_agent.name = "Test Agent"
-        mock_agent.description = "Test"
-        mock_agent.config.instructions = "Test instructions"
-        mock_agent.config.role = None
-        mock_agent.config.goal = None
-        mock_agent.model.name = "gpt-4o"
-        mock_agent.model.temperature = 0.7
-        mock_agent.model.top_p = 0.9
+        with PlatformClient(auth) as client:
+            mock_agent = MagicMock()
+            mock_agent.name = "Test Agent"
+            mock_agent.description = "Test"
+            mock_agent.config.instructions = "Test instructions"
+            mock_agent.config.role = None
+            mock_agent.config.goal = None
+            mock_agent.model.name = "gpt-4o"
+            mock_agent.model.temperature = 0.7
+            mock_agent.model.top_p = 0.9
 
-        with pytest.raises(PlatformError) as exc_info:
-            client.update_agent(mock_agent, "agent-123", "env-456")
+            with pytest.raises(PlatformError) as exc_info:
+                client.update_agent(mock_agent, "agent-123", "env-456")
 
-        assert "Failed to update agent" in str(exc_info.value)
-        assert "404" in str(exc_info.value)
+            assert "Failed to update agent" in str(exc_info.value)
+            assert "404" in str(exc_info.value)
 
 
 class TestPlatformClientMarketplace:
     """Tests for PlatformClient._create_marketplace_app method."""
 
-    @patch("lyzr_kit.utils.platform.httpx.post")
+    @patch("lyzr_kit.utils.platform.httpx.AsyncClient.request")
     def test_marketplace_app_success(self, mock_post):
         """_create_marketplace_app should return app_id on success."""
         mock_response = MagicMock()
@@ -216,13 +216,12 @@ class TestPlatformClientMarketplace:
             user_id="user-456",
             memberstack_token="token-789",
         )
-        client = PlatformClient(auth)
-
-        result = client._create_marketplace_app("agent-123", "Test App", "Description")
+        with PlatformClient(auth) as client:
+            result = client._create_marketplace_app("agent-123", "Test App", "Description")
 
-        assert result == "app-123"
+            assert result == "app-123"
 
-    @patch("lyzr_kit.utils.platform.httpx.post")
+    @patch("lyzr_kit.utils.platform.httpx.AsyncClient.request")
     def test_marketplace_app_returns_none_on_error_status(self, mock_post):
         """_create_marketplace_app should return None on non-200/201 status."""
         mock_response = MagicMock()
@@ -234,13 +233,12 @@ class TestPlatformClientMarketplace:
             user_id="user-456",
             memberstack_token="token-789",
         )
-        client = PlatformClient(auth)
+        with PlatformClient(auth) as client:
+            result = client._create_marketplace_app("agent-123", "Test App", "Description")
 
-        result = client._create_marketplace_app("agent-123", "Test App", "Description")
+            assert result is None
 
-        assert result is None
-
-    @patch("lyzr_kit.utils.platform.httpx.post")
+    @patch("lyzr_kit.utils.platform.httpx.AsyncClient.request")
     def test_marketplace_app_returns_none_on_exception(self, mock_post):
         """_create_marketplace_app should return None on exception."""
         mock_post.side_effect = Exception("Network error")
@@ -250,13 +248,12 @@ class TestPlatformClientMarketplace:
             user_id="user-456",
             memberstack_token="token-789",
         )
-        client = PlatformClient(auth)
-
-        result = client._create_marketplace_app("agent-123", "Test App", "Description")
+        with PlatformClient(auth) as client:
+            result = client._create_marketplace_app("agent-123", "Test App", "Description")
 
-        assert result is None
+            assert result is None
 
-    @patch("lyzr_kit.utils.platform.httpx.post")
+    @patch("lyzr_kit.utils.platform.httpx.AsyncClient.request")
     def test_marketplace_app_returns_none_when_no_id_in_response(self, mock_post):
         """_create_marketplace_app should return None if no id in response."""
         mock_response = MagicMock()
@@ -269,8 +266,156 @@ class TestPlatformClientMarketplace:
             user_id="user-456",
             memberstack_token="token-789",
         )
-        client = PlatformClient(auth)
+        with PlatformClient(auth) as client:
+            result = client._create_marketplace_app("agent-123", "Test App", "Description")
+
+            assert result is None
+
+
+def _mock_agent(name: str = "Test Agent") -> MagicMock:
+    agent = MagicMock()
+    agent.name = name
+    agent.description = "Test"
+    agent.config.instructions = "Test instructions"
+    agent.config.role = None
+    agent.config.goal = None
+    agent.model.name = "gpt-4o"
+    agent.model.temperature = 0.7
+    agent.model.top_p = 0.9
+    return agent
+
+
+class TestPlatformClientConnectionPool:
+    """Tests for PlatformClient's pooled session."""
+
+    def test_requests_share_one_client(self):
+        """Every call should go through the session's client."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"agent_id": f"agent-{len(requests)}"})
+
+        with PlatformSession(httpx.AsyncClient(transport=httpx.MockTransport(handler))) as session:
+            client = PlatformClient(AuthConfig(api_key="test-key"), session=session)
+            client.create_agent(_mock_agent())
+            client.update_agent(_mock_agent(), "agent-1", "env-1")
+
+            assert client.async_client.client is session.client
+
+        assert [r.method for r in requests] == ["POST", "PUT"]
+        assert all(r.headers["x-api-key"] == "test-key" for r in requests)
+
+    def test_health_check_uses_session(self):
+        """validate_auth should accept a session and send /health through it."""
+        paths: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            paths.append(request.url.path)
+            return httpx.Response(200)
+
+        with PlatformSession(httpx.AsyncClient(transport=httpx.MockTransport(handler))) as session:
+            assert validate_auth(AuthConfig(api_key="test-key"), client=session) is True
+
+        assert paths == ["/health"]
+
+    def test_shared_session_is_not_closed(self):
+        """Closing the PlatformClient should leave a caller-owned session open."""
+        with PlatformSession() as session:
+            with PlatformClient(AuthConfig(api_key="test-key"), session=session):
+                pass
+            assert not session.is_closed
+
+    def test_owned_session_is_created_once_and_closed(self):
+        """Without a shared session, one is started lazily and closed on exit."""
+        with PlatformClient(AuthConfig(api_key="test-key")) as client:
+            session = client.session
+            assert client.session is session
+
+        assert session.is_closed
+
+    def test_http2_requires_h2(self, monkeypatch):
+        """HTTP/2 should only be enabled when the h2 package is available."""
+        mock_transport_class = MagicMock()
+        monkeypatch.setattr("lyzr_kit.utils.platform.HAS_H2", False)
+        monkeypatch.setattr(
+            "lyzr_kit.utils.platform.httpx.AsyncHTTPTransport", mock_transport_class
+        )
+
+        create_http_client(http2=True)
+
+        assert mock_transport_class.call_args.kwargs["http2"] is False
+
+    def test_client_retries_through_transport(self):
+        """Clients from create_http_client should send through a RetryTransport."""
+        metrics = TransportMetrics()
+        client = create_http_client(metrics=metrics)
+
+        assert isinstance(client._transport, RetryTransport)
+        assert client._transport.metrics is metrics
+        asyncio.run(client.aclose())
+
+
+class TestAsyncPlatformClient:
+    """Tests for AsyncPlatformClient."""
+
+    def test_concurrency_is_bounded(self):
+        """No more than max_concurrency requests should be in flight."""
+        in_flight = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={"agent_id": "agent-1"})
+
+        async def create_all() -> list[AgentResponse]:
+            http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncPlatformClient(
+                AuthConfig(api_key="test-key"), client=http, max_concurrency=2
+            ) as client:
+                results = await asyncio.gather(
+                    *(client.create_agent(_mock_agent(f"Agent {i}")) for i in range(6))
+                )
+            await http.aclose()
+            return results
+
+        results = asyncio.run(create_all())
+
+        assert len(results) == 6
+        assert peak == 2
+
+    def test_timeout_applies_per_call(self):
+        """Each request should carry the client's timeout."""
+        timeouts: list[dict[str, float]] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            timeouts.append(request.extensions["timeout"])
+            return httpx.Response(200, json={"agent_id": "agent-1"})
+
+        async def create() -> None:
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+                client = AsyncPlatformClient(AuthConfig(api_key="k"), client=http, timeout=5.0)
+                await client.create_agent(_mock_agent())
+
+        asyncio.run(create())
+
+        assert timeouts[0]["read"] == 5.0
+
+    def test_errors_match_sync_client(self):
+        """The async client should raise the same PlatformError as the sync one."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(400, text="Bad Request")
 
-        result = client._create_marketplace_app("agent-123", "Test App", "Description")
+        async def create() -> None:
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+                await AsyncPlatformClient(AuthConfig(api_key="k"), client=http).create_agent(
+                    _mock_agent()
+                )
 
-        assert result is None
+        with pytest.raises(PlatformError, match="400"):
+            asyncio.run(create())
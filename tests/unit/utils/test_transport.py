@@ -0,0 +1,270 @@
+"""Unit tests for the retrying, rate-limited HTTP transport."""
+
+import asyncio
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from lyzr_kit.utils.auth import AuthConfig
+from lyzr_kit.utils.platform import PlatformClient, PlatformSession
+from lyzr_kit.utils.transport import (
+    ENV_MAX_RETRIES,
+    ENV_RATE_LIMIT,
+    RetryTransport,
+    TokenBucket,
+    TransportMetrics,
+    backoff_delay,
+    get_max_retries,
+    get_rate_limit,
+    parse_retry_after,
+)
+
+
+class FakeClock:
+    """Monotonic clock that only advances when something sleeps on it."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _transport(responses, clock: FakeClock, max_retries: int = 3) -> RetryTransport:
+    """Build a RetryTransport over a MockTransport replaying responses in order."""
+    queue = list(responses)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        item = queue.pop(0)
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    return RetryTransport(
+        httpx.MockTransport(handler),
+        max_retries=max_retries,
+        rate_limiter=TokenBucket(0, clock=clock, sleep=clock.sleep),
+        sleep=clock.sleep,
+    )
+
+
+def _send(transport: RetryTransport, method: str = "POST") -> httpx.Response:
+    async def send() -> httpx.Response:
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await client.request(method, "https://api.example.com/v3/agents", json={})
+
+    return asyncio.run(send())
+
+
+class TestParseRetryAfter:
+    """Tests for parse_retry_after."""
+
+    def test_delay_seconds(self):
+        assert parse_retry_after("3") == 3.0
+
+    def test_http_date(self):
+        retry_at = datetime(2030, 1, 1, 0, 0, 10, tzinfo=timezone.utc)
+        now = retry_at.timestamp() - 10
+        assert parse_retry_after(format_datetime(retry_at, usegmt=True), now=now) == 10.0
+
+    @pytest.mark.parametrize("value", [None, "", "soon"])
+    def test_missing_or_invalid(self, value):
+        assert parse_retry_after(value) is None
+
+    def test_past_dates_mean_no_wait(self):
+        assert parse_retry_after("Wed, 01 Jan 2020 00:00:00 GMT") == 0.0
+
+
+class TestBackoffDelay:
+    """Tests for backoff_delay."""
+
+    def test_grows_exponentially_up_to_cap(self):
+        delays = [backoff_delay(n, base=0.5, cap=3.0, rng=lambda: 1.0) for n in range(5)]
+        assert delays == [0.5, 1.0, 2.0, 3.0, 3.0]
+
+    def test_full_jitter(self):
+        assert backoff_delay(3, base=0.5, rng=lambda: 0.25) == 1.0
+
+
+class TestEnvironment:
+    """Tests for the tuning environment variables."""
+
+    def test_defaults(self, monkeypatch):
+        monkeypatch.delenv(ENV_RATE_LIMIT, raising=False)
+        monkeypatch.delenv(ENV_MAX_RETRIES, raising=False)
+        assert get_rate_limit() > 0
+        assert get_max_retries() > 0
+
+    def test_overrides(self, monkeypatch):
+        monkeypatch.setenv(ENV_RATE_LIMIT, "0")
+        monkeypatch.setenv(ENV_MAX_RETRIES, "1")
+        assert get_rate_limit() == 0
+        assert get_max_retries() == 1
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_burst_then_steady_rate(self):
+        """A full bucket should allow a burst, then one request per 1/rate seconds."""
+        clock = FakeClock()
+        bucket = TokenBucket(2.0, capacity=2, clock=clock, sleep=clock.sleep)
+
+        async def take(n: int) -> None:
+            for _ in range(n):
+                await bucket.acquire()
+
+        asyncio.run(take(4))
+        assert clock.now == pytest.approx(1.0)
+
+    def test_pause_holds_all_callers(self):
+        """pause() should delay the next token for everyone."""
+        clock = FakeClock()
+        bucket = TokenBucket(0, clock=clock, sleep=clock.sleep)
+        bucket.pause(5.0)
+
+        waited = asyncio.run(bucket.acquire())
+        assert waited == pytest.approx(5.0)
+
+    def test_concurrent_callers_share_the_rate(self):
+        """Concurrent acquires should be spaced out by the shared rate."""
+        clock = FakeClock()
+        bucket = TokenBucket(10.0, capacity=1, clock=clock, sleep=clock.sleep)
+
+        async def take_all() -> None:
+            await asyncio.gather(*(bucket.acquire() for _ in range(5)))
+
+        asyncio.run(take_all())
+        assert clock.now == pytest.approx(0.4)
+
+
+class TestRetryTransport:
+    """Tests for RetryTransport."""
+
+    def test_429_is_retried_after_retry_after(self):
+        """Throttled requests should wait for Retry-After, even for POST."""
+        clock = FakeClock()
+        transport = _transport(
+            [httpx.Response(429, headers={"Retry-After": "2"}), httpx.Response(201)], clock
+        )
+
+        response = _send(transport, "POST")
+
+        assert response.status_code == 201
+        assert clock.sleeps[0] == 2.0
+        assert [m.status for m in transport.metrics.attempts] == [429, 201]
+
+    def test_5xx_is_retried_for_idempotent_methods(self):
+        """A transient 503 on PUT should be retried with backoff."""
+        clock = FakeClock()
+        transport = _transport([httpx.Response(503), httpx.Response(200)], clock)
+
+        assert _send(transport, "PUT").status_code == 200
+        assert len(transport.metrics.attempts) == 2
+
+    def test_5xx_is_not_retried_for_post(self):
+        """POST may have been processed, so a 5xx should be returned as is."""
+        clock = FakeClock()
+        transport = _transport([httpx.Response(503), httpx.Response(201)], clock)
+
+        assert _send(transport, "POST").status_code == 503
+        assert clock.sleeps == []
+
+    def test_connect_errors_are_retried_for_any_method(self):
+        """A request that never reached the server is safe to resend."""
+        clock = FakeClock()
+        transport = _transport([httpx.ConnectError("refused"), httpx.Response(201)], clock)
+
+        assert _send(transport, "POST").status_code == 201
+        assert transport.metrics.attempts[0].error == "ConnectError"
+
+    def test_read_timeouts_are_not_retried_for_post(self):
+        """A POST that timed out after sending may have been processed."""
+        clock = FakeClock()
+        transport = _transport([httpx.ReadTimeout("slow"), httpx.Response(201)], clock)
+
+        with pytest.raises(httpx.ReadTimeout):
+            _send(transport, "POST")
+
+    def test_gives_up_after_max_retries(self):
+        """The last response should be returned once retries run out."""
+        clock = FakeClock()
+        transport = _transport([httpx.Response(429)] * 3, clock, max_retries=2)
+
+        assert _send(transport).status_code == 429
+        assert len(clock.sleeps) == 2
+
+    def test_long_retry_after_is_not_waited_for(self):
+        """A Retry-After beyond RETRY_AFTER_MAX should fail fast."""
+        clock = FakeClock()
+        transport = _transport([httpx.Response(429, headers={"Retry-After": "3600"})], clock)
+
+        assert _send(transport).status_code == 429
+        assert clock.sleeps == []
+
+    def test_429_pauses_the_shared_limiter(self):
+        """Other requests should also wait out a Retry-After."""
+        clock = FakeClock()
+        transport = _transport(
+            [httpx.Response(429, headers={"Retry-After": "4"}), httpx.Response(200)], clock
+        )
+
+        _send(transport)
+        assert transport.rate_limiter._paused_until == pytest.approx(4.0)
+
+
+class TestTransportMetrics:
+    """Tests for TransportMetrics."""
+
+    def test_summary_counts_retries_and_throttling(self):
+        clock = FakeClock()
+        transport = _transport(
+            [httpx.Response(429, headers={"Retry-After": "1"}), httpx.Response(200)], clock
+        )
+        _send(transport)
+
+        summary = transport.metrics.summary()
+        assert "1 requests, 2 attempts (1 retries, 1 throttled)" in summary
+        assert "p95" in summary
+
+    def test_empty_summary(self):
+        assert TransportMetrics().summary() == "no requests"
+
+
+class TestPlatformClientRetries:
+    """Tests for PlatformClient over a RetryTransport."""
+
+    def test_throttled_create_succeeds(self):
+        """A 429 during create_agent should be retried instead of failing the clone."""
+        clock = FakeClock()
+        transport = _transport(
+            [
+                httpx.Response(429, headers={"Retry-After": "1"}),
+                httpx.Response(200, json={"agent_id": "agent-123"}),
+            ],
+            clock,
+        )
+        agent = MagicMock()
+        agent.name = "Test Agent"
+        agent.description = "Test"
+        agent.config.instructions = "Test instructions"
+        agent.config.role = None
+        agent.config.goal = None
+        agent.model.name = "gpt-4o"
+        agent.model.temperature = 0.7
+        agent.model.top_p = 0.9
+
+        with PlatformSession(httpx.AsyncClient(transport=transport)) as session:
+            client = PlatformClient(AuthConfig(api_key="test-key"), session=session)
+            response = client.create_agent(agent)
+
+        assert response.agent_id == "agent-123"
+        assert len(transport.metrics.attempts) == 2